@@ -1,8 +1,13 @@
+from typing import Callable, Iterator
+
 from application.ports.i_repository import IRepository
+from domain.parameter_schema import ParameterSchema
+from domain.reference_matching import ReferenceMatching
 from domain.simulation import Simulation
 from domain.test import Test
 from domain.test_criteria import TestCriteria
 from domain.test_reference import TestReference
+from domain.test_result import TestResult
 from infrastructure.io.json_fetcher import JsonFetcher
 
 
@@ -11,22 +16,36 @@ class App:
     def __init__(self, repository: IRepository):
         self.repository : IRepository      = repository
 
+    def close(self) -> None:
+        """Close the repository; also done when leaving a `with` block."""
+        self.repository.close()
+
+    def __enter__(self) -> "App":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def new_test(self, test_name: str, description: str = "", simulation_script:str = ""):
         new_test = Test(test_name, description, simulation_script)
         self.repository.save_test(new_test)
 
     def edit_test(self, current_test_name, new_test_name: str, description: str = "", simulation_script:str = ""):
-        selected_test = self.get_test_by_name(current_test_name)
-        self.repository.remove_test(selected_test)
+        with self.repository.transaction():
+            selected_test = self.get_test_by_name(current_test_name)
+            selected_test.reference  # load it before its stored copy goes away with the old entry
+            self.repository.remove_test(selected_test)
 
-        selected_test.name = new_test_name
-        selected_test.description = description
-        selected_test.simulation = Simulation(new_test_name, simulation_script, description)
-        self.repository.save_test(selected_test)
+            selected_test.name = new_test_name
+            selected_test.description = description
+            mode = selected_test.simulation.mode if selected_test.simulation else "process"
+            selected_test.simulation = Simulation(new_test_name, simulation_script, description, mode)
+            self.repository.save_test(selected_test)
 
     def delete_test(self, test_name):
-        selected_test = self.get_test_by_name(test_name)
-        self.repository.remove_test(selected_test)
+        with self.repository.transaction():
+            selected_test = self.get_test_by_name(test_name)
+            self.repository.remove_test(selected_test)
 
     def get_tests_list(self):
         return self.repository.get_all_tests()
@@ -34,40 +53,123 @@ class App:
     def get_test_by_name(self, test_name: str):
         return self.repository.get_test_by_name(test_name)
 
-    def run_test(self, test_name: str, number_of_repetitions: int) -> Test:
+    def list_test_names(self) -> list[str]:
+        return self.repository.list_test_names()
+
+    def get_test_summary(self, test_name: str):
+        """Configuration of a test without its reference points."""
+        return self.repository.get_test_summary(test_name)
+
+    def run_test(self, test_name: str, number_of_repetitions: int, jobs: int = 1,
+                 on_result: Callable[[Test, TestResult], None] | None = None,
+                 confidence: float | None = None) -> Test:
         selected_test = self.repository.get_test_by_name(test_name)
-        selected_test.execute(number_of_repetitions)
+        for result in selected_test.iter_execute(number_of_repetitions, jobs, confidence):
+            if on_result is not None:
+                on_result(selected_test, result)
         return selected_test
 
-    def set_simulation(self, test_name, simulation_script: str):
+    def run_test_stream(self, test_name: str, number_of_repetitions: int, jobs: int = 1,
+                        confidence: float | None = None) -> Iterator[tuple[Test, TestResult]]:
+        """Yield (test, result) for every repetition as soon as it is evaluated; test.stats stays current."""
         selected_test = self.repository.get_test_by_name(test_name)
-        selected_test.simulation = Simulation(test_name, simulation_script, selected_test.description)
-        self.repository.update_test(selected_test)
+        for result in selected_test.iter_execute(number_of_repetitions, jobs, confidence):
+            yield selected_test, result
+
+    def set_simulation(self, test_name, simulation_script: str, mode: str = "process"):
+        with self.repository.transaction():
+            selected_test = self.repository.get_test_by_name(test_name)
+            selected_test.simulation = Simulation(test_name, simulation_script, selected_test.description, mode)
+            self.repository.update_test(selected_test)
 
     def set_reference_source(self, test_name, reference_source: str):
-        selected_test = self.repository.get_test_by_name(test_name)
-        selected_test.reference_source = reference_source
-        self.repository.update_test(selected_test)
+        with self.repository.transaction():
+            selected_test = self.repository.get_test_by_name(test_name)
+            selected_test.reference_source = reference_source
+            self.repository.update_test(selected_test)
 
     def update_reference(self, test_name: str, data_points: int | None = None):
-        selected_test = self.repository.get_test_by_name(test_name)
-        fetcher = JsonFetcher(max_depth=4)
-        reference = fetcher.fetch_as(selected_test.reference_source, lambda d: TestReference(**d))
-        selected_test.reference = reference[0:data_points] if (data_points is not None and len(reference) >= data_points) else reference
-        self.repository.update_test(selected_test)
+        # fetched before the transaction, so a slow source doesn't hold the storage lock
+        reference = self._fetch_reference(self.repository.get_test_by_name(test_name).reference_source, data_points)
+        with self.repository.transaction():
+            self._replace_reference(test_name, reference)
+
+    def update_test_config(self, test_name: str, reference_source: str | None = None,
+                           reference_data_points: int | None = None, criteria: dict[str, str] | None = None):
+        """
+        Apply several configuration changes in one repository transaction, i.e. a single write.
+        Arguments left as None are not changed; `reference_data_points` refetches the reference,
+        before the transaction is opened.
+        """
+        reference = None
+        if reference_data_points is not None:
+            source = reference_source
+            if source is None:
+                source = self.repository.get_test_by_name(test_name).reference_source
+            reference = self._fetch_reference(source, reference_data_points)
+
+        with self.repository.transaction():
+            if reference_source is not None:
+                self.set_reference_source(test_name, reference_source)
+            if reference is not None:
+                self._replace_reference(test_name, reference)
+            for criterion_name, criterion_value in (criteria or {}).items():
+                self.set_criterion(test_name, criterion_name, criterion_value)
+
+    def set_reference_matching(self, test_name: str, key_parameters: list[str] | None = None,
+                               wildcard: str | None = None,
+                               parameter_tolerance: float | None = None, result_tolerance: float | None = None):
+        """
+        Match references on `key_parameters` only (all if None), with `wildcard` values (if any) matching anything.
+        With tolerances, numeric parameters match the nearest reference point and numeric results compare approximately.
+        """
+        with self.repository.transaction():
+            selected_test = self.repository.get_test_by_name(test_name)
+            selected_test.reference_matching = ReferenceMatching(
+                key_parameters, wildcard, parameter_tolerance, result_tolerance
+            )
+            self.repository.update_test(selected_test)
+
+    def set_parameter_type(self, test_name: str, parameter_name: str, type_name: str | None):
+        """Declare the type of a parameter (or of the result, as "result"); None removes it."""
+        with self.repository.transaction():
+            selected_test = self.repository.get_test_by_name(test_name)
+            schema = selected_test.parameter_schema or ParameterSchema()
+            schema.set_type(parameter_name, type_name)
+            selected_test.parameter_schema = schema if schema else None
+            self.repository.update_test(selected_test)
 
     def set_criterion(self, test_name: str, criterion_name: str, criterion_value: str):
-        selected_test = self.repository.get_test_by_name(test_name)
-        if selected_test.criteria is None:
-            selected_test.criteria = TestCriteria()
-
-        # ensure only valid attributes can be set
-        if hasattr(selected_test.criteria, criterion_name):
-            # cast criterion_value to float or None if appropriate
-            value = float(criterion_value) if criterion_value is not None else None
-            setattr(selected_test.criteria, criterion_name, value)
-        else:
-            raise AttributeError(f"Invalid criterion name: {criterion_name}")
+        with self.repository.transaction():
+            selected_test = self.repository.get_test_by_name(test_name)
+            if selected_test.criteria is None:
+                selected_test.criteria = TestCriteria()
+
+            # ensure only valid attributes can be set
+            if criterion_name == TestCriteria.EXPRESSION:
+                # kept as text, but compiled right away so a bad expression is rejected here
+                selected_test.criteria.expression = criterion_value or None
+                selected_test.criteria.compiled_expression()
+            elif TestCriteria.parse_percentile(criterion_name) is not None:
+                value = float(criterion_value) if criterion_value not in (None, "") else None
+                selected_test.criteria.set_percentile(criterion_name, value)
+            elif criterion_name in TestCriteria.FIELDS:
+                # cast criterion_value to float or None if appropriate
+                value = float(criterion_value) if criterion_value is not None else None
+                setattr(selected_test.criteria, criterion_name, value)
+            else:
+                raise AttributeError(f"Invalid criterion name: {criterion_name}")
+
+            self.repository.update_test(selected_test)
+
+    @staticmethod
+    def _fetch_reference(source: str, data_points: int | None = None) -> list[TestReference]:
+        """Reference points read from `source`, the first `data_points` of them if given."""
+        fetcher = JsonFetcher(max_depth=4)
+        reference = fetcher.fetch_as(source, lambda d: TestReference(**d))
+        return reference[0:data_points] if (data_points is not None and len(reference) >= data_points) else reference
 
+    def _replace_reference(self, test_name: str, reference: list[TestReference]):
+        selected_test = self.repository.get_test_by_name(test_name)
+        selected_test.reference = reference
         self.repository.update_test(selected_test)
-
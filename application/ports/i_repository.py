@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from contextlib import nullcontext
+from typing import ContextManager, Optional, List
 from domain.test import Test
+from domain.test_summary import TestSummary
 from interface.GUI.gui_config import GUIConfig
 
 
@@ -19,6 +21,15 @@ class IRepository(ABC):
     def get_all_tests(self) -> List[Test]:
         """Retrieve all tests, rebuilding Simulation, TestCriteria, and TestReference list if present."""
 
+    def list_test_names(self) -> List[str]:
+        """Names of all tests, without loading them."""
+        return [test.name for test in self.get_all_tests()]
+
+    def get_test_summary(self, name: str) -> Optional[TestSummary]:
+        """Configuration of a test without its reference points, or None if not found."""
+        test = self.get_test_by_name(name)
+        return TestSummary.from_test(test) if test else None
+
     @abstractmethod
     def update_test(self, test: "Test") -> None:
         pass
@@ -27,6 +38,23 @@ class IRepository(ABC):
     def remove_test(self, test: "Test") -> None:
         pass
 
+    def transaction(self) -> ContextManager:
+        """
+        Group several writes: they are applied in memory and flushed once, atomically,
+        when the block exits without error (and discarded otherwise).
+        Repositories without batching apply each write immediately.
+        """
+        return nullcontext(self)
+
+    def close(self) -> None:
+        """Release what the repository holds open (e.g. a database connection); a no-op for files."""
+
+    def __enter__(self) -> "IRepository":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def save_gui_config(self, config: "GUIConfig") -> None:
         """Save GUI configuration to file."""
 
@@ -0,0 +1,80 @@
+from statistics import NormalDist
+from typing import Literal
+
+from domain.test_statistics import TestStats
+
+
+class ComplianceStopRule:
+    """
+    Sequential stopping rule for the compliance verdict of a test.
+
+    The verdict is only looked at after a geometric sequence of sample sizes
+    (min_runs, min_runs * growth, min_runs * growth², ...). At the k-th look (k = 0, 1, ...)
+    a Wilson score interval is computed around the observed compliance rate with the
+    error rate α / ((k + 1)(k + 2)), where α = 1 - confidence. These shares sum to α,
+    so the chance that any look settles on the wrong verdict stays within α however long
+    the test runs (a Bonferroni bound over all looks). Testing the plain 1 - α interval
+    after every result would let that chance grow with every look instead.
+    Once the whole interval lies on one side of the required rate, the remaining
+    repetitions can be skipped.
+    """
+
+    def __init__(self, required_rate: float, confidence: float = 0.95, min_runs: int = 10, growth: float = 2.0):
+        """
+        :param required_rate: Compliance rate the test must reach (criteria.compliance_rate).
+        :param confidence: Two-sided confidence level over all looks together, in (0, 1).
+        :param min_runs: Sample size of the first look; never decide before it.
+        :param growth: Ratio between the sample sizes of consecutive looks, > 1.
+        """
+        if not 0 < confidence < 1:
+            raise ValueError("Confidence must be between 0 and 1 (exclusive)")
+        if growth <= 1:
+            raise ValueError("Growth must be greater than 1")
+        self.required_rate = required_rate
+        self.confidence = confidence
+        self.min_runs = max(1, min_runs)
+        self.growth = growth
+        self._z = NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+        self._looks: list[int] = [self.min_runs]
+
+    def look_index(self, total: int) -> int | None:
+        """Index of the look taken after `total` results, or None if the verdict isn't looked at then."""
+        while self._looks[-1] < total:
+            self._looks.append(max(self._looks[-1] + 1, round(self.min_runs * self.growth ** len(self._looks))))
+        return self._looks.index(total) if total in self._looks else None
+
+    def look_z(self, look: int) -> float:
+        """Two-sided critical value of look `look`, at its share of the error rate."""
+        alpha = (1 - self.confidence) / ((look + 1) * (look + 2))
+        return NormalDist().inv_cdf(1 - alpha / 2)
+
+    def interval(self, successes: int, total: int, z: float | None = None) -> tuple[float, float]:
+        """Wilson score interval for a success proportion (at the configured confidence by default)."""
+        if total == 0:
+            return 0.0, 1.0
+        z = self._z if z is None else z
+        z2 = z * z
+        rate = successes / total
+        center = (rate + z2 / (2 * total)) / (1 + z2 / total)
+        margin = (z / (1 + z2 / total)) * ((rate * (1 - rate) / total + z2 / (4 * total * total)) ** 0.5)
+        return max(0.0, center - margin), min(1.0, center + margin)
+
+    def decide(self, stats: TestStats) -> Literal["passed", "failed"] | None:
+        """Return the verdict once it is settled at the configured confidence, else None."""
+        if stats.total < self.min_runs:
+            return None
+        look = self.look_index(stats.total)
+        if look is None:
+            return None
+        lower, upper = self.interval(stats.effective_and_efficient, stats.total, self.look_z(look))
+        if lower >= self.required_rate:
+            return "passed"
+        if upper < self.required_rate:
+            return "failed"
+        return None
+
+    def __repr__(self) -> str:
+        return (
+            f"ComplianceStopRule(required_rate={self.required_rate}, "
+            f"confidence={self.confidence}, min_runs={self.min_runs}, growth={self.growth})"
+        )
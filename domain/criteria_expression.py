@@ -0,0 +1,294 @@
+import ast
+import math
+import operator
+from functools import reduce
+from typing import Any, Callable
+
+from domain.simulation_statistics import SimulationStats
+
+try:
+    import numpy as np
+except ImportError:  # optional: only needed to evaluate whole columns at once
+    np = None
+
+
+# env key of the vectorized evaluation collecting the rows whose arithmetic failed
+# (not a valid identifier, so it can't clash with a variable of the expression)
+_ERRORS = "#errors"
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan  # missing or not a number
+
+
+def _to_int(value: Any) -> float | int:
+    number = _to_float(value)
+    return int(number) if math.isfinite(number) else number
+
+
+def _to_str(value: Any) -> str | None:
+    return None if value is None else str(value)
+
+
+class _EncodedColumn:
+    """A dictionary-encoded column: distinct values plus one code per row (-1: absent)."""
+
+    def __init__(self, codes, values: list[Any]):
+        self.codes = codes
+        # code -1 picks the trailing None
+        self.values = [*values, None]
+
+    def map(self, function: Callable[[Any], Any]) -> "_EncodedColumn":
+        """Apply a function to each distinct value once."""
+        return _EncodedColumn(self.codes, [function(value) for value in self.values[:-1]])
+
+    def dense(self) -> "np.ndarray":
+        present = [value for value in self.values if value is not None]
+        if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in present):
+            table = np.array([math.nan if value is None else value for value in self.values], dtype=float)
+        else:
+            table = np.empty(len(self.values), dtype=object)
+            table[:] = self.values
+        return table[np.asarray(self.codes, dtype=np.intp)]
+
+
+class CriteriaExpression:
+    """
+    A performance budget written as a boolean expression over the stats, the result and
+    the (typed) parameters of a run, e.g.
+
+        duration < 0.2 * float(x) and max_memory < 150
+
+    The source is parsed once and checked against a whitelist: arithmetic, comparisons,
+    and / or / not, constants and the functions float, int, str, abs, min and max. It is
+    then compiled into a closure tree evaluating a single run and, on first use and only
+    with NumPy installed, into one evaluating whole ResultSet columns at once; nothing
+    goes through eval(). Missing parameters read as None, and float() / int() turn them
+    into NaN, which fails any comparison. A run whose evaluation fails (e.g. a division
+    by zero) does not satisfy the expression, in both forms.
+    """
+
+    FUNCTIONS: dict[str, Callable[[Any], Any]] = {
+        "float": _to_float,
+        "int": _to_int,
+        "str": _to_str,
+        "abs": abs,
+        "min": min,
+        "max": max,
+    }
+    BINARY = {
+        ast.Add: operator.add,
+        ast.Sub: operator.sub,
+        ast.Mult: operator.mul,
+        ast.Div: operator.truediv,
+        ast.FloorDiv: operator.floordiv,
+        ast.Mod: operator.mod,
+        ast.Pow: operator.pow,
+    }
+    COMPARE = {
+        ast.Lt: operator.lt,
+        ast.LtE: operator.le,
+        ast.Gt: operator.gt,
+        ast.GtE: operator.ge,
+        ast.Eq: operator.eq,
+        ast.NotEq: operator.ne,
+    }
+    UNARY = {ast.USub: operator.neg, ast.UAdd: operator.pos}
+
+    def __init__(self, source: str):
+        self.source = source.strip()
+        try:
+            tree = ast.parse(self.source, mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid criteria expression '{source}': {e.msg}") from e
+        self.names: set[str] = set()
+        self._tree = tree.body
+        self._scalar = self._compile(tree.body, vectorized=False)
+        self._vector: Callable[[dict], Any] | None = None  # compiled by evaluate_columns()
+
+    # ---------------- public API ----------------
+
+    def evaluate(self, stats: SimulationStats, parameters: dict[str, Any], result: Any = None) -> bool:
+        """Evaluate the expression for a single run."""
+        env = {}
+        for name in self.names:
+            if name in SimulationStats.STAT_NAMES:
+                env[name] = stats.get_value_by_name(name)
+            elif name == "result":
+                env[name] = result
+            else:
+                env[name] = parameters.get(name)
+        try:
+            return bool(self._scalar(env))
+        except (TypeError, ValueError, ArithmeticError):
+            return False  # e.g. a missing parameter compared without float(), or a division by zero
+
+    def evaluate_columns(self, results: "ResultSet") -> "np.ndarray":
+        """Evaluate the expression for every stored result at once; needs NumPy."""
+        if np is None:
+            raise RuntimeError("Vectorized evaluation requires NumPy")
+        if self._vector is None:
+            self._vector = self._compile(self._tree, vectorized=True)
+        env: dict[str, Any] = {_ERRORS: False}
+        for name in self.names:
+            if name in SimulationStats.STAT_NAMES:
+                env[name] = results.stat_vector(name)
+            elif name == "result" or name in results.parameter_names():
+                env[name] = _EncodedColumn(*results.encoded_column(name))
+            else:
+                env[name] = _EncodedColumn([-1] * len(results), [])
+        try:
+            with np.errstate(all="ignore"):
+                outcome = self._dense(self._vector(env))
+                outcome = np.logical_and(outcome, np.logical_not(env[_ERRORS]))
+        except (TypeError, ValueError, ArithmeticError):
+            # mixed types NumPy can't compare at once (e.g. strings against numbers)
+            return np.array([
+                self.evaluate(row.simulation.stats, row.simulation.parameters, row.simulation.result)
+                for row in results
+            ], dtype=bool)
+        return np.broadcast_to(np.asarray(outcome, dtype=bool), (len(results),))
+
+    def __repr__(self) -> str:
+        return f"CriteriaExpression({self.source!r})"
+
+    # ---------------- compilation ----------------
+
+    def _compile(self, node: ast.AST, vectorized: bool) -> Callable[[dict], Any]:
+        dense = self._dense if vectorized else (lambda value: value)
+
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, str, bool)):
+            value = node.value
+            return lambda env: value
+
+        if isinstance(node, ast.Name):
+            if node.id in self.FUNCTIONS:
+                raise ValueError(f"'{node.id}' can only be called")
+            name = node.id
+            self.names.add(name)
+            return lambda env: env[name]
+
+        if isinstance(node, ast.BinOp) and type(node.op) in self.BINARY:
+            op = self.BINARY[type(node.op)]
+            left, right = self._compile(node.left, vectorized), self._compile(node.right, vectorized)
+            if vectorized:
+                return self._vector_binary(node.op, op, left, right)
+            return lambda env: op(left(env), right(env))
+
+        if isinstance(node, ast.UnaryOp) and type(node.op) in self.UNARY:
+            op = self.UNARY[type(node.op)]
+            operand = self._compile(node.operand, vectorized)
+            return lambda env: op(dense(operand(env)))
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            operand = self._compile(node.operand, vectorized)
+            if vectorized:
+                return lambda env: np.logical_not(dense(operand(env)))
+            return lambda env: not operand(env)
+
+        if isinstance(node, ast.BoolOp):
+            operands = [self._compile(value, vectorized) for value in node.values]
+            if vectorized:
+                return self._vector_bool(isinstance(node.op, ast.And), operands)
+            if isinstance(node.op, ast.And):
+                return lambda env: all(operand(env) for operand in operands)
+            return lambda env: any(operand(env) for operand in operands)
+
+        if isinstance(node, ast.Compare) and all(type(op) in self.COMPARE for op in node.ops):
+            operands = [self._compile(value, vectorized) for value in (node.left, *node.comparators)]
+            ops = [self.COMPARE[type(op)] for op in node.ops]
+
+            def compare(env):
+                values = [dense(operand(env)) for operand in operands]
+                checks = [op(a, b) for op, a, b in zip(ops, values, values[1:])]
+                if vectorized:
+                    return reduce(np.logical_and, checks)
+                return all(checks)
+
+            return compare
+
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in self.FUNCTIONS
+            and not node.keywords
+            and node.args
+        ):
+            function = self.FUNCTIONS[node.func.id]
+            args = [self._compile(arg, vectorized) for arg in node.args]
+            if not vectorized:
+                return lambda env: function(*(arg(env) for arg in args))
+            return self._vector_call(node.func.id, function, args)
+
+        raise ValueError(f"Unsupported element in criteria expression: {ast.unparse(node)!r}")
+
+    def _vector_binary(self, node_op: ast.operator, op: Callable, left: Callable, right: Callable) -> Callable[[dict], Any]:
+        """A vectorized arithmetic operator flagging the rows where its scalar form would raise."""
+
+        def apply(env):
+            a, b = self._dense(left(env)), self._dense(right(env))
+            if not isinstance(a, np.ndarray) and not isinstance(b, np.ndarray):
+                try:
+                    return op(a, b)
+                except (ValueError, ArithmeticError):
+                    env[_ERRORS] = True
+                    return math.nan
+            value = op(a, b)
+            if isinstance(node_op, (ast.Div, ast.FloorDiv, ast.Mod)):
+                env[_ERRORS] = np.logical_or(env[_ERRORS], np.equal(b, 0))
+            elif isinstance(node_op, ast.Pow):
+                overflow = np.isinf(value) & np.isfinite(a) & np.isfinite(b)
+                env[_ERRORS] = np.logical_or(env[_ERRORS], overflow)
+            return value
+
+        return apply
+
+    def _vector_bool(self, conjunction: bool, operands: list[Callable]) -> Callable[[dict], Any]:
+        """
+        Vectorized and / or. Like the short-circuiting scalar form, failures of an operand
+        only count for the rows the operands before it left undecided.
+        """
+
+        def apply(env):
+            errors, decided, outcome = env[_ERRORS], False, None
+            for operand in operands:
+                env[_ERRORS] = False
+                value = np.asarray(self._dense(operand(env)), dtype=bool)
+                errors = np.logical_or(errors, np.logical_and(env[_ERRORS], np.logical_not(decided)))
+                if outcome is None:
+                    outcome = value
+                else:
+                    outcome = np.logical_and(outcome, value) if conjunction else np.logical_or(outcome, value)
+                decided = np.logical_or(decided, np.logical_not(value) if conjunction else value)
+            env[_ERRORS] = errors
+            return outcome
+
+        return apply
+
+    def _vector_call(self, name: str, function: Callable, args: list[Callable]) -> Callable[[dict], Any]:
+        if name in ("float", "int", "str"):
+            arg = args[0]
+
+            def convert(env):
+                value = arg(env)
+                if isinstance(value, _EncodedColumn):
+                    return value.map(function)  # once per distinct value
+                if isinstance(value, np.ndarray) and name != "str" and value.dtype != object:
+                    value = value.astype(float)
+                    return value if name == "float" else np.trunc(value)
+                if isinstance(value, np.ndarray):
+                    return np.vectorize(function, otypes=[object if name == "str" else float])(value)
+                return function(value)
+
+            return convert
+        if name == "abs":
+            return lambda env: np.abs(self._dense(args[0](env)))
+        pairwise = np.minimum if name == "min" else np.maximum
+        return lambda env: reduce(pairwise, [self._dense(arg(env)) for arg in args])
+
+    @staticmethod
+    def _dense(value: Any) -> Any:
+        return value.dense() if isinstance(value, _EncodedColumn) else value
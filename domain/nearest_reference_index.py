@@ -0,0 +1,90 @@
+import math
+from itertools import product
+from typing import Any, Hashable
+
+from domain.reference_index import MISSING, ReferenceIndex
+from domain.reference_matching import ReferenceMatching
+from domain.test_reference import TestReference
+
+
+class NearestReferenceIndex(ReferenceIndex):
+    """
+    Reference index for continuous parameters. A result matches the nearest reference
+    point (euclidean distance) whose numeric parameters all lie within
+    `matching.parameter_tolerance` of its own, the non-numeric compared parameters
+    being equal. Among equally near points the first one wins.
+
+    Points are bucketed in a uniform grid whose cells are as wide as the tolerance, so a
+    lookup only visits the 3^d cells around the result, d being the number of numeric
+    parameters.
+    """
+
+    def __init__(self, reference: list[TestReference], matching: ReferenceMatching):
+        self.matching = matching
+        self._reference = reference
+        self._tolerance = matching.parameter_tolerance
+
+        names = matching.key_parameters or sorted({name for ref in reference for name in ref.parameters})
+        self._compared = set(names)
+        # parameters numeric in every entry go in the grid, the others must be equal
+        self._numeric = [
+            name for name in names
+            if all(self._number(ref.parameters.get(name, MISSING)) is not None for ref in reference)
+        ]
+        self._exact = [name for name in names if name not in self._numeric]
+        self._offsets = list(product((-1, 0, 1), repeat=len(self._numeric)))
+
+        self._cells: dict[tuple[Hashable, tuple[int, ...]], list[tuple[tuple[float, ...], int]]] = {}
+        for position, ref in enumerate(reference):
+            point = tuple(self._number(ref.parameters[name]) for name in self._numeric)
+            key = (self._exact_key(ref.parameters), self._cell(point))
+            self._cells.setdefault(key, []).append((point, position))
+
+    def find(self, parameters: dict[str, Any] | None) -> TestReference | None:
+        """Return the nearest reference entry within tolerance, if any."""
+        parameters = parameters or {}
+        if self.matching.key_parameters is None and not parameters.keys() <= self._compared:
+            return None
+
+        point = tuple(self._number(parameters.get(name, MISSING)) for name in self._numeric)
+        if None in point:
+            return None
+        exact_key = self._exact_key(parameters)
+        cell = self._cell(point)
+
+        best: tuple[float, int] | None = None
+        for offset in self._offsets:
+            neighbour = tuple(c + o for c, o in zip(cell, offset))
+            for candidate, position in self._cells.get((exact_key, neighbour), ()):
+                if any(abs(a - b) > self._tolerance for a, b in zip(point, candidate)):
+                    continue
+                distance = sum((a - b) ** 2 for a, b in zip(point, candidate))
+                if best is None or (distance, position) < best:
+                    best = (distance, position)
+        return self._reference[best[1]] if best else None
+
+    def __repr__(self) -> str:
+        return (
+            f"NearestReferenceIndex(entries={len(self._reference)}, numeric={self._numeric}, "
+            f"cells={len(self._cells)}, matching={self.matching})"
+        )
+
+    # ---------------- internal helpers ----------------
+
+    def _cell(self, point: tuple[float, ...]) -> tuple[int, ...]:
+        return tuple(math.floor(value / self._tolerance) for value in point)
+
+    def _exact_key(self, parameters: dict[str, Any]) -> Hashable:
+        return tuple(self.freeze(parameters.get(name, MISSING)) for name in self._exact)
+
+    @staticmethod
+    def _number(value: Any) -> float | None:
+        if value is MISSING or isinstance(value, bool):
+            return None
+        if isinstance(value, (int, float)):
+            return value if math.isfinite(value) else None  # typed by a ParameterSchema
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return None
+        return number if math.isfinite(number) else None
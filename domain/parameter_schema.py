@@ -0,0 +1,96 @@
+import copy
+from typing import Any, Callable
+
+
+def _parse_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ("true", "1", "yes", "on"):
+        return True
+    if text in ("false", "0", "no", "off"):
+        return False
+    raise ValueError(f"not a boolean: {value!r}")
+
+
+class ParameterSchema:
+    """
+    Optional per-test declaration of parameter types (and of the result type, under the
+    name "result"). Simulations and references deliver every value as a string; the
+    schema converts copies of them once when they enter a run, so indexes, evaluation
+    and the GUI work with typed values instead of parsing the same strings again and
+    again, while stored values stay as delivered. Parameters not in the schema stay as
+    they are.
+    """
+
+    RESULT = "result"
+    TYPES: dict[str, Callable[[Any], Any]] = {
+        "int": int,
+        "float": float,
+        "str": str,
+        "bool": _parse_bool,
+    }
+
+    def __init__(self, types: dict[str, str] | None = None):
+        """
+        :param types: Type name ("int", "float", "str" or "bool") by parameter name.
+        """
+        self.types: dict[str, str] = {}
+        for name, type_name in (types or {}).items():
+            self.set_type(name, type_name)
+
+    def __bool__(self) -> bool:
+        return bool(self.types)
+
+    def set_type(self, name: str, type_name: str | None) -> None:
+        """Declare the type of a parameter; None removes the declaration."""
+        if type_name is None:
+            self.types.pop(name, None)
+            return
+        if type_name not in self.TYPES:
+            raise ValueError(f"Unknown parameter type '{type_name}'. Valid options: {', '.join(self.TYPES)}")
+        self.types[name] = type_name
+
+    def coerce(self, name: str, value: Any) -> Any:
+        """Convert one value to the declared type of `name`."""
+        type_name = self.types.get(name)
+        if type_name is None or value is None:
+            return value
+        try:
+            return self.TYPES[type_name](value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Parameter '{name}' expects {type_name}, got {value!r}") from e
+
+    def apply(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        """Return the parameters with declared ones converted."""
+        return {name: self.coerce(name, value) for name, value in parameters.items()}
+
+    def typed(self, item: Any) -> tuple[Any, list[str]]:
+        """
+        Copy of a SimulationResult or TestReference with its parameters and result
+        converted, and the errors of the values that could not be (kept as delivered).
+        The item itself is left untouched.
+        """
+        errors: list[str] = []
+
+        def convert(name: str, value: Any) -> Any:
+            try:
+                return self.coerce(name, value)
+            except ValueError as e:
+                errors.append(str(e))
+                return value
+
+        typed = copy.copy(item)
+        typed.parameters = {name: convert(name, value) for name, value in item.parameters.items()}
+        typed.result = convert(self.RESULT, item.result)
+        return typed, errors
+
+    def as_dict(self) -> dict[str, str]:
+        return dict(self.types)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ParameterSchema":
+        return cls(data)
+
+    def __repr__(self) -> str:
+        return f"ParameterSchema({self.types})"
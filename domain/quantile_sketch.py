@@ -0,0 +1,115 @@
+import math
+from typing import Iterable
+
+
+class QuantileSketch:
+    """
+    Streaming, mergeable quantile estimate: a merging t-digest.
+
+    Values are summarised by at most about `compression` weighted centroids, kept small
+    near both tails (where percentiles such as p99 are read) and larger in the middle, so
+    memory stays constant however many values are added. Two sketches built separately,
+    e.g. by parallel workers, can be merged into one.
+    """
+
+    # values buffered before they are merged into the centroids, per unit of compression
+    BUFFER_FACTOR = 5
+
+    def __init__(self, compression: float = 100.0):
+        self.compression = compression
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._centroids: list[tuple[float, float]] = []  # (mean, weight), sorted by mean
+        self._buffer: list[float] = []
+
+    def add(self, value: float) -> None:
+        self._buffer.append(value)
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if len(self._buffer) >= self.BUFFER_FACTOR * self.compression:
+            self._compress()
+
+    def extend(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold another sketch into this one; `other` is left unchanged."""
+        if not other.count:
+            return
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress([*other._centroids, *((value, 1.0) for value in other._buffer)])
+
+    def quantile(self, q: float) -> float:
+        """Estimate the value below which a fraction `q` (0..1) of the values fall."""
+        if not self.count:
+            raise ValueError("Quantile of an empty sketch")
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        self._compress()
+        if len(self._centroids) == 1 or q == 0:
+            return self.min if q == 0 else self._centroids[0][0]
+        if q == 1:
+            return self.max
+
+        # each centroid's weight is centred on its mean; interpolate between centres,
+        # and between the outer centres and the exact min / max
+        target = q * self.count
+        cumulative = 0.0
+        previous_center, previous_mean = 0.0, self.min
+        for mean, weight in self._centroids:
+            center = cumulative + weight / 2
+            if target < center:
+                return self._interpolate(target, previous_center, previous_mean, center, mean)
+            previous_center, previous_mean = center, mean
+            cumulative += weight
+        return self._interpolate(target, previous_center, previous_mean, self.count, self.max)
+
+    def __repr__(self) -> str:
+        return f"QuantileSketch(count={self.count}, centroids={len(self._centroids)}, compression={self.compression})"
+
+    # ---------------- internal helpers ----------------
+
+    @staticmethod
+    def _interpolate(target: float, left: float, left_value: float, right: float, right_value: float) -> float:
+        if right <= left:
+            return right_value
+        return left_value + (right_value - left_value) * (target - left) / (right - left)
+
+    def _scale(self, q: float) -> float:
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _scale_inverse(self, k: float) -> float:
+        if k >= self.compression / 4:
+            return 1.0
+        return (math.sin(2 * math.pi * k / self.compression) + 1) / 2
+
+    def _compress(self, extra: list[tuple[float, float]] | None = None) -> None:
+        """Merge buffered values (and `extra` centroids) into the centroid list."""
+        if not self._buffer and not extra:
+            return
+        items = sorted([*self._centroids, *((value, 1.0) for value in self._buffer), *(extra or ())])
+        self._buffer = []
+        total = sum(weight for _, weight in items)
+
+        merged: list[tuple[float, float]] = []
+        mean, weight = items[0]
+        so_far = 0.0
+        q_limit = self._scale_inverse(self._scale(0.0) + 1)
+        for next_mean, next_weight in items[1:]:
+            if (so_far + weight + next_weight) / total <= q_limit:
+                weight += next_weight
+                mean += (next_mean - mean) * next_weight / weight
+            else:
+                merged.append((mean, weight))
+                so_far += weight
+                q_limit = self._scale_inverse(self._scale(so_far / total) + 1)
+                mean, weight = next_mean, next_weight
+        merged.append((mean, weight))
+        self._centroids = merged
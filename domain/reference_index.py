@@ -0,0 +1,107 @@
+from typing import Any, Hashable
+
+from domain.reference_matching import ReferenceMatching
+from domain.test_reference import TestReference
+
+# posting key of entries that lack a parameter
+MISSING = object()
+_NONE: frozenset[int] = frozenset()
+
+
+class ReferenceIndex:
+    """
+    Index over a reference list, finding the entry that matches a result's parameters
+    without scanning the list. When several entries match, the first one wins, as with
+    the scan it replaces.
+
+    Exact matching uses a single hash table keyed by the canonical frozen form of each
+    entry's parameters. Partial-key and wildcard matching (see ReferenceMatching) use an
+    inverted index instead: for every compared parameter, the positions of the entries
+    holding each value, plus those holding the wildcard. A lookup intersects one posting
+    list per parameter, starting from the smallest.
+    """
+
+    def __init__(self, reference: list[TestReference], matching: ReferenceMatching | None = None):
+        self.matching = matching or ReferenceMatching()
+        self._reference = reference
+        self._by_parameters: dict[Hashable, TestReference] | None = None
+        self._postings: dict[tuple[str, Hashable], set[int]] = {}
+        self._wildcards: dict[str, set[int]] = {}
+
+        has_wildcards = any(
+            self.matching.is_wildcard(value) for ref in reference for value in ref.parameters.values()
+        )
+        if self.matching.key_parameters is None and not has_wildcards:
+            self._by_parameters = {}
+            for ref in reference:
+                self._by_parameters.setdefault(self.key(ref.parameters), ref)
+            return
+
+        # without declared key parameters every parameter any entry has is compared
+        self._names = self.matching.key_parameters or sorted(
+            {name for ref in reference for name in ref.parameters}
+        )
+        self._compared = set(self._names)
+        for position, ref in enumerate(reference):
+            for name in self._names:
+                value = ref.parameters.get(name, MISSING)
+                if self.matching.is_wildcard(value):
+                    self._wildcards.setdefault(name, set()).add(position)
+                else:
+                    self._postings.setdefault((name, self.freeze(value)), set()).add(position)
+
+    @classmethod
+    def key(cls, parameters: dict[str, Any] | None) -> Hashable:
+        """
+        Canonical hashable form of a parameter dict: insertion order is irrelevant and
+        nested dicts / lists are frozen recursively. Two dicts get equal keys exactly
+        when they compare equal.
+        """
+        return cls.freeze(parameters or {})
+
+    def find(self, parameters: dict[str, Any] | None) -> TestReference | None:
+        """Return the first reference entry matching these parameters, if any."""
+        parameters = parameters or {}
+        if self._by_parameters is not None:
+            return self._by_parameters.get(self.key(parameters))
+
+        if self.matching.key_parameters is None and not parameters.keys() <= self._compared:
+            return None  # compared exactly, and no entry has this parameter
+
+        candidates = []
+        for name in self._names:
+            posting = self._postings.get((name, self.freeze(parameters.get(name, MISSING))), _NONE)
+            wildcards = self._wildcards.get(name, _NONE)
+            if not posting and not wildcards:
+                return None
+            candidates.append((len(posting) + len(wildcards), posting, wildcards))
+        if not candidates:
+            return self._reference[0] if self._reference else None
+
+        # walk the smallest posting list in place and probe the others, keeping the first match
+        candidates.sort(key=lambda candidate: candidate[0])
+        _, posting, wildcards = candidates[0]
+        others = [(posting, wildcards) for _, posting, wildcards in candidates[1:]]
+        first = None
+        for positions in (posting, wildcards):
+            for position in positions:
+                if (first is None or position < first) and all(
+                    position in other or position in other_wildcards for other, other_wildcards in others
+                ):
+                    first = position
+        return self._reference[first] if first is not None else None
+
+    def __len__(self) -> int:
+        return len(self._reference)
+
+    def __repr__(self) -> str:
+        return f"ReferenceIndex(entries={len(self._reference)}, matching={self.matching})"
+
+    @classmethod
+    def freeze(cls, value: Any) -> Hashable:
+        """Hashable form of a parameter value, freezing nested dicts and lists."""
+        if isinstance(value, dict):
+            return frozenset((k, cls.freeze(v)) for k, v in value.items())
+        if isinstance(value, (list, tuple)):
+            return tuple(cls.freeze(v) for v in value)
+        return value
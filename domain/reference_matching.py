@@ -0,0 +1,88 @@
+from typing import Any
+
+
+class ReferenceMatching:
+    """
+    How simulation results are matched to reference entries.
+
+    By default a result matches an entry whose parameters are exactly equal. With
+    `key_parameters`, only those parameters are compared and anything else the
+    simulation emits (a seed, a timestamp) is ignored. When a `wildcard` is set (e.g.
+    WILDCARD), a reference parameter holding it matches any value of that parameter,
+    including its absence; without one every reference value is compared as it is.
+
+    With a `parameter_tolerance`, numeric parameters are matched to the nearest
+    reference point lying within that distance on every parameter (wildcards are then
+    not supported), and with a `result_tolerance` numeric results pass when they are
+    within that distance of the expected one.
+    """
+
+    # the usual wildcard, used only when asked for
+    WILDCARD = "*"
+
+    def __init__(
+        self,
+        key_parameters: list[str] | None = None,
+        wildcard: str | None = None,
+        parameter_tolerance: float | None = None,
+        result_tolerance: float | None = None,
+    ):
+        """
+        :param key_parameters: Parameter names to compare. None compares all of them.
+        :param wildcard: Reference value matching anything. None (the default) disables wildcards.
+        :param parameter_tolerance: Maximum distance per numeric parameter to the nearest reference point.
+        :param result_tolerance: Maximum distance between a numeric result and the expected one.
+        """
+        for name, tolerance in (("parameter", parameter_tolerance), ("result", result_tolerance)):
+            if tolerance is not None and (tolerance < 0 or (name == "parameter" and tolerance == 0)):
+                raise ValueError(f"The {name} tolerance must be positive")
+        self.key_parameters = list(key_parameters) if key_parameters else None
+        self.wildcard = wildcard
+        self.parameter_tolerance = parameter_tolerance
+        self.result_tolerance = result_tolerance
+
+    @property
+    def is_exact(self) -> bool:
+        return (
+            self.key_parameters is None and self.wildcard is None
+            and self.parameter_tolerance is None and self.result_tolerance is None
+        )
+
+    @property
+    def is_nearest(self) -> bool:
+        return self.parameter_tolerance is not None
+
+    def is_wildcard(self, value: Any) -> bool:
+        return self.wildcard is not None and value == self.wildcard
+
+    def results_match(self, result: Any, expected: Any) -> bool:
+        """Compare a simulation result with a reference result, numerically when a tolerance is set."""
+        if self.result_tolerance is not None:
+            try:
+                return abs(float(result) - float(expected)) <= self.result_tolerance
+            except (TypeError, ValueError):
+                pass  # not numbers: fall back to the exact comparison
+        return str(result) == str(expected)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "key_parameters": self.key_parameters,
+            "wildcard": self.wildcard,
+            "parameter_tolerance": self.parameter_tolerance,
+            "result_tolerance": self.result_tolerance,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ReferenceMatching":
+        return cls(
+            data.get("key_parameters"),
+            data.get("wildcard"),
+            data.get("parameter_tolerance"),
+            data.get("result_tolerance"),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ReferenceMatching(key_parameters={self.key_parameters}, wildcard={self.wildcard!r}, "
+            f"parameter_tolerance={self.parameter_tolerance}, result_tolerance={self.result_tolerance})"
+        )
@@ -0,0 +1,264 @@
+from array import array
+from operator import add
+from typing import Any, Hashable, Iterable, Iterator
+
+from domain.criteria_expression import CriteriaExpression
+from domain.reference_index import ReferenceIndex
+from domain.running_stats import RunningStats
+from domain.simulation_result import SimulationResult
+from domain.simulation_statistics import SimulationStats
+from domain.test_criteria import TestCriteria
+from domain.test_result import TestResult
+from domain.test_statistics import TestStats
+
+try:
+    import numpy as np
+except ImportError:  # optional: batch evaluation falls back to a pure-Python pass
+    np = None
+
+# value code of a parameter a row doesn't have
+ABSENT = -1
+
+
+class ResultSet:
+    """
+    Columnar storage for the evaluated results of a test.
+
+    Instead of keeping a TestResult, SimulationResult, SimulationStats and parameter
+    dict per repetition, every stat is stored in a typed array column, verdicts and
+    statuses as small integer codes, and results and parameter values are
+    dictionary-encoded: each distinct value is stored once and rows keep its code.
+
+    Rows read back by index or iteration are rebuilt as TestResult objects on the fly,
+    so changes to them are not stored. Plots and tables should read whole columns
+    with column() instead.
+    """
+
+    FLOAT_STATS = ("duration", "max_memory", "min_memory", "mean_memory", "peak_memory", "user_time", "system_time")
+    COUNT_STATS = ("voluntary_switches", "involuntary_switches", "major_faults", "minor_faults")
+    EFFICACY = (None, "passed", "failed")
+    EFFICIENCY = (None, "passed", "failed", "timeout", "oom", "invalid")
+    STATUS = ("ok", "timeout", "oom", "invalid")
+    # codes of "passed" / "failed" in both EFFICACY and EFFICIENCY
+    PASSED, FAILED = 1, 2
+
+    def __init__(self, results: list[TestResult] | None = None):
+        self._floats = {name: array("d") for name in self.FLOAT_STATS}
+        self._counts = {name: array("q") for name in self.COUNT_STATS}
+        self._efficacy = array("b")
+        self._efficiency = array("b")
+        self._status = array("b")
+        self._results = array("i")
+        self._parameters: dict[str, array] = {}
+        # dictionary of distinct result / parameter values
+        self._values: list[Any] = []
+        self._value_codes: dict[Hashable, int] = {}
+        for result in results or ():
+            self.append(result)
+
+    # ---------------- sequence protocol ----------------
+
+    def append(self, result: TestResult) -> None:
+        """Store one evaluated result."""
+        sim_result = result.simulation
+        stats = sim_result.stats
+        for name, column in self._floats.items():
+            column.append(getattr(stats, name))
+        for name, column in self._counts.items():
+            column.append(int(getattr(stats, name)))
+        self._efficacy.append(self.EFFICACY.index(result.efficacy))
+        self._efficiency.append(self.EFFICIENCY.index(result.efficiency))
+        self._status.append(self.STATUS.index(sim_result.status))
+        self._results.append(self._encode(sim_result.result))
+
+        row = len(self._results) - 1
+        parameters = sim_result.parameters
+        for name, column in self._parameters.items():
+            column.append(self._encode(parameters[name]) if name in parameters else ABSENT)
+        for name in parameters.keys() - self._parameters.keys():
+            column = array("i", [ABSENT]) * row
+            column.append(self._encode(parameters[name]))
+            self._parameters[name] = column
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __getitem__(self, index: int | slice) -> TestResult | list[TestResult]:
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ResultSet index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[TestResult]:
+        return (self._row(i) for i in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"ResultSet(rows={len(self)}, parameters={sorted(self._parameters)}, distinct_values={len(self._values)})"
+
+    # ---------------- columns ----------------
+
+    def parameter_names(self) -> list[str]:
+        return list(self._parameters)
+
+    def stat_vector(self, name: str) -> "np.ndarray":
+        """
+        NumPy copy of a stat column (cpu_time is computed); needs NumPy. The copy can be
+        kept: a view would make every later append raise BufferError while it lives.
+        """
+        if name == "cpu_time":
+            return self.stat_vector("user_time") + self.stat_vector("system_time")
+        column = self.column(name)
+        return np.frombuffer(column, dtype=column.typecode).copy()
+
+    def encoded_column(self, name: str) -> tuple[array, list[Any]]:
+        """
+        The dictionary-encoded form of "result" or of a parameter column: one code per
+        row (-1 where the row lacks the parameter) and the table of distinct values.
+        """
+        codes = self._results if name == "result" else self._parameters[name]
+        return codes, self._values
+
+    def column(self, name: str) -> Any:
+        """
+        Return a whole column: a stat (as an array, not to be modified), "efficacy",
+        "efficiency", "status", "result", or a parameter (None where a row lacks it).
+        Stats take precedence over parameters of the same name.
+        """
+        normalized = name.strip().lower().replace(" ", "_")
+        if normalized in self._floats:
+            return self._floats[normalized]
+        if normalized in self._counts:
+            return self._counts[normalized]
+        if normalized == "cpu_time":
+            return array("d", map(add, self._floats["user_time"], self._floats["system_time"]))
+        if normalized == "efficacy":
+            return [self.EFFICACY[code] for code in self._efficacy]
+        if normalized == "efficiency":
+            return [self.EFFICIENCY[code] for code in self._efficiency]
+        if normalized == "status":
+            return [self.STATUS[code] for code in self._status]
+        if normalized == "result":
+            return [self._values[code] for code in self._results]
+        if name in self._parameters:
+            return [self._decode(code) for code in self._parameters[name]]
+        raise ValueError(
+            f"Unknown column '{name}'. Valid options: "
+            f"{', '.join((*SimulationStats.STAT_NAMES, 'efficacy', 'efficiency', 'status', 'result', *self._parameters))}"
+        )
+
+    # ---------------- batch evaluation ----------------
+
+    def stats(self, quantile_stats: Iterable[str] = ()) -> TestStats:
+        """
+        Count effective / efficient results in one pass over the verdict codes, and
+        sketch the distribution of `quantile_stats` from their columns.
+        """
+        if np is not None and len(self):
+            effective = np.frombuffer(self._efficacy, dtype=np.int8) == self.PASSED
+            efficient = np.frombuffer(self._efficiency, dtype=np.int8) == self.PASSED
+            counts = (
+                int(np.count_nonzero(effective)),
+                int(np.count_nonzero(efficient)),
+                int(np.count_nonzero(effective & efficient)),
+            )
+        else:
+            effective = efficient = both = 0
+            for efficacy, efficiency in zip(self._efficacy, self._efficiency):
+                effective += efficacy == self.PASSED
+                efficient += efficiency == self.PASSED
+                both += efficacy == self.PASSED and efficiency == self.PASSED
+            counts = (effective, efficient, both)
+
+        stats = TestStats(*counts, len(self), quantile_stats=quantile_stats)
+        for name, sketch in stats.sketches.items():
+            sketch.extend(self.column(name))
+        for name, running in stats.running.items():
+            if np is not None and len(self):
+                values = self.stat_vector(name).astype(float)
+                mean = float(values.mean())
+                stats.running[name] = RunningStats(
+                    len(values), mean, float(((values - mean) ** 2).sum()), float(values.min()), float(values.max())
+                )
+            else:
+                running.extend(self.column(name))
+        return stats
+
+    def rescore(self, criteria: TestCriteria | None) -> TestStats:
+        """
+        Re-evaluate the efficiency of every stored result against `criteria` over whole
+        stat columns (vectorized with NumPy when it is installed) and return the
+        resulting TestStats. Efficacy is kept; runs stopped by their limits keep their
+        "timeout" / "oom" efficiency.
+        """
+        limits = {name: float(limit) for name, limit in (criteria.limits() if criteria else {}).items()}
+        expression = criteria.compiled_expression() if criteria else None
+        stopped_efficiency = [self.EFFICIENCY.index(status) if status != "ok" else 0 for status in self.STATUS]
+
+        if np is not None and len(self):
+            within = np.ones(len(self), dtype=bool)
+            for name, limit in limits.items():
+                within &= self.stat_vector(name) <= limit
+            if expression is not None:
+                within &= expression.evaluate_columns(self)
+            efficiency = np.where(within, self.PASSED, self.FAILED).astype(np.int8)
+            status = np.frombuffer(self._status, dtype=np.int8)
+            stopped = status != 0
+            efficiency[stopped] = np.array(stopped_efficiency, dtype=np.int8)[status[stopped]]
+            self._efficiency = array("b", efficiency.tobytes())
+        else:
+            columns = [(self.column(name), limit) for name, limit in limits.items()]
+            efficiency = array("b")
+            for i, status in enumerate(self._status):
+                if status:
+                    efficiency.append(stopped_efficiency[status])
+                elif all(column[i] <= limit for column, limit in columns) and (
+                    expression is None or self._row_satisfies(expression, i)
+                ):
+                    efficiency.append(self.PASSED)
+                else:
+                    efficiency.append(self.FAILED)
+            self._efficiency = efficiency
+
+        return self.stats(criteria.percentile_stats() if criteria else ())
+
+    # ---------------- internal helpers ----------------
+
+    def _row_satisfies(self, expression: CriteriaExpression, index: int) -> bool:
+        sim_result = self._row(index).simulation
+        return expression.evaluate(sim_result.stats, sim_result.parameters, sim_result.result)
+
+    def _encode(self, value: Any) -> int:
+        # the type is part of the key so that e.g. 1, 1.0 and True stay distinct
+        key = (type(value), ReferenceIndex.freeze(value))
+        code = self._value_codes.get(key)
+        if code is None:
+            code = self._value_codes[key] = len(self._values)
+            self._values.append(value)
+        return code
+
+    def _decode(self, code: int) -> Any:
+        return None if code == ABSENT else self._values[code]
+
+    def _row(self, index: int) -> TestResult:
+        stats = SimulationStats(
+            **{name: column[index] for name, column in self._floats.items()},
+            **{name: column[index] for name, column in self._counts.items()},
+        )
+        parameters = {
+            name: self._values[column[index]]
+            for name, column in self._parameters.items()
+            if column[index] != ABSENT
+        }
+        result = TestResult()
+        result.efficacy = self.EFFICACY[self._efficacy[index]]
+        result.efficiency = self.EFFICIENCY[self._efficiency[index]]
+        result.simulation = SimulationResult(
+            stats=stats,
+            result=self._values[self._results[index]],
+            parameters=parameters,
+            status=self.STATUS[self._status[index]],
+        )
+        return result
@@ -0,0 +1,34 @@
+from domain.test_criteria import TestCriteria
+
+
+class RunLimits:
+    """Hard limits enforced on every simulation run; None means unlimited."""
+
+    def __init__(self, timeout: float | None = None, memory_mb: float | None = None):
+        self.timeout = timeout
+        self.memory_mb = memory_mb
+
+    @classmethod
+    def from_criteria(cls, criteria: TestCriteria | None) -> "RunLimits":
+        """
+        Derive limits from the per-run criteria: `duration * timeout_multiplier` seconds
+        and `max_memory * memory_limit_multiplier` MB, each only when both values are set.
+        """
+        if criteria is None:
+            return cls()
+        return cls(
+            timeout=cls._scaled(criteria.duration, criteria.timeout_multiplier),
+            memory_mb=cls._scaled(criteria.max_memory, criteria.memory_limit_multiplier),
+        )
+
+    @staticmethod
+    def _scaled(value, multiplier) -> float | None:
+        if value in (None, "") or multiplier in (None, ""):
+            return None
+        return float(value) * float(multiplier)
+
+    def __bool__(self) -> bool:
+        return self.timeout is not None or self.memory_mb is not None
+
+    def __repr__(self) -> str:
+        return f"RunLimits(timeout={self.timeout}, memory_mb={self.memory_mb})"
@@ -0,0 +1,72 @@
+import math
+from typing import Iterable
+
+
+class RunningStats:
+    """
+    Online summary of a stream of numbers: count, mean, variance (Welford's algorithm),
+    min and max, in constant memory. Two summaries built separately can be merged
+    exactly (Chan et al.'s parallel update).
+    """
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0,
+                 minimum: float = math.inf, maximum: float = -math.inf):
+        """
+        :param m2: Sum of squared deviations from the mean.
+        """
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        self.min = minimum
+        self.max = maximum
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def extend(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "RunningStats") -> None:
+        """Fold another summary into this one; `other` is left unchanged."""
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float | None:
+        """Sample variance, or None with fewer than two values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else None
+
+    @property
+    def std(self) -> float | None:
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        return {
+            "count": self.count,
+            "mean": self.mean if self.count else None,
+            "std": self.std,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    def __repr__(self) -> str:
+        if not self.count:
+            return "RunningStats(count=0)"
+        std = f"{self.std:.6g}" if self.std is not None else "-"
+        return f"RunningStats(count={self.count}, mean={self.mean:.6g}, std={std}, min={self.min:.6g}, max={self.max:.6g})"
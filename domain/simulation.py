@@ -1,9 +1,12 @@
-import time
-from typing import List
-import psutil
+import asyncio
+from typing import AsyncIterator, Callable, Iterator, List
+from domain.run_limits import RunLimits
 from domain.simulation_result import SimulationResult
-from domain.simulation_statistics import SimulationStats
-from infrastructure.io.json_fetcher import JsonFetcher
+from infrastructure.io.async_simulation_runner import AsyncSimulationRunner
+from infrastructure.io.json_lines_worker_pool import ScriptServerPool
+from infrastructure.io.ordered_stream import iterate_blocking
+from infrastructure.io.warm_worker_pool import WarmWorkerPool
+from infrastructure.sampling.sampling_schedule import SamplingSchedule
 
 
 class Simulation:
@@ -26,80 +29,93 @@ class Simulation:
     # }
     #
     # The program will parse this JSON to create a SimulationResult object.
+    #
+    # Execution modes (`mode`):
+    #   - "process" → every repetition runs the script in a fresh process
+    #   - "warm"    → .py scripts only; repetitions run inside long-lived worker
+    #                 interpreters that keep the script's imports loaded; memory
+    #                 figures are what each run used above the worker's own
+    #   - "server"  → the script is started once and serves one repetition per
+    #                 request line on stdin (JSON-lines protocol, any language):
+    #
+    #       request  (one line on stdin) : {"iteration": 3}
+    #       response (one line on stdout): {"result": "...", "parameters": {...}}
+    #
+    #     The server must flush stdout after every response and exit on EOF.
+    #     Requests may also carry optional "seed" and "parameters" fields (see
+    #     `request_extras` of run_many), and a response may report {"error": "..."}
+    #     instead of a result.
+    #   - "batch"   → every invocation prints many result objects, either as a JSON
+    #                 array or as JSON lines; the script is invoked until enough
+    #                 results are collected
+    #
+    # Any result object may also carry in-band "duration_s" and "memory_mb" keys,
+    # which then replace the figures measured by the harness for that result. In
+    # batch mode, results without them get an equal share of the invocation's time.
+    #
+    # Runs can be bounded by RunLimits (derived from the test criteria): a run past
+    # its timeout is killed with its process group, memory is capped at spawn, and
+    # such runs produce a result with status "timeout" / "oom" instead of output.
     # -----------------------------------------------------------------------------
-    def __init__(self, name: str, script_path: str, description: str = ""):
+    MODES = ("process", "warm", "server", "batch")
+
+    def __init__(self, name: str, script_path: str, description: str = "", mode: str = "process",
+                 sampling: SamplingSchedule | None = None):
+        """
+        :param sampling: When memory is sampled in the "process" and "batch" modes
+                         (the runner's default SamplingSchedule if None).
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Invalid simulation mode '{mode}'. Valid options: {', '.join(self.MODES)}")
         self.name = name
         self.script_path = script_path
         self.description = description
+        self.mode = mode
+        self.sampling = sampling
         self.results: List[SimulationResult] = []
 
     def run(self, iteration: int = 1):
         result: SimulationResult = self._run_script(self.script_path, True)
         self.results.append(result)
 
-    @staticmethod
-    def _run_script(script_path: str, capture_output: bool = True) -> "SimulationResult":
-        fetcher = JsonFetcher()  # can pass max_depth if you wants
-        # Spawn process via fetcher so interpreter selection is centralized
-        proc = fetcher.spawn_process(script_path, capture_output=capture_output)
-        ps_proc = psutil.Process(proc.pid)
+    def run_many(self, times: int, jobs: int = 1, limits: RunLimits | None = None,
+                 request_extras: Callable[[int], dict] | None = None) -> List[SimulationResult]:
+        """
+        Run the simulation `times` times using at most `jobs` concurrent processes.
+        Results are appended in repetition order, regardless of completion order.
 
-        mem_samples = []
-        start = time.perf_counter()
-        try:
-            while True:
-                if proc.poll() is not None:
-                    break
-                try:
-                    mem_info = ps_proc.memory_info()
-                    mem_samples.append(mem_info.rss / (1024 * 1024))  # MB
-                except psutil.NoSuchProcess:
-                    break
-                time.sleep(0.05)
-        finally:
-            stdout, stderr = proc.communicate()
-            duration = time.perf_counter() - start
+        :param request_extras: "server" mode only: returns the extra request fields
+                               ("seed", "parameters") of a repetition index.
+        """
+        return list(self.iter_run(times, jobs, limits, request_extras=request_extras))
 
-        if proc.returncode != 0:
-            raise RuntimeError(f"Script failed with exit code {proc.returncode}:\n{stderr}")
+    def iter_run(self, times: int, jobs: int = 1, limits: RunLimits | None = None,
+                 record: bool = True, request_extras: Callable[[int], dict] | None = None) -> Iterator[SimulationResult]:
+        """
+        Like run_many, but yield each result in repetition order as soon as it is available.
+        With `record=False` results are not appended to `self.results`.
+        """
+        if request_extras is not None and self.mode != "server":
+            raise ValueError(f"Request fields can only be sent in server mode, not in '{self.mode}' mode")
+        for result in iterate_blocking(lambda: self._iter_results(times, jobs, limits, request_extras)):
+            if record:
+                self.results.append(result)
+            yield result
 
-        # compute memory stats
-        if mem_samples:
-            min_mem = min(mem_samples)
-            max_mem = max(mem_samples)
-            mean_mem = sum(mem_samples) / len(mem_samples)
-        else:
-            min_mem = max_mem = mean_mem = 0.0
+    def _iter_results(self, times: int, jobs: int, limits: RunLimits | None,
+                      request_extras: Callable[[int], dict] | None = None) -> AsyncIterator[SimulationResult]:
+        if self.mode == "warm":
+            return WarmWorkerPool(self.script_path, jobs, limits=limits).iter_many(times)
+        if self.mode == "server":
+            return ScriptServerPool(self.script_path, jobs, limits=limits).iter_many(times, request_extras)
+        if self.mode == "batch":
+            # one invocation covers many repetitions, so a per-repetition timeout doesn't apply
+            batch_limits = RunLimits(memory_mb=limits.memory_mb) if limits else None
+            return AsyncSimulationRunner(jobs, self.sampling, limits=batch_limits).iter_batches(self.script_path, times)
+        return AsyncSimulationRunner(jobs, self.sampling, limits=limits).iter_many(self.script_path, times)
 
-        stats = SimulationStats(
-            duration=duration,
-            min_memory=min_mem,
-            max_memory=max_mem,
-            mean_memory=mean_mem,
-        )
-
-        # parse JSON output using JsonFetcher helper
-        result_value = ""
-        parameters: dict[str, str] = {}
-
-        if capture_output and stdout:
-            data = fetcher.parse_json(stdout)
-
-            if not isinstance(data, dict):
-                raise ValueError("JSON output must be an object")
-
-            if "result" in data and "parameters" in data:
-                result_value = str(data["result"]).strip()
-                if not isinstance(data["parameters"], dict):
-                    raise ValueError("'parameters' must be a dictionary")
-                parameters = {str(k): str(v) for k, v in data["parameters"].items()}
-            elif len(data) == 1:
-                key, value = next(iter(data.items()))
-                result_value = str(value).strip()
-                parameters = {str(key).strip(): str(value).strip()}
-            else:
-                raise ValueError(
-                    "JSON output must be either {'result':..., 'parameters': {...}} or a single key-value pair"
-                )
-
-        return SimulationResult(stats=stats, result=result_value, parameters=parameters)
+    @staticmethod
+    def _run_script(script_path: str, capture_output: bool = True) -> "SimulationResult":
+        # a single run is just a one-process batch on its own event loop
+        runner = AsyncSimulationRunner()
+        return asyncio.run(runner.run_one(script_path, capture_output))
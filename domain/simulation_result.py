@@ -1,11 +1,59 @@
+import copy
+from typing import Literal
+
 from domain.simulation_statistics import SimulationStats
 
 
 class SimulationResult:
-    def __init__(self, stats: SimulationStats, result: str, parameters: dict[str, str] | None = None):
+    def __init__(
+        self,
+        stats: SimulationStats,
+        result: str,
+        parameters: dict[str, str] | None = None,
+        status: Literal["ok", "timeout", "oom", "invalid"] = "ok",
+        error: str | None = None,
+    ):
         self.parameters: dict[str, str] = parameters or {}
         self.result = result
         self.stats = stats
+        # "timeout" / "oom" when the run was stopped by its RunLimits,
+        # "invalid" when its output doesn't fit the test's ParameterSchema (see `error`)
+        self.status = status
+        self.error = error
+
+    @classmethod
+    def from_output(cls, data: object, stats: SimulationStats) -> "SimulationResult":
+        """
+        Build a SimulationResult from the parsed JSON object printed by a simulation script.
+        Optional in-band "duration_s" and "memory_mb" keys override the measured stats.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("JSON output must be an object")
+
+        if "duration_s" in data or "memory_mb" in data:
+            data = dict(data)
+            stats = copy.copy(stats)
+            if "duration_s" in data:
+                stats.duration = float(data.pop("duration_s"))
+            if "memory_mb" in data:
+                memory = float(data.pop("memory_mb"))
+                stats.min_memory = stats.max_memory = stats.mean_memory = stats.peak_memory = memory
+
+        if "result" in data and "parameters" in data:
+            result_value = str(data["result"]).strip()
+            if not isinstance(data["parameters"], dict):
+                raise ValueError("'parameters' must be a dictionary")
+            parameters = {str(k): str(v) for k, v in data["parameters"].items()}
+        elif len(data) == 1:
+            key, value = next(iter(data.items()))
+            result_value = str(value).strip()
+            parameters = {str(key).strip(): str(value).strip()}
+        else:
+            raise ValueError(
+                "JSON output must be either {'result':..., 'parameters': {...}} or a single key-value pair"
+            )
+
+        return cls(stats=stats, result=result_value, parameters=parameters)
 
     def add_param(self, key: str, value: str) -> None:
         """Add or update a parameter."""
@@ -19,6 +67,7 @@ class SimulationResult:
         """Return a serializable dict representation of the result."""
         return {
             "result": self.result,
+            "status": self.status,
             "parameters": dict(self.parameters),
             "stats": self.stats.as_dict() if hasattr(self.stats, "as_dict") else repr(self.stats),
         }
@@ -26,6 +75,7 @@ class SimulationResult:
     def __repr__(self) -> str:
         return (
             f"SimulationResult(\n\tresult={self.result!r},"
+            f"\n\tstatus={self.status!r},"
             f"\n\tstats={self.stats.__repr__()}"
             f"\n\tparameters={self.parameters.__repr__()}\n)"
         )
\ No newline at end of file
@@ -1,15 +1,53 @@
+import inspect
+
+
 class SimulationStats:
+    # names accepted by get_value_by_name, in display order
+    STAT_NAMES = (
+        "duration",
+        "max_memory",
+        "mean_memory",
+        "min_memory",
+        "peak_memory",
+        "cpu_time",
+        "user_time",
+        "system_time",
+        "voluntary_switches",
+        "involuntary_switches",
+        "major_faults",
+        "minor_faults",
+    )
+
     def __init__(
         self,
         duration: float = 0.0,
         max_memory: float = 0.0,
         min_memory: float = 0.0,
         mean_memory: float = 0.0,
+        peak_memory: float = 0.0,
+        user_time: float = 0.0,
+        system_time: float = 0.0,
+        voluntary_switches: int = 0,
+        involuntary_switches: int = 0,
+        major_faults: int = 0,
+        minor_faults: int = 0,
     ):
         self.duration = duration
         self.max_memory = max_memory
         self.min_memory = min_memory
         self.mean_memory = mean_memory
+        # --- exact figures reported by the kernel when the process is reaped ---
+        self.peak_memory = peak_memory
+        self.user_time = user_time
+        self.system_time = system_time
+        self.voluntary_switches = voluntary_switches
+        self.involuntary_switches = involuntary_switches
+        self.major_faults = major_faults
+        self.minor_faults = minor_faults
+
+    @property
+    def cpu_time(self) -> float:
+        return self.user_time + self.system_time
 
     def __repr__(self) -> str:
         return (
@@ -18,21 +56,46 @@ class SimulationStats:
             f"\n\t\t  Min Memory: {self.min_memory:.2f}MB"
             f"\n\t\t  Max Memory: {self.max_memory:.2f}MB"
             f"\n\t\t  Mean Memory: {self.mean_memory:.2f}MB"
+            f"\n\t\t  Peak Memory: {self.peak_memory:.2f}MB"
+            f"\n\t\t  CPU Time: {self.user_time:.4f}s user, {self.system_time:.4f}s system"
+            f"\n\t\t  Context Switches: {self.voluntary_switches} voluntary, {self.involuntary_switches} involuntary"
+            f"\n\t\t  Page Faults: {self.major_faults} major, {self.minor_faults} minor"
         )
 
+    def split(self, parts: int) -> "SimulationStats":
+        """
+        Return the share of one out of `parts` results produced by the same process:
+        time and counters are divided evenly, memory figures are shared as they are.
+        """
+        return SimulationStats(
+            duration=self.duration / parts,
+            max_memory=self.max_memory,
+            min_memory=self.min_memory,
+            mean_memory=self.mean_memory,
+            peak_memory=self.peak_memory,
+            user_time=self.user_time / parts,
+            system_time=self.system_time / parts,
+            voluntary_switches=round(self.voluntary_switches / parts),
+            involuntary_switches=round(self.involuntary_switches / parts),
+            major_faults=round(self.major_faults / parts),
+            minor_faults=round(self.minor_faults / parts),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SimulationStats":
+        """Rebuild stats reported in-band; unknown and derived names (e.g. cpu_time) are ignored."""
+        fields = inspect.signature(cls).parameters
+        return cls(**{name: value for name, value in data.items() if name in fields})
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {name: getattr(self, name) for name in self.STAT_NAMES}
+
     def get_value_by_name(self, name: str):
         """Return the value of the stat with the given name (case-insensitive)."""
         normalized = name.strip().lower().replace(" ", "_")
-        mapping = {
-            "duration": self.duration,
-            "max_memory": self.max_memory,
-            "min_memory": self.min_memory,
-            "mean_memory": self.mean_memory,
-        }
-        if normalized not in mapping:
+        if normalized not in self.STAT_NAMES:
             raise ValueError(
                 f"Unknown stat name '{name}'. "
-                f"Valid options: {', '.join(mapping.keys())}"
+                f"Valid options: {', '.join(self.STAT_NAMES)}"
             )
-        return mapping[normalized]
-
+        return getattr(self, normalized)
@@ -1,3 +1,12 @@
+from typing import Callable, Iterator
+
+from domain.compliance_stop_rule import ComplianceStopRule
+from domain.nearest_reference_index import NearestReferenceIndex
+from domain.parameter_schema import ParameterSchema
+from domain.reference_index import ReferenceIndex
+from domain.reference_matching import ReferenceMatching
+from domain.result_set import ResultSet
+from domain.run_limits import RunLimits
 from domain.test_criteria import TestCriteria
 from domain.test_reference import TestReference
 from domain.test_result import TestResult
@@ -12,32 +21,179 @@ class Test:
         self.simulation:Simulation = Simulation(test_name, simulation_script, description)
         self.criteria: TestCriteria | None = None
         self.reference_source: str | None = None
-        self.reference: list[TestReference] | None = None
-        self.results: list[TestResult] = []
+        self._reference: list[TestReference] | None = None
+        # storage callback materializing the reference on first access, see set_reference_loader()
+        self._reference_loader: Callable[[], list[TestReference]] | None = None
+        self._reference_count: int | None = None
+        self._reference_matching: ReferenceMatching | None = None
+        self._parameter_schema: ParameterSchema | None = None
+        self._reference_index: ReferenceIndex | None = None
+        self.results: ResultSet = ResultSet()
         self.stats: TestStats | None = None
         self.final_result: str | None = None
+        self.repetitions_requested: int = 0
+        self.stopped_early: bool = False
+        # why the first run rejected by the parameter schema was rejected
+        self.output_error: str | None = None
+
+    @property
+    def reference(self) -> list[TestReference] | None:
+        if self._reference_loader is not None:
+            loader, self._reference_loader = self._reference_loader, None
+            self.reference = loader()
+        return self._reference
+
+    @reference.setter
+    def reference(self, reference: list[TestReference] | None):
+        self._reference_loader = None
+        self._reference = reference
+        self._reference_index = None  # rebuilt on the next execution
+
+    def set_reference_loader(self, loader: Callable[[], list[TestReference]], count: int | None = None):
+        """
+        Defer loading the reference from storage until it is first accessed.
+
+        :param count: Number of reference points, if storage knows it without loading them.
+        """
+        self._reference = None
+        self._reference_loader = loader
+        self._reference_count = count
+        self._reference_index = None
+
+    @property
+    def reference_loaded(self) -> bool:
+        return self._reference_loader is None
+
+    @property
+    def reference_count(self) -> int:
+        """Number of reference points, without loading them when storage knows it."""
+        if self._reference_loader is not None and self._reference_count is not None:
+            return self._reference_count
+        return len(self.reference or [])
+
+    @property
+    def parameter_schema(self) -> ParameterSchema | None:
+        """Types applied to copies of the parameters and results used by a run."""
+        return self._parameter_schema
+
+    @parameter_schema.setter
+    def parameter_schema(self, schema: ParameterSchema | None):
+        self._parameter_schema = schema
+        self._reference_index = None
+
+    @property
+    def reference_matching(self) -> ReferenceMatching | None:
+        """How results are matched to reference entries; None means exact parameters."""
+        return self._reference_matching
+
+    @reference_matching.setter
+    def reference_matching(self, matching: ReferenceMatching | None):
+        self._reference_matching = matching
+        self._reference_index = None
+
+    @property
+    def reference_index(self) -> ReferenceIndex | None:
+        """
+        Index of the reference by parameters, built on first use and kept across
+        executions until the reference list, the matching rules or the schema are
+        replaced. With a schema it indexes typed copies of the entries; values that
+        don't convert are kept as stored.
+        """
+        if self._reference_index is None and self.reference:
+            reference = self._reference
+            if self._parameter_schema:
+                reference = [self._parameter_schema.typed(ref)[0] for ref in reference]
+            matching = self._reference_matching
+            index_type = NearestReferenceIndex if matching and matching.is_nearest else ReferenceIndex
+            self._reference_index = index_type(reference, matching)
+        return self._reference_index
+
+    def execute(self, times: int, jobs: int = 1, confidence: float | None = None):
+        """Run the simulation multiple times (up to `jobs` at once) and evaluate results."""
+        for _ in self.iter_execute(times, jobs, confidence):
+            pass
+
+    def iter_execute(self, times: int, jobs: int = 1, confidence: float | None = None,
+                     request_extras: Callable[[int], dict] | None = None) -> Iterator[TestResult]:
+        """
+        Run the simulation like execute(), yielding each evaluated result as soon as its
+        repetition finishes. `results` and `stats` are kept up to date along the way and
+        `final_result` is set once every repetition has been evaluated.
 
-    def execute(self, times: int):
-        """Run the simulation multiple times and evaluate results."""
+        With a `confidence` level, repetitions stop as soon as the compliance verdict is
+        settled at that level (see ComplianceStopRule); `stats.total` then tells how many
+        repetitions were actually spent and `stopped_early` is set.
+
+        `request_extras` is handed to Simulation.iter_run (server mode only).
+        """
         if not self.simulation:
             raise RuntimeError("No simulation assigned to this test")
 
-        for i in range(times):
-            self.simulation.run(i)
-
-        sim_results: list[SimulationResult] = self.simulation.results
-        self.results = [
-            self.evaluate(sim_result, self.criteria, self.reference)
-            for sim_result in sim_results
-        ]
-        self.stats = TestStats.from_results(self.results)
-        compliance_rate = self.stats.effective_and_efficient/self.stats.total if self.stats.total != 0 else 0
-        if float(compliance_rate) < self.criteria.compliance_rate:
-            self.final_result = "failed"
-        else:
-            self.final_result = "passed"
+        self.results = ResultSet()
+        self.stats = TestStats(quantile_stats=self.criteria.percentile_stats() if self.criteria else ())
+        self.final_result = None
+        self.repetitions_requested = times
+        self.stopped_early = False
+        self.output_error = None
+
+        stop_rule = self._stop_rule(confidence)
+        limits = RunLimits.from_criteria(self.criteria)
+        # the simulation doesn't keep its own copy: results are stored columnar here
+        for sim_result in self.simulation.iter_run(times, jobs, limits, record=False, request_extras=request_extras):
+            if self._parameter_schema:
+                sim_result = self._typed(sim_result)
+            result = self.evaluate(sim_result, self.criteria, self.reference_index)
+            self.results.append(result)
+            self.stats.add(result)
+            yield result
+            if stop_rule is not None and self.stats.total < times and self._settled(stop_rule.decide(self.stats)):
+                self.stopped_early = True
+                break  # closing the run cancels the repetitions still in flight
+
+        self.final_result = self._verdict()
+
+    def _typed(self, sim_result: SimulationResult) -> SimulationResult:
+        # a run whose output doesn't fit the schema fails on its own, the others go on
+        typed, errors = self._parameter_schema.typed(sim_result)
+        if errors and typed.status == "ok":
+            typed.status = "invalid"
+            typed.error = "; ".join(errors)
+            self.output_error = self.output_error or typed.error
+        return typed
+
+    def _stop_rule(self, confidence: float | None) -> ComplianceStopRule | None:
+        if confidence is None:
+            return None
+        required_rate = self.criteria.compliance_rate if self.criteria else None
+        if required_rate in (None, ""):
+            raise ValueError("Early stopping needs a compliance_rate criterion")
+        return ComplianceStopRule(float(required_rate), confidence)
+
+    def _settled(self, decision: str | None) -> bool:
+        # the stop rule only settles compliance: a pass can still be lost to a percentile criterion
+        if decision == "passed" and self.criteria and self.criteria.percentiles:
+            return False
+        return decision is not None
 
-    def get_results(self) -> list["TestResult"]:
+    def _verdict(self) -> str:
+        compliance_rate = self.stats.compliance_rate or 0
+        required_rate = self.criteria.compliance_rate if self.criteria else None
+        if required_rate not in (None, "") and float(compliance_rate) < required_rate:
+            return "failed"
+        for name, (observed, limit) in self._percentile_checks().items():
+            if observed is not None and observed > limit:
+                return "failed"
+        return "passed"
+
+    def _percentile_checks(self) -> dict[str, tuple[float | None, float]]:
+        """Observed value and limit of every percentile criterion."""
+        checks = {}
+        for name, limit in (self.criteria.percentiles if self.criteria else {}).items():
+            stat_name, q = TestCriteria.parse_percentile(name)
+            checks[name] = (self.stats.quantile(stat_name, q) if self.stats else None, float(limit))
+        return checks
+
+    def get_results(self) -> ResultSet:
         """Return the list of test results."""
         if not self.results:
             raise RuntimeError("No results available. Did you run execute()?")
@@ -47,30 +203,51 @@ class Test:
         """Return aggregated test statistics."""
         if not self.results:
             raise RuntimeError("No results available. Did you run execute()?")
-        return TestStats.from_results(self.results)
+        return self.results.stats(self.criteria.percentile_stats() if self.criteria else ())
+
+    def rescore(self, criteria: TestCriteria | None = None) -> TestStats:
+        """
+        Re-evaluate the efficiency of all stored results in one batch, against `criteria`
+        (the test's own by default), and update `stats` and `final_result` accordingly.
+        """
+        if criteria is not None:
+            self.criteria = criteria
+        self.stats = self.results.rescore(self.criteria)
+        self.final_result = self._verdict()
+        return self.stats
 
     def get_stats_variable_data(self, variable_name: str):
-        data = [result.simulation.stats.get_value_by_name(variable_name) for result in self.results]
+        """Return the values of one stat across all results, as a column."""
+        return self.results.column(variable_name)
 
     @staticmethod
     def evaluate(
         sim_result: "SimulationResult",
         criteria: "TestCriteria | None" = None,
-        reference: list["TestReference"] | None = None,
+        reference: "list[TestReference] | ReferenceIndex | None" = None,
     ) -> "TestResult":
-        """Evaluate a single simulation result against reference and criteria."""
+        """
+        Evaluate a single simulation result against reference and criteria.
+        Pass a ReferenceIndex when evaluating many results against the same reference.
+        """
         result = TestResult()
 
+        # --- runs stopped by their limits produced nothing to compare ---
+        if sim_result.status != "ok":
+            result.efficacy = "failed"
+            result.efficiency = sim_result.status
+            result.simulation = sim_result
+            return result
+
         # --- efficacy → check result against reference ---
         if reference:
             # find a matching reference by parameters
-            matching_ref = next(
-                (ref for ref in reference if ref.parameters == sim_result.parameters),
-                None,
-            )
+            if not isinstance(reference, ReferenceIndex):
+                reference = ReferenceIndex(reference)
+            matching_ref = reference.find(sim_result.parameters)
 
             if matching_ref:
-                if str(sim_result.result) == str(matching_ref.result):
+                if reference.matching.results_match(sim_result.result, matching_ref.result):
                     result.efficacy = "passed"
                 else:
                     result.efficacy = "failed"
@@ -85,10 +262,12 @@ class Test:
         if criteria:
             stats = sim_result.stats
             conditions = [
-                criteria.duration is None or stats.duration <= criteria.duration,
-                criteria.max_memory is None or stats.max_memory <= criteria.max_memory,
-                criteria.mean_memory is None or stats.mean_memory <= criteria.mean_memory,
+                stats.get_value_by_name(name) <= limit
+                for name, limit in criteria.limits().items()
             ]
+            expression = criteria.compiled_expression()
+            if expression is not None:
+                conditions.append(expression.evaluate(stats, sim_result.parameters, sim_result.result))
             result.efficiency = "passed" if all(conditions) else "failed"
         else:
             result.efficiency = "passed"  # no criteria → auto-pass
@@ -107,6 +286,18 @@ class Test:
                 f"{indent}- mean_memory    : {self.criteria.mean_memory}",
                 f"{indent}- compliance_rate: {self.criteria.compliance_rate}",
             ]
+            # resource limits beyond the classic three are listed only when set
+            criteria_lines += [
+                f"{indent}- {name:<15}: {limit}"
+                for name, limit in self.criteria.limits().items()
+                if name not in ("duration", "max_memory", "mean_memory")
+            ]
+            criteria_lines += [
+                f"{indent}- {name:<15}: {getattr(self.criteria, name)}"
+                for name in (*TestCriteria.ENFORCEMENT, TestCriteria.EXPRESSION)
+                if getattr(self.criteria, name) not in (None, "")
+            ]
+            criteria_lines += [f"{indent}- {name:<15}: {limit}" for name, limit in self.criteria.percentiles.items()]
             criteria_str = "\n".join(criteria_lines)
         else:
             criteria_str = f"{indent}(no criteria)"
@@ -120,6 +311,23 @@ class Test:
                 f"{indent}- total                 : {self.stats.total}",
                 f"{indent}- compliance rate       : {self.stats.compliance_rate}",
             ]
+            for name, (observed, limit) in self._percentile_checks().items():
+                if observed is not None:
+                    stats_lines.append(f"{indent}- {name:<22}: {observed:.6g} (limit {limit})")
+            for name in ("duration", "max_memory", "mean_memory", "peak_memory", "cpu_time"):
+                running = self.stats.running[name]
+                if running.count:
+                    std = f"{running.std:.4g}" if running.std is not None else "-"
+                    stats_lines.append(
+                        f"{indent}- {name:<22}: mean {running.mean:.4g} ± {std} [{running.min:.4g}, {running.max:.4g}]"
+                    )
+            if self.output_error:
+                invalid = self.results.column("status").count("invalid")
+                stats_lines.append(f"{indent}- invalid output        : {invalid} runs, e.g. {self.output_error}")
+            if self.stopped_early:
+                stats_lines.append(
+                    f"{indent}- stopped early         : {self.stats.total} of {self.repetitions_requested} repetitions spent"
+                )
             stats_str = "\n".join(stats_lines)
         else:
             stats_str = f"{indent}(no stats)"
@@ -1,18 +1,129 @@
+import re
+
+from domain.criteria_expression import CriteriaExpression
+from domain.simulation_statistics import SimulationStats
+
+# percentile criteria are named p<percentile>_<stat>, e.g. p95_duration or p99.9_max_memory
+PERCENTILE_NAME = re.compile(r"^p(\d{1,2}(?:\.\d+)?)_(\w+)$")
+
+
 class TestCriteria:
+    # per-run upper bounds, each named after the SimulationStats value it limits
+    STAT_LIMITS = (
+        "duration",
+        "max_memory",
+        "mean_memory",
+        "peak_memory",
+        "cpu_time",
+        "user_time",
+        "system_time",
+        "voluntary_switches",
+        "involuntary_switches",
+        "major_faults",
+        "minor_faults",
+    )
+    # enforcement: runs are killed past duration * timeout_multiplier seconds and
+    # capped at max_memory * memory_limit_multiplier MB (see RunLimits)
+    ENFORCEMENT = ("timeout_multiplier", "memory_limit_multiplier")
+    # free-form budget over stats and parameters, e.g. "duration < 0.2 * float(x)" (see CriteriaExpression)
+    EXPRESSION = "expression"
+    FIELDS = (*STAT_LIMITS, "compliance_rate", *ENFORCEMENT, EXPRESSION)
+
     def __init__(
         self,
         duration        : float | None = None,
         max_memory      : float | None = None,
         mean_memory     : float | None = None,
         compliance_rate : float | None = None,
+        peak_memory     : float | None = None,
+        cpu_time        : float | None = None,
+        user_time       : float | None = None,
+        system_time     : float | None = None,
+        voluntary_switches   : float | None = None,
+        involuntary_switches : float | None = None,
+        major_faults    : float | None = None,
+        minor_faults    : float | None = None,
+        timeout_multiplier      : float | None = None,
+        memory_limit_multiplier : float | None = None,
+        expression      : str | None = None,
     ):
         self.duration = duration
         self.max_memory = max_memory
         self.mean_memory = mean_memory
         self.compliance_rate = compliance_rate
+        self.peak_memory = peak_memory
+        self.cpu_time = cpu_time
+        self.user_time = user_time
+        self.system_time = system_time
+        self.voluntary_switches = voluntary_switches
+        self.involuntary_switches = involuntary_switches
+        self.major_faults = major_faults
+        self.minor_faults = minor_faults
+        self.timeout_multiplier = timeout_multiplier
+        self.memory_limit_multiplier = memory_limit_multiplier
+        self.expression = expression
+        self._compiled: CriteriaExpression | None = None
+        # test-level tail limits over all runs, e.g. {"p95_duration": 0.2}
+        self.percentiles: dict[str, float] = {}
+
+    def limits(self) -> dict[str, float]:
+        """Return the per-run stat limits that are actually set."""
+        return {
+            name: getattr(self, name)
+            for name in self.STAT_LIMITS
+            if getattr(self, name) not in (None, "")
+        }
+
+    @staticmethod
+    def parse_percentile(name: str) -> tuple[str, float] | None:
+        """Return (stat name, quantile in 0..1) for a percentile criterion name, else None."""
+        match = PERCENTILE_NAME.match(name)
+        if not match or match.group(2) not in SimulationStats.STAT_NAMES:
+            return None
+        percentile = float(match.group(1))
+        if not 0 < percentile < 100:
+            return None
+        return match.group(2), percentile / 100
+
+    def set_percentile(self, name: str, limit: float | None) -> None:
+        """Set (or with None, remove) a percentile criterion such as p95_duration."""
+        if self.parse_percentile(name) is None:
+            raise AttributeError(f"Invalid percentile criterion: {name}")
+        if limit is None:
+            self.percentiles.pop(name, None)
+        else:
+            self.percentiles[name] = limit
+
+    def percentile_stats(self) -> tuple[str, ...]:
+        """Stats whose distribution must be tracked to check the percentile criteria."""
+        return tuple(dict.fromkeys(self.parse_percentile(name)[0] for name in self.percentiles))
+
+    def compiled_expression(self) -> CriteriaExpression | None:
+        """The expression criterion, parsed and compiled once (until it changes)."""
+        if not self.expression:
+            return None
+        if self._compiled is None or self._compiled.source != self.expression.strip():
+            self._compiled = CriteriaExpression(self.expression)
+        return self._compiled
+
+    def as_dict(self) -> dict[str, float | str | dict | None]:
+        return {**{name: getattr(self, name) for name in self.FIELDS}, "percentiles": dict(self.percentiles)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TestCriteria":
+        """Rebuild criteria from a stored dict, ignoring unknown keys."""
+        criteria = cls()
+        for key, value in data.items():
+            if key in cls.FIELDS:
+                setattr(criteria, key, value)
+        for name, limit in (data.get("percentiles") or {}).items():
+            if cls.parse_percentile(name) is not None:
+                criteria.percentiles[name] = limit
+        return criteria
 
     def __repr__(self) -> str:
         return (
             f"TestCriteria(duration={self.duration}, "
-            f"max_memory={self.max_memory}, mean_memory={self.mean_memory}, compliance_rate={self.compliance_rate})"
-        )
\ No newline at end of file
+            f"max_memory={self.max_memory}, mean_memory={self.mean_memory}, compliance_rate={self.compliance_rate}, "
+            f"limits={self.limits()}, percentiles={self.percentiles}, expression={self.expression!r})"
+        )
@@ -6,7 +6,8 @@ from domain.simulation_result import SimulationResult
 class TestResult:
     def __init__(self):
         self.efficacy: Literal["passed", "failed"] | None = None
-        self.efficiency: Literal["passed", "failed"] | None = None
+        # "timeout" / "oom" when the run was stopped by its limits, "invalid" when its output was rejected
+        self.efficiency: Literal["passed", "failed", "timeout", "oom", "invalid"] | None = None
         self.simulation: SimulationResult | None = None
 
     def __repr__(self) -> str:
@@ -1,3 +1,8 @@
+from typing import Iterable
+
+from domain.quantile_sketch import QuantileSketch
+from domain.running_stats import RunningStats
+from domain.simulation_statistics import SimulationStats
 from domain.test_result import TestResult
 
 class TestStats:
@@ -7,7 +12,12 @@ class TestStats:
         efficient: int = 0,
         both: int = 0,
         total: int = 0,
+        quantile_stats: Iterable[str] = (),
     ):
+        """
+        :param quantile_stats: Simulation stats whose distribution is tracked with a
+                               QuantileSketch, for percentile criteria.
+        """
         self.effective = effective
         self.efficient = efficient
         self.effective_and_efficient = both
@@ -15,17 +25,49 @@ class TestStats:
         self.compliance_rate: float | None = (
             both / total if total > 0 else None
         )
+        self.sketches: dict[str, QuantileSketch] = {name: QuantileSketch() for name in quantile_stats}
+        # mean / variance / min / max of every simulation stat, updated per result
+        self.running: dict[str, RunningStats] = {name: RunningStats() for name in SimulationStats.STAT_NAMES}
 
     @classmethod
-    def from_results(cls, results: list["TestResult"]) -> "TestStats":
-        total = len(results)
-        effective = sum(1 for r in results if r.efficacy == "passed")
-        efficient = sum(1 for r in results if r.efficiency == "passed")
-        both = sum(
-            1 for r in results
-            if r.efficacy == "passed" and r.efficiency == "passed"
-        )
-        return cls(effective, efficient, both, total)
+    def from_results(cls, results: Iterable["TestResult"], quantile_stats: Iterable[str] = ()) -> "TestStats":
+        stats = cls(quantile_stats=quantile_stats)
+        for result in results:
+            stats.add(result)
+        return stats
+
+    def add(self, result: "TestResult") -> None:
+        """Account for one more evaluated result in O(1)."""
+        effective = result.efficacy == "passed"
+        efficient = result.efficiency == "passed"
+        self.total += 1
+        self.effective += effective
+        self.efficient += efficient
+        self.effective_and_efficient += effective and efficient
+        self.compliance_rate = self.effective_and_efficient / self.total
+        if result.simulation:
+            sim_stats = result.simulation.stats
+            for name, running in self.running.items():
+                running.add(getattr(sim_stats, name))
+            for name, sketch in self.sketches.items():
+                sketch.add(sim_stats.get_value_by_name(name))
+
+    def merge(self, other: "TestStats") -> None:
+        """Fold in the stats of results evaluated elsewhere, e.g. by another worker."""
+        self.total += other.total
+        self.effective += other.effective
+        self.efficient += other.efficient
+        self.effective_and_efficient += other.effective_and_efficient
+        self.compliance_rate = self.effective_and_efficient / self.total if self.total else None
+        for name, sketch in other.sketches.items():
+            self.sketches.setdefault(name, QuantileSketch(sketch.compression)).merge(sketch)
+        for name, running in other.running.items():
+            self.running[name].merge(running)
+
+    def quantile(self, stat_name: str, q: float) -> float | None:
+        """Estimated quantile `q` (0..1) of a tracked stat, or None if it isn't tracked or empty."""
+        sketch = self.sketches.get(stat_name)
+        return sketch.quantile(q) if sketch and sketch.count else None
 
     def to_dict(self) -> dict[str, float | int | None]:
         return {
@@ -34,6 +76,7 @@ class TestStats:
             "efficient": self.efficient,
             "effective_and_efficient": self.effective_and_efficient,
             "compliance_rate": self.compliance_rate,
+            "running": {name: running.as_dict() for name, running in self.running.items()},
         }
 
     def __repr__(self) -> str:
@@ -0,0 +1,56 @@
+from domain.test_criteria import TestCriteria
+
+
+class TestSummary:
+    """Configuration of a test without its reference points, for listings and forms."""
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        script_path: str = "",
+        mode: str = "process",
+        reference_source: str | None = None,
+        reference_count: int = 0,
+        criteria: TestCriteria | None = None,
+    ):
+        self.name = name
+        self.description = description
+        self.script_path = script_path
+        self.mode = mode
+        self.reference_source = reference_source
+        self.reference_count = reference_count
+        self.criteria = criteria
+
+    @classmethod
+    def from_test(cls, test) -> "TestSummary":
+        return cls(
+            name=test.name,
+            description=test.description,
+            script_path=test.simulation.script_path if test.simulation else "",
+            mode=test.simulation.mode if test.simulation else "process",
+            reference_source=test.reference_source,
+            reference_count=test.reference_count,
+            criteria=test.criteria,
+        )
+
+    @classmethod
+    def from_entry(cls, entry: dict, reference_count: int | None = None) -> "TestSummary":
+        """Build from a stored test entry (the JSON document layout)."""
+        simulation = entry.get("simulation") or {}
+        criteria = entry.get("criteria")
+        return cls(
+            name=entry["name"],
+            description=entry.get("description", ""),
+            script_path=simulation.get("script_path", ""),
+            mode=simulation.get("mode", "process"),
+            reference_source=entry.get("reference_source") or None,
+            reference_count=reference_count if reference_count is not None else len(entry.get("reference", [])),
+            criteria=TestCriteria.from_dict(criteria) if criteria else None,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"TestSummary(name={self.name!r}, script_path={self.script_path!r}, mode={self.mode!r}, "
+            f"reference_source={self.reference_source!r}, reference_count={self.reference_count})"
+        )
@@ -0,0 +1,16 @@
+import json
+import time
+
+# Batch version of area_simulation.py: covers the whole x/y grid in one invocation,
+# printing one result per line with its own in-band duration
+for x in range(1, 11):
+    for y in range(1, 11):
+        start = time.perf_counter()
+        result = x * y
+
+        output = {
+            "result": str(result),
+            "parameters": {"x": str(x), "y": str(y)},
+            "duration_s": time.perf_counter() - start,
+        }
+        print(json.dumps(output))
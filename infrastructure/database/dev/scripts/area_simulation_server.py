@@ -0,0 +1,22 @@
+import json
+import random
+import sys
+
+# JSON-lines server version of area_simulation.py:
+# one request per line on stdin, one result per line on stdout
+for line in sys.stdin:
+    request = json.loads(line)
+    if "seed" in request:
+        random.seed(request["seed"])
+
+    params = request.get("parameters") or {
+        "x": random.randint(1, 10),
+        "y": random.randint(1, 10),
+    }
+    result = int(params["x"]) * int(params["y"])
+
+    output = {
+        "result": str(result),
+        "parameters": {k: str(v) for k, v in params.items()}
+    }
+    print(json.dumps(output), flush=True)
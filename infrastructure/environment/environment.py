@@ -1,4 +1,5 @@
 import inspect
+import os
 import sys
 from pathlib import Path
 import platform
@@ -45,6 +46,23 @@ class Env:
         data_path.mkdir(parents=True, exist_ok=True)
         return data_path
 
+    # storage backends accepted in FLEXTESTS_STORAGE
+    STORAGE_BACKENDS = ("json", "sharded", "sqlite")
+
+    @staticmethod
+    def get_storage_backend() -> str:
+        """
+        Return the storage backend for tests, from the FLEXTESTS_STORAGE environment
+        variable: 'json' (default, tests.json), 'sharded' (a directory of per-test files)
+        or 'sqlite' (tests.db).
+        """
+        backend = os.environ.get("FLEXTESTS_STORAGE", "json").strip().lower() or "json"
+        if backend not in Env.STORAGE_BACKENDS:
+            raise ValueError(
+                f"Unknown storage backend '{backend}'. Valid options: {', '.join(Env.STORAGE_BACKENDS)}"
+            )
+        return backend
+
     @staticmethod
     def get_window() -> dict:
         system = platform.system()
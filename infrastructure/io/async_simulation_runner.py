@@ -0,0 +1,318 @@
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from contextlib import aclosing
+from typing import AsyncIterator, Callable, Iterator, List
+
+from domain.run_limits import RunLimits
+from domain.simulation_result import SimulationResult
+from domain.simulation_statistics import SimulationStats
+from infrastructure.io.json_fetcher import JsonFetcher
+from infrastructure.io.output_capture import OutputCapture
+from infrastructure.io.ordered_stream import OrderedStream, iter_in_order
+from infrastructure.io.process_limits import classify_failure, kill_process_group, spawn_kwargs
+from infrastructure.sampling.memory_sampler import MemorySampler, create_memory_sampler
+from infrastructure.sampling.sampling_schedule import SamplingSchedule
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class AsyncSimulationRunner:
+    """
+    Run simulation scripts as child processes multiplexed on a single asyncio event loop.
+
+    Memory is sampled by timer callbacks scheduled on the loop following an adaptive
+    SamplingSchedule. Children are reaped with wait4 as soon as the loop sees them exit,
+    which also yields their exact CPU time, peak RSS, context switches and page faults,
+    so no thread or sleep loop is spent per run. Optional RunLimits kill runs past their
+    deadline and cap their address space; such runs come back with a "timeout" or
+    "oom" status instead of raising.
+    """
+
+    def __init__(
+        self,
+        jobs: int = 1,
+        schedule: SamplingSchedule | None = None,
+        sampler_factory: Callable[[int], MemorySampler] = create_memory_sampler,
+        fetcher: JsonFetcher | None = None,
+        limits: RunLimits | None = None,
+    ):
+        """
+        :param jobs: Maximum number of simulation processes alive at the same time.
+        :param schedule: When to take memory samples of a running process.
+        :param sampler_factory: Builds the memory sampler backend for a child pid.
+        :param limits: Wall-clock and memory limits enforced on every process.
+        """
+        self.jobs = max(1, jobs)
+        self.schedule = schedule or SamplingSchedule()
+        self.sampler_factory = sampler_factory
+        self.fetcher = fetcher or JsonFetcher()
+        self.limits = limits
+
+    # ---------------- public API ----------------
+
+    def run(self, script_path: str, times: int, capture_output: bool = True) -> List[SimulationResult]:
+        """Blocking entry point: run the script `times` times and return results in repetition order."""
+        return asyncio.run(self.run_many(script_path, times, capture_output))
+
+    async def run_many(self, script_path: str, times: int, capture_output: bool = True) -> List[SimulationResult]:
+        """Run the script `times` times with at most `jobs` processes in flight."""
+        return [result async for result in self.iter_many(script_path, times, capture_output)]
+
+    async def iter_many(self, script_path: str, times: int, capture_output: bool = True) -> AsyncIterator[SimulationResult]:
+        """Like run_many, but yield each result in repetition order as soon as it is available."""
+        cmd = self.fetcher.build_cmd(script_path)
+        next_index = 0
+
+        async def worker(stream: OrderedStream[SimulationResult]):
+            nonlocal next_index
+            while next_index < times:
+                index = next_index
+                next_index += 1
+                stream.put(index, await self.run_cmd(cmd, capture_output))
+
+        async with aclosing(iter_in_order(min(self.jobs, times), worker)) as results:
+            async for result in results:
+                yield result
+
+    async def run_one(self, script_path: str, capture_output: bool = True) -> SimulationResult:
+        """Run the script once and return its SimulationResult."""
+        return await self.run_cmd(self.fetcher.build_cmd(script_path), capture_output)
+
+    async def run_cmd(self, cmd: list[str], capture_output: bool = True) -> SimulationResult:
+        """Spawn `cmd`, sample its memory until it exits and parse its JSON output."""
+        stdout, stats, status = await self._execute(cmd, capture_output)
+        with stdout:
+            if status != "ok":
+                return SimulationResult(stats=stats, result="", status=status)
+            if stdout:
+                data = self.fetcher.parse_json_stream(stdout.iter_text())
+                return SimulationResult.from_output(data, stats)
+        return SimulationResult(stats=stats, result="")
+
+    async def run_batches(self, script_path: str, times: int) -> List[SimulationResult]:
+        """
+        Collect `times` results from a script printing many results per invocation
+        (a JSON array or JSON lines), invoking it as often as needed with up to `jobs`
+        invocations in flight. Results keep invocation order, then output order.
+        """
+        return [result async for result in self.iter_batches(script_path, times)]
+
+    async def iter_batches(self, script_path: str, times: int) -> AsyncIterator[SimulationResult]:
+        """Like run_batches, but yield results as soon as their invocation's turn comes."""
+        cmd = self.fetcher.build_cmd(script_path)
+        collected = 0
+        next_invocation = 0
+
+        async def worker(stream: OrderedStream[List[SimulationResult]]):
+            nonlocal collected, next_invocation
+            while collected < times:
+                invocation = next_invocation
+                next_invocation += 1
+                batch = await self.run_batch_cmd(cmd)
+                if not batch:
+                    raise ValueError(f"Batch simulation produced no results: {script_path}")
+                collected += len(batch)
+                stream.put(invocation, batch)
+
+        remaining = times
+        async with aclosing(iter_in_order(min(self.jobs, times), worker)) as batches:
+            async for batch in batches:
+                for result in batch[:remaining]:
+                    yield result
+                remaining -= min(len(batch), remaining)
+                if remaining == 0:
+                    return
+
+    async def run_batch_cmd(self, cmd: list[str]) -> List[SimulationResult]:
+        """Spawn `cmd` once and parse every result object it printed."""
+        stdout, stats, status = await self._execute(cmd, True)
+        with stdout:
+            if status != "ok":
+                return [SimulationResult(stats=stats, result="", status=status)]
+            values = list(self.fetcher.iter_json_stream(stdout.iter_text()))
+        # results without in-band figures get an equal share of the invocation's cost
+        shared_stats = stats.split(len(values)) if values else stats
+        return [SimulationResult.from_output(value, shared_stats) for value in values]
+
+    # ---------------- internal helpers ----------------
+
+    async def _execute(self, cmd: list[str], capture_output: bool) -> tuple[OutputCapture, SimulationStats, str]:
+        """
+        Spawn `cmd`, sample its memory and reap it, returning its captured stdout (to be
+        closed by the caller), measured stats and status: "ok", or "timeout" / "oom"
+        when it was stopped by a limit.
+        """
+        loop = asyncio.get_running_loop()
+        harness_peak_kb = self._own_peak_rss_kb()
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE if capture_output else None,
+            stderr=subprocess.PIPE if capture_output else None,
+            **spawn_kwargs(self.limits),
+        )
+
+        # past the deadline the whole process group is killed; pipes then hit EOF
+        # and the reaper returns, so nothing below has to be cancelled
+        timed_out = False
+        deadline: asyncio.TimerHandle | None = None
+
+        def on_deadline():
+            nonlocal timed_out
+            timed_out = True
+            kill_process_group(proc.pid)
+
+        if self.limits and self.limits.timeout is not None:
+            deadline = loop.call_later(self.limits.timeout, on_deadline)
+
+        sampler = self.sampler_factory(proc.pid)
+        timer: asyncio.TimerHandle | None = None
+
+        def sample(intervals: Iterator[float]):
+            nonlocal timer
+            if not sampler.sample():
+                return  # process is gone, stop rescheduling
+            delay = next(intervals, None)
+            if delay is not None:
+                timer = loop.call_later(delay, sample, intervals)
+
+        sample(self.schedule.intervals())
+
+        # both pipes are drained while the child runs, so it never blocks on a full pipe
+        stdout, stderr = OutputCapture(), OutputCapture()
+        completed = False
+        try:
+            if hasattr(os, "wait4"):
+                _, _, rusage = await asyncio.gather(
+                    self._read_pipe(proc.stdout, stdout),
+                    self._read_pipe(proc.stderr, stderr),
+                    self._reap(proc),
+                )
+            else:
+                # no wait4 (Windows): drain with reader threads and let Popen reap the child,
+                # without resource usage
+                await asyncio.gather(
+                    loop.run_in_executor(None, self._drain_pipe, proc.stdout, stdout),
+                    loop.run_in_executor(None, self._drain_pipe, proc.stderr, stderr),
+                    loop.run_in_executor(None, proc.wait),
+                )
+                rusage = None
+            completed = True
+        except asyncio.CancelledError:
+            if proc.returncode is None:
+                if self.limits:
+                    kill_process_group(proc.pid)
+                else:
+                    proc.kill()
+                if hasattr(os, "wait4"):
+                    await self._reap(proc)
+                else:
+                    await loop.run_in_executor(None, proc.wait)
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+            if deadline is not None:
+                deadline.cancel()
+            sampler.close()
+            duration = time.perf_counter() - start
+            if not completed:
+                stdout.close()
+                stderr.close()
+
+        stats = SimulationStats(
+            duration=duration,
+            min_memory=sampler.min_memory,
+            max_memory=sampler.max_memory,
+            mean_memory=sampler.mean_memory,
+            peak_memory=sampler.max_memory,
+        )
+        if rusage is not None:
+            self._apply_rusage(stats, rusage, harness_peak_kb)
+
+        with stderr:
+            stderr_text = stderr.tail()
+        status = "timeout" if timed_out else "ok"
+        if proc.returncode != 0 and not timed_out:
+            status = classify_failure(proc.returncode, stderr_text, self.limits, stats.peak_memory)
+            if status is None:
+                stdout.close()
+                raise RuntimeError(f"Script failed with exit code {proc.returncode}:\n{stderr_text}")
+        return stdout, stats, status
+
+    @staticmethod
+    async def _read_pipe(pipe, capture: OutputCapture) -> None:
+        """Drain a child pipe into `capture` on the event loop until EOF."""
+        if pipe is None:
+            return
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), pipe)
+        while chunk := await reader.read(OutputCapture.CHUNK_SIZE):
+            capture.write(chunk)
+
+    @staticmethod
+    def _drain_pipe(pipe, capture: OutputCapture) -> None:
+        """Blocking variant of _read_pipe, for reader threads."""
+        if pipe is None:
+            return
+        with pipe:
+            while chunk := pipe.read(OutputCapture.CHUNK_SIZE):
+                capture.write(chunk)
+
+    @staticmethod
+    async def _reap(proc: subprocess.Popen):
+        """
+        Wait for the child to exit and reap it with wait4, returning its resource usage.
+        Exit is signalled by a pidfd becoming readable on the loop where available.
+        """
+        loop = asyncio.get_running_loop()
+        if hasattr(os, "pidfd_open"):
+            pidfd = os.pidfd_open(proc.pid)
+            try:
+                exited = loop.create_future()
+
+                def on_exit():
+                    if not exited.done():
+                        exited.set_result(None)
+
+                loop.add_reader(pidfd, on_exit)
+                try:
+                    await exited
+                finally:
+                    loop.remove_reader(pidfd)
+            finally:
+                os.close(pidfd)
+            _, status, rusage = os.wait4(proc.pid, 0)
+        else:
+            _, status, rusage = await loop.run_in_executor(None, os.wait4, proc.pid, 0)
+
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        return rusage
+
+    @staticmethod
+    def _own_peak_rss_kb() -> int:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else 0
+
+    @staticmethod
+    def _apply_rusage(stats: SimulationStats, rusage, harness_peak_kb: int) -> None:
+        """Copy the exact kernel figures of a reaped child into its stats."""
+        stats.user_time = rusage.ru_utime
+        stats.system_time = rusage.ru_stime
+        stats.voluntary_switches = rusage.ru_nvcsw
+        stats.involuntary_switches = rusage.ru_nivcsw
+        stats.major_faults = rusage.ru_majflt
+        stats.minor_faults = rusage.ru_minflt
+
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere. A spawned child inherits the
+        # harness high-water mark at exec, so the figure is only the child's own peak when it
+        # exceeds the harness peak; otherwise keep the sampled maximum.
+        scale = 1 if sys.platform == "darwin" else 1024
+        if rusage.ru_maxrss * scale > harness_peak_kb * 1024:
+            stats.peak_memory = rusage.ru_maxrss * scale / (1024 * 1024)
@@ -0,0 +1,62 @@
+import json
+import re
+from typing import Any, Iterator, List
+
+# insignificant whitespace, as defined by the JSON grammar
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class IncrementalJsonDecoder:
+    """
+    Decode a stream of whitespace-separated JSON values fed in arbitrary text chunks,
+    yielding each value as soon as it is complete. Only the text of values not yet
+    decoded is buffered.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._chunks: List[str] = []
+        self._pending = 0
+        # a failed attempt is retried once the pending text has doubled, so a huge value
+        # arriving in many small chunks is decoded a bounded number of times
+        self._retry_size = 0
+
+    def feed(self, chunk: str) -> Iterator[Any]:
+        """Add a chunk of text and yield the values it completed."""
+        if chunk:
+            self._chunks.append(chunk)
+            self._pending += len(chunk)
+        if self._pending >= self._retry_size:
+            yield from self._decode(final=False)
+
+    def close(self) -> Iterator[Any]:
+        """Yield the remaining values; raise ValueError if the stream ends mid-value."""
+        yield from self._decode(final=True)
+
+    # ---------------- internal helpers ----------------
+
+    def _decode(self, final: bool) -> Iterator[Any]:
+        buffer = "".join(self._chunks)
+        values = []
+        position = WHITESPACE.match(buffer).end()
+        while position < len(buffer):
+            try:
+                value, end = self._decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as e:
+                if final:
+                    raise ValueError(f"Invalid JSON: {e}") from e
+                self._retry_size = 2 * (len(buffer) - position)
+                break
+            if not final and buffer[end - 1] not in '}]"' and WHITESPACE.match(buffer, end).end() == end:
+                # a number or literal is only complete once followed by whitespace ("3" of "3.5")
+                self._retry_size = len(buffer) - position + 1
+                break
+            values.append(value)
+            position = WHITESPACE.match(buffer, end).end()
+        else:
+            self._retry_size = 0
+
+        rest = buffer[position:]
+        self._chunks = [rest] if rest else []
+        self._pending = len(rest)
+        yield from values
@@ -4,7 +4,9 @@ import subprocess
 import sys
 import shutil
 import os
-from typing import Any, Callable, TypeVar, List
+from typing import Any, Callable, Iterable, Iterator, TypeVar, List
+
+from infrastructure.io.incremental_json_decoder import IncrementalJsonDecoder
 
 T = TypeVar("T")
 
@@ -69,6 +71,34 @@ class JsonFetcher:
             text=True,
         )
 
+    def iter_json_values(self, text: str) -> Iterator[Any]:
+        """
+        Decode a stream of whitespace-separated JSON values (e.g. JSON lines) one at a time.
+        A top-level array is flattened into its elements.
+        """
+        return self.iter_json_stream([text])
+
+    def iter_json_stream(self, chunks: Iterable[str]) -> Iterator[Any]:
+        """Like iter_json_values, decoding text chunks incrementally as they are read."""
+        decoder = IncrementalJsonDecoder()
+        for chunk in chunks:
+            yield from self._flatten(decoder.feed(chunk))
+        yield from self._flatten(decoder.close())
+
+    def parse_json_stream(self, chunks: Iterable[str]) -> Any:
+        """Like parse_json, for text read in chunks."""
+        decoder = IncrementalJsonDecoder()
+        values = []
+        for chunk in chunks:
+            values.extend(decoder.feed(chunk))
+            if len(values) > 1:
+                break
+        else:
+            values.extend(decoder.close())
+        if len(values) != 1:
+            raise ValueError("Invalid JSON: expected a single value" if values else "Invalid JSON: no value")
+        return self._limit_depth(values[0], self.max_depth)
+
     def parse_json(self, text: str) -> Any:
         """Parse JSON text and apply depth limiting."""
         try:
@@ -118,6 +148,14 @@ class JsonFetcher:
 
         return proc.stdout.strip()
 
+    def _flatten(self, values: Iterable[Any]) -> Iterator[Any]:
+        for value in values:
+            value = self._limit_depth(value, self.max_depth)
+            if isinstance(value, list):
+                yield from value
+            else:
+                yield value
+
     def _limit_depth(self, data: Any, max_depth: int | None, current_depth: int = 0) -> Any:
         """Recursively trim data structure to max_depth if provided."""
         if max_depth is None:
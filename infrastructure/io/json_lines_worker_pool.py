@@ -0,0 +1,192 @@
+import asyncio
+import json
+import time
+from contextlib import aclosing
+from asyncio.subprocess import PIPE
+from typing import AsyncIterator, Callable, List
+
+import psutil
+
+from domain.run_limits import RunLimits
+from domain.simulation_result import SimulationResult
+from domain.simulation_statistics import SimulationStats
+from infrastructure.io.json_fetcher import JsonFetcher
+from infrastructure.io.ordered_stream import OrderedStream, iter_in_order
+from infrastructure.io.process_limits import classify_failure, kill_process_group, spawn_kwargs
+from infrastructure.sampling.memory_sampler import create_memory_sampler
+
+
+class JsonLinesWorkerPool:
+    """
+    Drive long-lived simulation servers speaking the JSON-lines protocol.
+
+    The server command is started once per worker. For every repetition the harness
+    writes one request line to the server's stdin and reads one response line back:
+
+        request : {"iteration": 3, "seed": 42, "parameters": {...}}   (seed/parameters optional)
+        response: {"result": "...", "parameters": {...}}
+              or: {"output": {...}, "stats": {...}}   (output in any accepted format, stats measured in-band)
+              or: {"error": "message"}
+
+    Responses without in-band "stats" are measured by the harness around the request.
+    With RunLimits, a request unanswered past the timeout and a server dying on its
+    memory cap are recorded as "timeout" / "oom" results, and the server is restarted.
+    """
+
+    # responses carry the whole simulation output on one line
+    LINE_LIMIT = 64 * 1024 * 1024
+
+    def __init__(self, cmd: list[str], size: int = 1, limits: RunLimits | None = None):
+        """
+        :param cmd: Command line starting one server process.
+        :param size: Number of server processes, i.e. requests in flight at the same time.
+        :param limits: Per-request timeout and per-server memory cap.
+        """
+        self.cmd = cmd
+        self.size = max(1, size)
+        self.limits = limits
+
+    # ---------------- public API ----------------
+
+    def run(self, times: int, request_extras: Callable[[int], dict] | None = None) -> List[SimulationResult]:
+        """Blocking entry point: run `times` iterations and return results in repetition order."""
+        return asyncio.run(self.run_many(times, request_extras))
+
+    async def run_many(self, times: int, request_extras: Callable[[int], dict] | None = None) -> List[SimulationResult]:
+        """
+        :param request_extras: Optional callback returning extra request fields
+                               (e.g. "seed", "parameters") for an iteration index.
+        """
+        return [result async for result in self.iter_many(times, request_extras)]
+
+    async def iter_many(
+        self, times: int, request_extras: Callable[[int], dict] | None = None
+    ) -> AsyncIterator[SimulationResult]:
+        """Like run_many, but yield each result in repetition order as soon as it is available."""
+        next_index = 0
+
+        async def worker(stream: OrderedStream[SimulationResult]):
+            nonlocal next_index
+            proc = await self._start_worker()
+            try:
+                while next_index < times:
+                    index = next_index
+                    next_index += 1
+                    if proc.returncode is not None:
+                        proc = await self._start_worker()  # the last request took the server down
+                    request = {"iteration": index, **(request_extras(index) if request_extras else {})}
+                    stream.put(index, await self._request(proc, request))
+            finally:
+                await self._stop_worker(proc)
+
+        async with aclosing(iter_in_order(min(self.size, times), worker)) as results:
+            async for result in results:
+                yield result
+
+    # ---------------- internal helpers ----------------
+
+    async def _start_worker(self) -> asyncio.subprocess.Process:
+        return await asyncio.create_subprocess_exec(
+            *self.cmd,
+            stdin=PIPE,
+            stdout=PIPE,
+            limit=self.LINE_LIMIT,
+            **spawn_kwargs(self.limits, cpu_limit=False),
+        )
+
+    async def _request(self, proc: asyncio.subprocess.Process, request: dict) -> SimulationResult:
+        sampler = create_memory_sampler(proc.pid)
+        cpu_before = self._cpu_usage(proc.pid)
+        timeout = self.limits.timeout if self.limits else None
+        start = time.perf_counter()
+        try:
+            sampler.sample()
+            proc.stdin.write((json.dumps(request) + "\n").encode())
+            await proc.stdin.drain()
+            try:
+                line = await asyncio.wait_for(proc.stdout.readline(), timeout)
+            except asyncio.TimeoutError:
+                kill_process_group(proc.pid)
+                await proc.wait()
+                line = None
+            duration = time.perf_counter() - start
+            sampler.sample()
+        except ConnectionError:
+            line, duration = b"", time.perf_counter() - start
+        finally:
+            sampler.close()
+
+        measured = SimulationStats(
+            duration=duration,
+            min_memory=sampler.min_memory,
+            max_memory=sampler.max_memory,
+            mean_memory=sampler.mean_memory,
+            peak_memory=sampler.max_memory,
+        )
+        if line is None:
+            return SimulationResult(stats=measured, result="", status="timeout")
+        if not line:
+            returncode = await proc.wait()
+            status = classify_failure(returncode, "", self.limits, measured.peak_memory)
+            if status is None:
+                raise RuntimeError(f"Simulation server exited with code {returncode}")
+            return SimulationResult(stats=measured, result="", status=status)
+
+        response = json.loads(line)
+        if not isinstance(response, dict):
+            raise ValueError("Simulation server response must be a JSON object")
+        if "error" in response:
+            status = classify_failure(1, str(response["error"]), self.limits)
+            if status is None:
+                raise RuntimeError(f"Simulation server failed:\n{response['error']}")
+            return SimulationResult(stats=measured, result="", status=status)
+
+        if "stats" in response:
+            stats = SimulationStats.from_dict(response["stats"])
+        else:
+            stats = measured
+            cpu_after = self._cpu_usage(proc.pid)
+            if cpu_before and cpu_after:
+                stats.user_time = cpu_after[0] - cpu_before[0]
+                stats.system_time = cpu_after[1] - cpu_before[1]
+                stats.voluntary_switches = cpu_after[2] - cpu_before[2]
+                stats.involuntary_switches = cpu_after[3] - cpu_before[3]
+
+        return SimulationResult.from_output(response.get("output", response), stats)
+
+    @staticmethod
+    def _cpu_usage(pid: int) -> tuple[float, float, int, int] | None:
+        """CPU times and context switches of a live server, or None if unavailable."""
+        try:
+            process = psutil.Process(pid)
+            with process.oneshot():
+                times = process.cpu_times()
+                switches = process.num_ctx_switches()
+        except psutil.Error:
+            return None
+        return times.user, times.system, switches.voluntary, switches.involuntary
+
+    @staticmethod
+    async def _stop_worker(proc: asyncio.subprocess.Process) -> None:
+        if proc.returncode is not None:
+            return
+        try:
+            proc.stdin.close()  # EOF ends the server loop
+            await asyncio.wait_for(proc.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+        except asyncio.CancelledError:
+            proc.kill()
+            await proc.wait()
+            raise
+
+
+class ScriptServerPool(JsonLinesWorkerPool):
+    """Serve a simulation script of any supported language that implements the JSON-lines protocol itself."""
+
+    def __init__(self, script_path: str, size: int = 1, fetcher: JsonFetcher | None = None,
+                 limits: RunLimits | None = None):
+        fetcher = fetcher or JsonFetcher()
+        super().__init__(fetcher.build_cmd(script_path), size, limits)
+        self.script_path = script_path
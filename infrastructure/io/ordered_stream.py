@@ -0,0 +1,102 @@
+import asyncio
+from contextlib import aclosing
+from typing import AsyncIterator, Awaitable, Callable, Generic, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class OrderedStream(Generic[T]):
+    """
+    Collects values completed out of order by concurrent workers and releases them
+    in slot order, as soon as the next expected slot is available.
+    """
+
+    def __init__(self):
+        self._pending: dict[int, T] = {}
+        self._next_slot = 0
+        self._error: BaseException | None = None
+        self._finished = False
+        self._changed = asyncio.Event()
+
+    def put(self, slot: int, value: T) -> None:
+        self._pending[slot] = value
+        self._changed.set()
+
+    def fail(self, error: BaseException) -> None:
+        if self._error is None:
+            self._error = error
+        self._changed.set()
+
+    def finish(self) -> None:
+        """Signal that no more slots will be produced."""
+        self._finished = True
+        self._changed.set()
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        while True:
+            if self._next_slot in self._pending:
+                value = self._pending.pop(self._next_slot)
+                self._next_slot += 1
+                yield value
+                continue
+            if self._error is not None:
+                raise self._error
+            if self._finished:
+                return
+            self._changed.clear()
+            await self._changed.wait()
+
+
+async def iter_in_order(worker_count: int, worker: Callable[[OrderedStream[T]], Awaitable[None]]) -> AsyncIterator[T]:
+    """
+    Run `worker_count` copies of `worker`, each putting its results into a shared
+    OrderedStream, and yield the results in slot order. Closing the iterator early
+    cancels the workers.
+    """
+    stream: OrderedStream[T] = OrderedStream()
+
+    async def supervised():
+        try:
+            await worker(stream)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            stream.fail(e)
+
+    tasks = [asyncio.create_task(supervised()) for _ in range(worker_count)]
+
+    async def finish_when_done():
+        await asyncio.gather(*tasks)
+        stream.finish()
+
+    closer = asyncio.create_task(finish_when_done())
+    try:
+        async with aclosing(stream.__aiter__()) as values:
+            async for value in values:
+                yield value
+    finally:
+        for task in (*tasks, closer):
+            task.cancel()
+        await asyncio.gather(*tasks, closer, return_exceptions=True)
+
+
+def iterate_blocking(make_iterator: Callable[[], AsyncIterator[T]]) -> Iterator[T]:
+    """
+    Drive an async iterator from synchronous code on a private event loop, yielding each
+    value as soon as it is produced. Closing the generator closes the async iterator.
+    """
+    loop = asyncio.new_event_loop()
+    iterator = make_iterator()
+    try:
+        while True:
+            try:
+                value = loop.run_until_complete(iterator.__anext__())
+            except StopAsyncIteration:
+                return
+            yield value
+    finally:
+        try:
+            loop.run_until_complete(iterator.aclose())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
@@ -0,0 +1,58 @@
+import codecs
+import tempfile
+from typing import Iterator
+
+
+class OutputCapture:
+    """
+    Bounded-memory capture of a child process stream.
+
+    Output is kept in memory up to `spool_size` bytes and spilled to an anonymous
+    temporary file beyond that, so a simulation printing a huge output costs disk
+    rather than harness memory. The captured text is read back in chunks.
+    """
+
+    SPOOL_SIZE = 8 * 1024 * 1024
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, spool_size: int = SPOOL_SIZE):
+        self.spool_size = spool_size
+        self.size = 0
+        self._file = tempfile.SpooledTemporaryFile(max_size=spool_size)
+
+    def __enter__(self) -> "OutputCapture":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __bool__(self) -> bool:
+        return self.size > 0
+
+    @property
+    def spilled(self) -> bool:
+        """Whether the output outgrew memory and lives in the temporary file."""
+        return self.size > self.spool_size
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+        self.size += len(chunk)
+
+    def iter_text(self, encoding: str = "utf-8") -> Iterator[str]:
+        """Yield the captured output as decoded text chunks."""
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._file.seek(0)
+        while chunk := self._file.read(self.CHUNK_SIZE):
+            yield decoder.decode(chunk)
+        yield decoder.decode(b"", final=True)
+
+    def text(self, encoding: str = "utf-8") -> str:
+        return "".join(self.iter_text(encoding))
+
+    def tail(self, limit: int = CHUNK_SIZE, encoding: str = "utf-8") -> str:
+        """Return the last `limit` bytes of output, e.g. the end of an error trace."""
+        self._file.seek(max(0, self.size - limit))
+        return self._file.read(limit).decode(encoding, errors="replace")
+
+    def close(self) -> None:
+        self._file.close()
@@ -0,0 +1,87 @@
+import math
+import os
+import signal
+from typing import Literal
+
+from domain.run_limits import RunLimits
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MB = 1024 * 1024
+
+# stderr markers of an allocation failure, for the runtimes we spawn
+OOM_MARKERS = ("MemoryError", "Cannot allocate memory", "std::bad_alloc", "OutOfMemory", "out of memory")
+# share of the memory cap a run must have reached for a SIGKILL / SIGSEGV to count as "oom"
+OOM_PEAK_SHARE = 0.8
+
+
+def spawn_kwargs(limits: RunLimits | None, cpu_limit: bool = True) -> dict:
+    """
+    Extra Popen/create_subprocess_exec arguments enforcing `limits` on a child: it gets
+    its own process group (so it can be killed with everything it started) and
+    RLIMIT_AS / RLIMIT_CPU caps applied between fork and exec.
+
+    The timeout itself is enforced on wall-clock time by the caller; RLIMIT_CPU is only
+    a backstop in case that deadline is missed. CPU time adds up across threads, so the
+    cap is scaled by the number of CPUs a multi-threaded run (e.g. NumPy/BLAS) can keep
+    busy and can't fire before the wall-clock deadline.
+
+    :param cpu_limit: Set False for long-lived servers, whose CPU time adds up across runs.
+    """
+    if not limits or os.name != "posix":
+        return {}
+
+    def apply_rlimits():
+        if limits.memory_mb is not None:
+            cap = int(limits.memory_mb * MB)
+            resource.setrlimit(resource.RLIMIT_AS, (cap, cap))
+        if cpu_limit and limits.timeout is not None:
+            # backstop for the wall-clock timeout: SIGXCPU once the CPU budget is spent
+            seconds = math.ceil(limits.timeout * usable_cpus()) + 1
+            resource.setrlimit(resource.RLIMIT_CPU, (seconds, seconds + 1))
+
+    return {"start_new_session": True, "preexec_fn": apply_rlimits}
+
+
+def usable_cpus() -> int:
+    """Number of CPUs this process (and so a spawned child) may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+def kill_process_group(pid: int) -> None:
+    """Kill a child started with spawn_kwargs() together with its whole process group."""
+    try:
+        if os.name == "posix":
+            os.killpg(pid, signal.SIGKILL)
+        else:
+            os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+
+
+def classify_failure(returncode: int | None, stderr: str, limits: RunLimits | None,
+                     peak_mb: float | None = None) -> Literal["timeout", "oom"] | None:
+    """
+    Tell whether a failed run was stopped by one of its limits. Any other crash
+    (a genuine segfault or abort included) is not, and is left to the caller to raise.
+
+    :param peak_mb: Measured memory peak of the run, telling a kill by the OOM killer or a
+                    crash on a failed allocation apart from an unrelated fatal signal.
+    """
+    if not limits or returncode in (None, 0):
+        return None
+    if limits.timeout is not None and hasattr(signal, "SIGXCPU") and returncode == -signal.SIGXCPU:
+        return "timeout"
+    if limits.memory_mb is not None:
+        if any(marker in stderr for marker in OOM_MARKERS):
+            return "oom"
+        fatal_signals = ("SIGKILL", "SIGSEGV")
+        near_cap = peak_mb is not None and peak_mb >= OOM_PEAK_SHARE * limits.memory_mb
+        if near_cap and returncode in {-getattr(signal, name) for name in fatal_signals if hasattr(signal, name)}:
+            return "oom"
+    return None
@@ -0,0 +1,193 @@
+"""
+Long-lived Python worker used by the "warm" simulation mode.
+
+Usage: python warm_python_worker.py <script_path>
+
+The worker imports the script's dependencies once, then reads one JSON request per
+line from stdin and answers each one with a single JSON line on stdout:
+
+    request : {"iteration": 3}
+    response: {"output": <JSON printed by the script>, "stats": {...}}
+          or: {"error": "traceback text"}
+
+The script body is executed with runpy for every request, with its prints captured,
+so each repetition only pays for the script itself and not for interpreter startup.
+
+Stats are per-run deltas: times and counters are what the run added, and memory
+figures are the resident memory the run used above the worker's own at its start.
+The peak is the run's own high-water mark: on Linux the kernel's is reset before
+every run (/proc/self/clear_refs) and read back after it (VmHWM), elsewhere a
+thread samples the resident memory while the script runs.
+This file must stay standard-library only: it runs outside the application.
+"""
+import ast
+import contextlib
+import importlib
+import io
+import json
+import os
+import runpy
+import sys
+import threading
+import time
+import traceback
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MB = 1024 * 1024
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def preimport(script_path: str) -> None:
+    """Import every absolute module the script imports, ignoring the ones that fail."""
+    with open(script_path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=script_path)
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                pass  # let the script report its own import errors
+
+
+def current_rss() -> float:
+    """Resident memory of this worker in MB (0.0 where it can't be read cheaply)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE / MB
+    except (OSError, IndexError, ValueError):
+        return 0.0
+
+
+def reset_peak_rss() -> bool:
+    """Reset the kernel's high-water mark of this worker to its current RSS; False if unsupported."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss() -> float | None:
+    """High-water mark of this worker's resident memory in MB since the last reset, if known."""
+    try:
+        with open("/proc/self/status", "rb") as f:
+            for line in f:
+                if line.startswith(b"VmHWM:"):
+                    return int(line.split()[1]) * 1024 / MB
+    except (OSError, IndexError, ValueError):
+        pass
+    return None
+
+
+class RssSampler(threading.Thread):
+    """Sample the resident memory while a run executes: densely at first, then backing off."""
+
+    def __init__(self, initial_interval: float = 0.001, max_interval: float = 0.05, growth: float = 1.25):
+        super().__init__(daemon=True)
+        self.samples: list[float] = []
+        self._interval = initial_interval
+        self._max_interval = max_interval
+        self._growth = growth
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self.samples.append(current_rss())
+            self._interval = min(self._max_interval, self._interval * self._growth)
+
+    def stop(self) -> list[float]:
+        self._stopped.set()
+        self.join()
+        return self.samples
+
+
+def usage():
+    return resource.getrusage(resource.RUSAGE_SELF) if resource else None
+
+
+def run_once(script_path: str) -> dict:
+    """Execute the script body once and measure it from inside the worker."""
+    buffer = io.StringIO()
+    rss_before = current_rss()
+    exact_peak = reset_peak_rss()
+    sampler = RssSampler()
+    usage_before = usage()
+    start = time.perf_counter()
+    sampler.start()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            runpy.run_path(script_path, run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            return {"error": f"Script exited with code {e.code}"}
+    except BaseException:
+        return {"error": traceback.format_exc()}
+    finally:
+        samples = [rss_before, *sampler.stop(), current_rss()]
+    duration = time.perf_counter() - start
+    usage_after = usage()
+
+    # the sampler can miss a short-lived peak, the kernel's high-water mark can't
+    peak = max(samples)
+    if exact_peak:
+        peak = max(peak, peak_rss() or 0.0)
+
+    def delta(rss: float) -> float:
+        return max(0.0, rss - rss_before)
+
+    stats = {
+        "duration": duration,
+        "min_memory": delta(min(samples)),
+        "max_memory": delta(peak),
+        "mean_memory": delta(sum(samples) / len(samples)),
+        "peak_memory": delta(peak),
+    }
+    if usage_before and usage_after:
+        stats.update({
+            "user_time": usage_after.ru_utime - usage_before.ru_utime,
+            "system_time": usage_after.ru_stime - usage_before.ru_stime,
+            "voluntary_switches": usage_after.ru_nvcsw - usage_before.ru_nvcsw,
+            "involuntary_switches": usage_after.ru_nivcsw - usage_before.ru_nivcsw,
+            "major_faults": usage_after.ru_majflt - usage_before.ru_majflt,
+            "minor_faults": usage_after.ru_minflt - usage_before.ru_minflt,
+        })
+
+    output = buffer.getvalue().strip()
+    try:
+        return {"output": json.loads(output), "stats": stats}
+    except json.JSONDecodeError as e:
+        return {"error": f"Invalid JSON: {e}"}
+
+
+def main() -> None:
+    script_path = os.path.abspath(sys.argv[1])
+
+    # keep a private channel for responses; anything written straight to fd 1 goes to stderr
+    channel = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    sys.argv = [script_path]
+    sys.path.insert(0, os.path.dirname(script_path))
+    preimport(script_path)
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        channel.write(json.dumps(run_once(script_path)) + "\n")
+        channel.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+import os
+
+from domain.run_limits import RunLimits
+from infrastructure.io.json_fetcher import JsonFetcher
+from infrastructure.io.json_lines_worker_pool import JsonLinesWorkerPool
+
+WORKER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "warm_python_worker.py")
+
+
+class WarmWorkerPool(JsonLinesWorkerPool):
+    """
+    Run a .py simulation repeatedly inside long-lived worker interpreters.
+
+    Each worker imports the script's dependencies once and then executes the script
+    body on request (see warm_python_worker.py), measuring every run from inside.
+    """
+
+    def __init__(self, script_path: str, size: int = 1, fetcher: JsonFetcher | None = None,
+                 limits: RunLimits | None = None):
+        """
+        :param script_path: The .py simulation script to keep warm.
+        :param size: Number of worker interpreters, i.e. runs in flight at the same time.
+        """
+        if os.path.splitext(script_path)[1].lower() != ".py":
+            raise ValueError(f"Warm workers only run Python scripts, got: {script_path}")
+        fetcher = fetcher or JsonFetcher()
+        super().__init__(fetcher.build_cmd(WORKER_PATH) + [script_path], size, limits)
+        self.script_path = script_path
@@ -0,0 +1,177 @@
+import copy
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional, List
+
+from application.ports.i_repository import IRepository
+from domain.test import Test
+from domain.test_summary import TestSummary
+from infrastructure.persistence.json_repository import Repository
+from interface.GUI.gui_config import GUIConfig
+
+
+class _CachedEntry:
+    """A stored test as parsed once: its entry without the reference, and the reference entries."""
+
+    __slots__ = ("meta", "reference")
+
+    def __init__(self, meta: dict[str, Any], reference: list[dict[str, Any]]):
+        self.meta = meta
+        self.reference = reference
+
+
+class CachedRepository(IRepository):
+    """
+    Decorator of the single-file JSON Repository keeping the parsed tests in memory,
+    keyed by name.
+
+    The file is parsed once and again only when it is replaced or its modification time
+    or size changes, e.g. because another process wrote it. Writes go through to the
+    wrapped repository and update the cache in place. Reads hand out detached Tests:
+    their small entry is copied, and their reference is copied from the cache only when
+    it is first accessed. Mutating a returned Test never alters the cache.
+    """
+
+    def __init__(self, inner: Repository, watch_file: Path | None = None):
+        """
+        :param inner: Repository doing the actual reads and writes.
+        :param watch_file: File whose changes invalidate the cache (defaults to inner.test_file).
+        """
+        self.inner = inner
+        self.watch_file: Path = Path(watch_file or inner.test_file)
+        self._entries: dict[str, _CachedEntry] | None = None
+        self._stamp: tuple[int, int, int] | None = None
+
+    # ---------------- Transactions ----------------
+
+    @contextmanager
+    def transaction(self) -> Iterator["CachedRepository"]:
+        """Run the block in a transaction of the wrapped repository; the cache follows its writes."""
+        try:
+            with self.inner.transaction():
+                yield self
+        except BaseException:
+            # the cache may hold writes that were rolled back
+            self.invalidate()
+            raise
+        if self._entries is not None:
+            # the cache reflects the committed state, whatever the stamp was while pending
+            self._stamp = self._file_stamp()
+
+    def close(self) -> None:
+        self.inner.close()
+        self.invalidate()
+
+    # ---------------- Configurations ----------------
+
+    def save_gui_config(self, config: "GUIConfig") -> None:
+        self.inner.save_gui_config(config)
+
+    def load_gui_config(self) -> "GUIConfig":
+        return self.inner.load_gui_config()
+
+    # ---------------- Tests ----------------
+
+    def save_test(self, test: Test) -> None:
+        fresh = self._is_fresh()
+        self.inner.save_test(test)
+        if fresh and test.name not in self._entries:
+            # like the inner repository, the first entry with a name wins
+            self._entries[test.name] = self._snapshot(test)
+        self._after_write(fresh)
+
+    def get_all_tests(self) -> List[Test]:
+        return [self._to_test(entry) for entry in self._load().values()]
+
+    def get_test_by_name(self, name: str) -> Optional[Test]:
+        entry = self._load().get(name)
+        return self._to_test(entry) if entry is not None else None
+
+    def list_test_names(self) -> List[str]:
+        return list(self._load())
+
+    def get_test_summary(self, name: str) -> Optional[TestSummary]:
+        entry = self._load().get(name)
+        if entry is None:
+            return None
+        # from_entry only reads the entry, and the reference count is known without parsing anything
+        return TestSummary.from_entry(entry.meta, len(entry.reference))
+
+    def update_test(self, test: "Test") -> None:
+        fresh = self._is_fresh()
+        previous = self._entries.get(test.name) if fresh else None
+        self.inner.update_test(test)
+        if fresh:
+            # the updated entry moves to the end of the file
+            self._entries.pop(test.name, None)
+            self._entries[test.name] = self._snapshot(test, previous)
+        self._after_write(fresh)
+
+    def remove_test(self, test: "Test") -> None:
+        fresh = self._is_fresh()
+        self.inner.remove_test(test)
+        if fresh:
+            self._entries.pop(test.name, None)
+        self._after_write(fresh)
+
+    def invalidate(self) -> None:
+        """Drop the cache; the next read parses the file again."""
+        self._entries = None
+        self._stamp = None
+
+    # ---------------- Helpers ----------------
+
+    def _load(self) -> dict[str, _CachedEntry]:
+        if not self._is_fresh():
+            stamp = self._file_stamp()  # taken first: a write landing during the read triggers a reparse
+            entries: dict[str, _CachedEntry] = {}
+            for entry in self.inner.read_entries():
+                name = entry.get("name")
+                if name not in entries:
+                    # the entries may be the wrapped repository's own: build the meta, don't pop
+                    meta = {key: value for key, value in entry.items() if key != "reference"}
+                    entries[name] = _CachedEntry(meta, entry.get("reference") or [])
+            self._entries = entries
+            self._stamp = stamp
+        return self._entries
+
+    def _is_fresh(self) -> bool:
+        return self._entries is not None and self._stamp == self._file_stamp()
+
+    def _after_write(self, fresh: bool) -> None:
+        # a cache that was stale before the write can't be patched, reparse on next read
+        if fresh:
+            self._stamp = self._file_stamp()
+        else:
+            self.invalidate()
+
+    @staticmethod
+    def _snapshot(test: Test, previous: _CachedEntry | None = None) -> _CachedEntry:
+        """A cache entry independent of `test`, reusing the cached reference if it was never loaded."""
+        meta = copy.deepcopy(Repository._test_to_entry(test, include_reference=False))
+        if previous is not None and not test.reference_loaded:
+            return _CachedEntry(meta, previous.reference)
+        reference = [
+            {"parameters": copy.deepcopy(ref.parameters), "result": copy.deepcopy(ref.result)}
+            for ref in (test.reference or [])
+        ]
+        return _CachedEntry(meta, reference)
+
+    @staticmethod
+    def _to_test(entry: _CachedEntry) -> Test:
+        reference = entry.reference
+
+        def load_reference() -> list[dict[str, Any]]:
+            # copied on first access only, so the cached entries stay untouched
+            return [{"parameters": dict(ref.get("parameters") or {}), "result": ref.get("result")} for ref in reference]
+
+        return Repository._entry_to_test(copy.deepcopy(entry.meta), load_reference, len(reference))
+
+    def _file_stamp(self) -> tuple[int, int, int] | None:
+        try:
+            stat = os.stat(self.watch_file)
+        except FileNotFoundError:
+            return None
+        # the inode tells apart an atomic replace keeping the same mtime and size
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
@@ -1,10 +1,16 @@
 import json
+import os
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List, Any
+from typing import Callable, Iterator, Optional, List, Any
 from application.ports.i_repository import IRepository
+from domain.parameter_schema import ParameterSchema
+from domain.reference_matching import ReferenceMatching
 from domain.simulation import Simulation
 from domain.test import Test, TestCriteria
 from domain.test_reference import TestReference
+from domain.test_summary import TestSummary
 from infrastructure.environment.environment import Env
 from interface.GUI.gui_config import GUIConfig
 
@@ -16,6 +22,10 @@ class Repository(IRepository):
         self.data_dir: Path = Env.get_data_dir()
         self.test_file: Path = self.data_dir.joinpath("tests.json")
         self.gui_config_file: Path = self.data_dir.joinpath("gui_config.json")
+        # entries of an open transaction, encoded so every read gets its own copy like a
+        # read from disk; flushed to test_file when the transaction ends
+        self._pending: str | None = None
+        self._depth = 0
 
     # ---------------- Configurations ----------------
 
@@ -53,179 +63,198 @@ class Repository(IRepository):
                 setattr(cfg, key, value)
         return cfg
 
+    # ---------------- Transactions ----------------
+
+    @contextmanager
+    def transaction(self) -> Iterator["Repository"]:
+        """
+        Apply all writes of the block to an in-memory copy of tests.json and write the
+        file once, atomically, on exit. An exception discards every change of the block.
+        Nested transactions join the outermost one.
+        """
+        if self._depth == 0:
+            self._pending = json.dumps(self._load_json(self.test_file))
+        self._depth += 1
+        try:
+            yield self
+            if self._depth == 1:
+                self._save_json(self.test_file, json.loads(self._pending))
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._pending = None
+
     # ---------------- Tests ----------------
 
     def save_test(self, test: Test) -> None:
         """Save a Test with its simulation reference, criteria, and reference."""
-        test_entry = {
-            "name": test.name,
-            "description": test.description,
-            "simulation": {
-                "name": test.simulation.name,
-                "script_path": test.simulation.script_path,
-                "description": test.simulation.description,
-            } if test.simulation else None,
-            "criteria": {
-                "duration": test.criteria.duration if test.criteria else "",
-                "max_memory": test.criteria.max_memory if test.criteria else "",
-                "mean_memory": test.criteria.mean_memory if test.criteria else "",
-                "compliance_rate": test.criteria.compliance_rate if test.criteria else "",
-            },
-            "reference_source": test.reference_source,
-            "reference": [
-                {
-                    "parameters": ref.parameters,
-                    "result": ref.result,
-                }
-                for ref in (test.reference or [])
-            ],
-        }
-
-        data = self._load_json(self.test_file)
-        data.append(test_entry)
-        self._save_json(self.test_file, data)
+        data = self._read_tests()
+        data.append(self._test_to_entry(test))
+        self._write_tests(data)
 
     def get_all_tests(self) -> List[Test]:
         """Retrieve all tests, rebuilding Simulation, TestCriteria, and TestReference list if present."""
-        data = self._load_json(self.test_file)
-        all_tests: List[Test] = []
-
-        for entry in data:
-            # --- rebuild Simulation ---
-            sim_data = entry.get("simulation")
-            simulation = (
-                Simulation(
-                    name=sim_data["name"],
-                    script_path=sim_data["script_path"],
-                    description=sim_data.get("description", ""),
-                )
-                if sim_data
-                else None
-            )
-
-            # --- rebuild TestCriteria ---
-            crit_data = entry.get("criteria")
-            criteria = (
-                TestCriteria(
-                    duration=crit_data.get("duration"),
-                    max_memory=crit_data.get("max_memory"),
-                    mean_memory=crit_data.get("mean_memory"),
-                    compliance_rate=crit_data.get("compliance_rate"),
-                )
-                if crit_data
-                else None
-            )
-            # --- rebuild reference source ---
-            ref_source_data = entry.get("reference_source", [])
-            reference_source = ref_source_data[0] if ref_source_data else None
-
-            # --- rebuild TestReference ---
-            ref_data = entry.get("reference", [])
-            reference = [
-                TestReference(
-                    parameters=ref.get("parameters", {}),
-                    result=ref.get("result", None),
-                )
-                for ref in ref_data
-            ]
-
-            # --- assemble Test ---
-            test = Test(
-                test_name=entry["name"],
-                description=entry.get("description", ""),
-            )
-            test.simulation = simulation
-            test.criteria = criteria
-            test.reference_source = reference_source
-            test.reference = reference
-
-            all_tests.append(test)
-
-        return all_tests
+        data = self._read_tests()
+        return [self._entry_to_test(entry) for entry in data]
 
     def get_test_by_name(self, name: str) -> Optional[Test]:
         """Retrieve a Test by name, rebuilding Simulation, TestCriteria, and TestReference list if present."""
-        data = self._load_json(self.test_file)
+        data = self._read_tests()
 
         for entry in data:
             if entry.get("name") == name:
-                # --- rebuild Simulation ---
-                sim_data = entry.get("simulation")
-                simulation = (
-                    Simulation(
-                        name=sim_data["name"],
-                        script_path=sim_data["script_path"],
-                        description=sim_data.get("description", ""),
-                    )
-                    if sim_data
-                    else None
-                )
+                return self._entry_to_test(entry)
 
-                # --- rebuild TestCriteria ---
-                crit_data = entry.get("criteria")
-                criteria = (
-                    TestCriteria(
-                        duration=crit_data.get("duration"),
-                        max_memory=crit_data.get("max_memory"),
-                        mean_memory=crit_data.get("mean_memory"),
-                        compliance_rate=crit_data.get("compliance_rate"),
-                    )
-                    if crit_data
-                    else None
-                )
+        return None
 
-                # --- rebuild reference source ---
-                ref_source_data = entry.get("reference_source", [])
-                reference_source = ref_source_data if ref_source_data else None
-
-                # --- rebuild TestReference ---
-                ref_data = entry.get("reference", [])
-                reference = [
-                    TestReference(
-                        parameters=ref.get("parameters", {}),
-                        result=ref.get("result", None),
-                    )
-                    for ref in ref_data
-                ]
-
-                # --- assemble Test ---
-                test = Test(
-                    test_name=entry["name"],
-                    description=entry.get("description", ""),
-                )
-                test.simulation = simulation
-                test.criteria = criteria
-                test.reference_source = reference_source
-                test.reference = reference
-                return test
+    def read_entries(self) -> list[dict[str, Any]]:
+        """Stored entries of all tests in the JSON document layout, without building Test objects."""
+        return self._read_tests()
 
+    def list_test_names(self) -> List[str]:
+        """Names of all tests, without rebuilding them."""
+        return [entry.get("name") for entry in self._read_tests()]
+
+    def get_test_summary(self, name: str) -> Optional[TestSummary]:
+        """Configuration of a test without building its reference points."""
+        for entry in self._read_tests():
+            if entry.get("name") == name:
+                return TestSummary.from_entry(entry)
         return None
 
     def update_test(self, test: "Test") -> None:
-        """Update an existing test by removing the old entry and saving the new one."""
-        data = self._load_json(self.test_file)
+        """Update an existing test by removing the old entry and appending the new one, in a single write."""
+        data = self._read_tests()
         # Remove any existing entry with the same name
         new_data = [entry for entry in data if entry.get("name") != test.name]
 
         if len(new_data) == len(data):
             raise ValueError(f"Test with name '{test.name}' not found for update.")
 
-        # Save the updated test using the existing save_test logic
-        self._save_json(self.test_file, new_data)  # first save the data without the old test
-        self.save_test(test)  # now append the updated test
+        new_data.append(self._test_to_entry(test))
+        self._write_tests(new_data)
 
     def remove_test(self, test: "Test") -> None:
         """Remove a test entry by its name."""
-        data = self._load_json(self.test_file)
+        data = self._read_tests()
         new_data = [entry for entry in data if entry.get("name") != test.name]
 
         if len(new_data) == len(data):
             raise ValueError(f"Test with name '{test.name}' not found for removal.")
 
-        self._save_json(self.test_file, new_data)
+        self._write_tests(new_data)
 
     # ---------------- Helpers ----------------
 
+    def _read_tests(self) -> list:
+        # a detached copy: callers may change the entries without touching the stored ones
+        if self._pending is not None:
+            return json.loads(self._pending)
+        return self._load_json(self.test_file)
+
+    def _write_tests(self, data: list) -> None:
+        if self._pending is not None:
+            self._pending = json.dumps(data)
+        else:
+            self._save_json(self.test_file, data)
+
+    @staticmethod
+    def _test_to_entry(test: Test, include_reference: bool = True) -> dict[str, Any]:
+        """
+        :param include_reference: False leaves out the "reference" key, and with it the
+                                  loading of a lazily loaded reference.
+        """
+        entry = {
+            "name": test.name,
+            "description": test.description,
+            "simulation": {
+                "name": test.simulation.name,
+                "script_path": test.simulation.script_path,
+                "description": test.simulation.description,
+                "mode": test.simulation.mode,
+            } if test.simulation else None,
+            "criteria": (
+                test.criteria.as_dict() if test.criteria
+                else {name: "" for name in TestCriteria.FIELDS}
+            ),
+            "reference_source": test.reference_source,
+            "reference_matching": test.reference_matching.as_dict() if test.reference_matching else None,
+            "parameter_schema": test.parameter_schema.as_dict() if test.parameter_schema else None,
+        }
+        if include_reference:
+            entry["reference"] = [
+                {
+                    "parameters": ref.parameters,
+                    "result": ref.result,
+                }
+                for ref in (test.reference or [])
+            ]
+        return entry
+
+    @staticmethod
+    def _entry_to_test(entry: dict[str, Any], load_reference: Callable[[], list[dict]] | None = None,
+                       reference_count: int | None = None) -> Test:
+        """
+        :param load_reference: Returns the stored reference entries when the reference is
+                               first accessed; by default they are read from entry["reference"].
+        """
+        # --- rebuild Simulation ---
+        sim_data = entry.get("simulation")
+        simulation = (
+            Simulation(
+                name=sim_data["name"],
+                script_path=sim_data["script_path"],
+                description=sim_data.get("description", ""),
+                mode=sim_data.get("mode", "process"),
+            )
+            if sim_data
+            else None
+        )
+
+        # --- rebuild TestCriteria ---
+        crit_data = entry.get("criteria")
+        criteria = TestCriteria.from_dict(crit_data) if crit_data else None
+
+        # --- rebuild reference source ---
+        # the stored path or URL as a whole, an empty one meaning none (get_all_tests used
+        # to keep only its first character)
+        reference_source = entry.get("reference_source") or None
+
+        # --- rebuild ReferenceMatching ---
+        matching_data = entry.get("reference_matching")
+        reference_matching = ReferenceMatching.from_dict(matching_data) if matching_data else None
+
+        # --- rebuild ParameterSchema ---
+        schema_data = entry.get("parameter_schema")
+        parameter_schema = ParameterSchema.from_dict(schema_data) if schema_data else None
+
+        # --- rebuild TestReference, on first access ---
+        if load_reference is None:
+            ref_data = entry.get("reference", [])
+            load_reference, reference_count = (lambda: ref_data), len(ref_data)
+
+        def reference():
+            return [
+                TestReference(
+                    parameters=ref.get("parameters", {}),
+                    result=ref.get("result", None),
+                )
+                for ref in load_reference()
+            ]
+
+        # --- assemble Test ---
+        test = Test(
+            test_name=entry["name"],
+            description=entry.get("description", ""),
+        )
+        test.simulation = simulation
+        test.criteria = criteria
+        test.reference_source = reference_source
+        test.parameter_schema = parameter_schema
+        test.set_reference_loader(reference, reference_count)
+        test.reference_matching = reference_matching
+        return test
+
     @staticmethod
     def _load_json(file_path: Path) -> list:
         if file_path.exists():
@@ -238,6 +267,17 @@ class Repository(IRepository):
 
     @staticmethod
     def _save_json(file_path: Path, data: list) -> None:
+        """Write through a temporary file and rename it over the target, so readers never see a partial file."""
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        with file_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp creates the file owner-only; keep the target's permissions
+            os.chmod(tmp_path, file_path.stat().st_mode if file_path.exists() else 0o644)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
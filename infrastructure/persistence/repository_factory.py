@@ -0,0 +1,23 @@
+from application.ports.i_repository import IRepository
+from infrastructure.environment.environment import Env
+from infrastructure.persistence.cached_repository import CachedRepository
+from infrastructure.persistence.json_repository import Repository
+from infrastructure.persistence.sharded_json_repository import ShardedJsonRepository
+from infrastructure.persistence.sqlite_repository import SqliteRepository
+
+
+class RepositoryFactory:
+    @staticmethod
+    def create(backend: str | None = None) -> IRepository:
+        """
+        Return the repository for the configured storage backend (Env.get_storage_backend()).
+        The single JSON file is wrapped in a cache; the other backends read one test at a time.
+        """
+        backend = backend or Env.get_storage_backend()
+        if backend not in Env.STORAGE_BACKENDS:
+            raise ValueError(f"Unknown storage backend '{backend}'. Valid options: {', '.join(Env.STORAGE_BACKENDS)}")
+        if backend == "sqlite":
+            return SqliteRepository()
+        if backend == "sharded":
+            return ShardedJsonRepository()
+        return CachedRepository(Repository())
@@ -0,0 +1,168 @@
+import hashlib
+import json
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional, List
+
+from domain.test import Test
+from domain.test_summary import TestSummary
+from infrastructure.persistence.json_repository import Repository
+
+
+class ShardedJsonRepository(Repository):
+    """
+    JSON repository storing every test in files of its own:
+
+        tests/index.json                 names of all tests, in creation order
+        tests/<key>.json                 description, simulation, criteria, matching, schema
+        tests/<key>.reference.json       reference points
+
+    A test's file key is derived from its name, so looking up, updating or removing one
+    test only touches that test's files, whatever the size of the suite. The index is
+    rewritten only when tests are added or removed, and the reference file only when
+    the reference actually changed.
+    """
+
+    def __init__(self, shard_dir: Path | None = None):
+        """
+        :param shard_dir: Directory of the test files, by default "tests" in the data directory.
+        """
+        super().__init__()
+        self.shard_dir: Path = Path(shard_dir) if shard_dir else self.data_dir.joinpath("tests")
+        self.index_file: Path = self.shard_dir.joinpath("index.json")
+        # files written (or deleted, as None) by an open transaction, flushed when it ends
+        self._pending_files: dict[Path, Any] | None = None
+
+    # ---------------- Transactions ----------------
+
+    @contextmanager
+    def transaction(self) -> Iterator["ShardedJsonRepository"]:
+        """
+        Keep all file writes of the block in memory and flush them on exit, each file
+        atomically and the index last. An exception discards every change of the block.
+        """
+        if self._depth == 0:
+            self._pending_files = {}
+        self._depth += 1
+        try:
+            yield self
+            if self._depth == 1:
+                pending, self._pending_files = self._pending_files, None
+                for path in sorted(pending, key=lambda p: p == self.index_file):
+                    self._flush(path, pending[path])
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._pending_files = None
+
+    # ---------------- Tests ----------------
+
+    def save_test(self, test: Test) -> None:
+        """Save a new Test: its own files, then its name in the index."""
+        names = self._read_index()
+        if test.name in names:
+            raise ValueError(f"Test with name '{test.name}' already exists.")
+        self._write_test(test)
+        self._write(self.index_file, names + [test.name])
+
+    def get_all_tests(self) -> List[Test]:
+        """Retrieve all tests listed in the index."""
+        tests = (self.get_test_by_name(name) for name in self._read_index())
+        return [test for test in tests if test is not None]
+
+    def get_test_by_name(self, name: str) -> Optional[Test]:
+        """Retrieve a Test from its own files only; the reference file is read when first needed."""
+        meta = self._read(self._meta_file(name))
+        if meta is None:
+            return None
+        reference_file = self._reference_file(name)
+        return self._entry_to_test(
+            meta, lambda: self._read(reference_file) or [], meta.get("reference_count")
+        )
+
+    def list_test_names(self) -> List[str]:
+        return self._read_index()
+
+    def get_test_summary(self, name: str) -> Optional[TestSummary]:
+        """Configuration of a test from its metadata file alone."""
+        meta = self._read(self._meta_file(name))
+        if meta is None:
+            return None
+        count = meta.get("reference_count")
+        if count is None:
+            count = len(self._read(self._reference_file(name)) or [])
+        return TestSummary.from_entry(meta, count)
+
+    def update_test(self, test: "Test") -> None:
+        """Rewrite the files of an existing test; the index is left alone."""
+        if self._read(self._meta_file(test.name)) is None:
+            raise ValueError(f"Test with name '{test.name}' not found for update.")
+        self._write_test(test)
+
+    def remove_test(self, test: "Test") -> None:
+        """Remove a test's files and its name from the index."""
+        names = self._read_index()
+        if test.name not in names:
+            raise ValueError(f"Test with name '{test.name}' not found for removal.")
+        self._write(self._meta_file(test.name), None)
+        self._write(self._reference_file(test.name), None)
+        self._write(self.index_file, [name for name in names if name != test.name])
+
+    # ---------------- Helpers ----------------
+
+    @staticmethod
+    def file_key(name: str) -> str:
+        """File name stem of a test: a readable slug of its name plus a hash keeping distinct names apart."""
+        slug = re.sub(r"[^A-Za-z0-9_-]+", "_", name).strip("_")[:40] or "test"
+        return f"{slug}-{hashlib.sha1(name.encode('utf-8')).hexdigest()[:10]}"
+
+    def _meta_file(self, name: str) -> Path:
+        return self.shard_dir.joinpath(f"{self.file_key(name)}.json")
+
+    def _reference_file(self, name: str) -> Path:
+        return self.shard_dir.joinpath(f"{self.file_key(name)}.reference.json")
+
+    def _read_index(self) -> list[str]:
+        return self._read(self.index_file) or []
+
+    def _write_test(self, test: Test) -> None:
+        previous = self._read(self._meta_file(test.name))
+        meta = self._test_to_entry(test, include_reference=False)
+
+        if previous is not None and not test.reference_loaded:
+            # never loaded, so unchanged: the stored reference file stays as it is
+            meta["reference_digest"] = previous.get("reference_digest")
+            meta["reference_count"] = previous.get("reference_count")
+        else:
+            reference = self._test_to_entry(test)["reference"]
+            encoded = json.dumps(reference, separators=(",", ":"))
+            meta["reference_digest"] = hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+            meta["reference_count"] = len(reference)
+            if previous is None or previous.get("reference_digest") != meta["reference_digest"]:
+                self._write(self._reference_file(test.name), reference)
+        self._write(self._meta_file(test.name), meta)
+
+    def _read(self, path: Path) -> Any:
+        if self._pending_files is not None and path in self._pending_files:
+            return json.loads(json.dumps(self._pending_files[path]))  # detached, like a read from disk
+        if not path.exists():
+            return None
+        with path.open("r", encoding="utf-8") as f:
+            try:
+                return json.load(f)
+            except json.JSONDecodeError:
+                return None
+
+    def _write(self, path: Path, data: Any) -> None:
+        """Write `data` to `path`, or delete it for None; deferred inside a transaction."""
+        if self._pending_files is not None:
+            self._pending_files[path] = data
+        else:
+            self._flush(path, data)
+
+    def _flush(self, path: Path, data: Any) -> None:
+        if data is None:
+            path.unlink(missing_ok=True)
+        else:
+            self._save_json(path, data)
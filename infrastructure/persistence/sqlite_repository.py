@@ -0,0 +1,255 @@
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional, List
+
+from application.ports.i_repository import IRepository
+from domain.test import Test, TestCriteria
+from domain.test_summary import TestSummary
+from infrastructure.environment.environment import Env
+from infrastructure.persistence.json_repository import Repository
+from interface.GUI.gui_config import GUIConfig
+
+
+class SqliteRepository(IRepository):
+    """
+    Repository persisting tests in an SQLite database.
+
+    Tests, their criteria and their reference points live in separate tables, so a test
+    is looked up through the index on its name and loaded without touching the others.
+    The database runs in WAL mode: readers never block on a writer, and concurrent
+    writers wait for each other instead of overwriting each other's changes.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tests (
+            id                 INTEGER PRIMARY KEY,
+            name               TEXT NOT NULL UNIQUE,
+            description        TEXT NOT NULL DEFAULT '',
+            simulation         TEXT,
+            reference_source   TEXT,
+            reference_matching TEXT,
+            parameter_schema   TEXT
+        );
+        CREATE TABLE IF NOT EXISTS criteria (
+            test_id INTEGER NOT NULL REFERENCES tests(id) ON DELETE CASCADE,
+            name    TEXT NOT NULL,
+            value   TEXT,
+            PRIMARY KEY (test_id, name)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS reference (
+            test_id    INTEGER NOT NULL REFERENCES tests(id) ON DELETE CASCADE,
+            position   INTEGER NOT NULL,
+            parameters TEXT NOT NULL,
+            result     TEXT,
+            PRIMARY KEY (test_id, position)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS settings (
+            key   TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, db_file: Path | None = None):
+        """
+        :param db_file: Database file, by default tests.db in the data directory.
+        """
+        self.data_dir: Path = Env.get_data_dir()
+        self.db_file: Path = Path(db_file) if db_file else self.data_dir.joinpath("tests.db")
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        # autocommit mode: transactions are opened explicitly by transaction()
+        self._connection = sqlite3.connect(self.db_file, isolation_level=None, timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA foreign_keys=ON")
+        self._connection.executescript(self.SCHEMA)
+        self._depth = 0
+
+    def close(self) -> None:
+        """Close the database connection; also done when leaving a `with` block."""
+        self._connection.close()
+
+    # ---------------- Transactions ----------------
+
+    @contextmanager
+    def transaction(self) -> Iterator["SqliteRepository"]:
+        """
+        Run the block in one database transaction, committed on exit and rolled back
+        on error. The write lock is taken up front, so read-modify-write sequences
+        inside the block can't interleave with another process.
+        Nested transactions join the outermost one.
+        """
+        if self._depth == 0:
+            self._connection.execute("BEGIN IMMEDIATE")
+        self._depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._depth -= 1
+            if self._depth == 0:
+                self._connection.execute("ROLLBACK")
+            raise
+        self._depth -= 1
+        if self._depth == 0:
+            self._connection.execute("COMMIT")
+
+    # ---------------- Configurations ----------------
+
+    def save_gui_config(self, config: "GUIConfig") -> None:
+        """Save GUI configuration to the settings table."""
+        self._connection.execute(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES ('gui_config', ?)",
+            (json.dumps(config.__dict__),),
+        )
+
+    def load_gui_config(self) -> "GUIConfig":
+        """Load GUI configuration. Stores defaults if missing/invalid."""
+        row = self._connection.execute("SELECT value FROM settings WHERE key = 'gui_config'").fetchone()
+        try:
+            data = json.loads(row[0]) if row else None
+        except json.JSONDecodeError:
+            data = None
+
+        cfg = GUIConfig()
+        if not isinstance(data, dict):
+            self.save_gui_config(cfg)
+            return cfg
+        for key, value in data.items():
+            if hasattr(cfg, key):
+                setattr(cfg, key, value)
+        return cfg
+
+    # ---------------- Tests ----------------
+
+    def save_test(self, test: Test) -> None:
+        """Save a new Test with its simulation reference, criteria, and reference."""
+        with self.transaction():
+            try:
+                cursor = self._connection.execute(
+                    "INSERT INTO tests (name, description, simulation, reference_source, reference_matching, parameter_schema)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (test.name, *self._test_columns(test)),
+                )
+            except sqlite3.IntegrityError:
+                raise ValueError(f"Test with name '{test.name}' already exists.")
+            self._insert_children(cursor.lastrowid, test)
+
+    def get_all_tests(self) -> List[Test]:
+        """Retrieve all tests, rebuilding Simulation, TestCriteria, and TestReference list if present."""
+        rows = self._connection.execute("SELECT * FROM tests ORDER BY id").fetchall()
+        return [self._row_to_test(row) for row in rows]
+
+    def get_test_by_name(self, name: str) -> Optional[Test]:
+        """Retrieve a Test by name through the name index, loading only its own rows."""
+        row = self._connection.execute("SELECT * FROM tests WHERE name = ?", (name,)).fetchone()
+        return self._row_to_test(row) if row else None
+
+    def list_test_names(self) -> List[str]:
+        return [name for (name,) in self._connection.execute("SELECT name FROM tests ORDER BY id")]
+
+    def get_test_summary(self, name: str) -> Optional[TestSummary]:
+        """Configuration of a test, counting its reference rows instead of loading them."""
+        row = self._connection.execute("SELECT * FROM tests WHERE name = ?", (name,)).fetchone()
+        if not row:
+            return None
+        return TestSummary.from_entry(self._row_to_entry(row), self._reference_count(row[0]))
+
+    def update_test(self, test: "Test") -> None:
+        """Replace the stored columns and criteria of an existing test, and its reference if it was loaded."""
+        with self.transaction():
+            test_id = self._test_id(test.name)
+            if test_id is None:
+                raise ValueError(f"Test with name '{test.name}' not found for update.")
+            self._connection.execute(
+                "UPDATE tests SET description = ?, simulation = ?, reference_source = ?,"
+                " reference_matching = ?, parameter_schema = ? WHERE id = ?",
+                (*self._test_columns(test), test_id),
+            )
+            self._connection.execute("DELETE FROM criteria WHERE test_id = ?", (test_id,))
+            if test.reference_loaded:
+                self._connection.execute("DELETE FROM reference WHERE test_id = ?", (test_id,))
+            self._insert_children(test_id, test, with_reference=test.reference_loaded)
+
+    def remove_test(self, test: "Test") -> None:
+        """Remove a test and, through the foreign keys, its criteria and reference."""
+        with self.transaction():
+            cursor = self._connection.execute("DELETE FROM tests WHERE name = ?", (test.name,))
+            if cursor.rowcount == 0:
+                raise ValueError(f"Test with name '{test.name}' not found for removal.")
+
+    # ---------------- Helpers ----------------
+
+    def _test_id(self, name: str) -> int | None:
+        row = self._connection.execute("SELECT id FROM tests WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _test_columns(test: Test) -> tuple:
+        # same document layout as the JSON repository, split into columns
+        entry = Repository._test_to_entry(test, include_reference=False)
+        return (
+            entry["description"] or "",
+            json.dumps(entry["simulation"]),
+            json.dumps(entry["reference_source"]),
+            json.dumps(entry["reference_matching"]),
+            json.dumps(entry["parameter_schema"]),
+        )
+
+    def _insert_children(self, test_id: int, test: Test, with_reference: bool = True) -> None:
+        if test.criteria:
+            criteria = test.criteria.as_dict()
+            percentiles = criteria.pop("percentiles", {})
+            self._connection.executemany(
+                "INSERT INTO criteria (test_id, name, value) VALUES (?, ?, ?)",
+                [(test_id, name, json.dumps(value)) for name, value in {**criteria, **percentiles}.items()],
+            )
+        if not with_reference:
+            return
+        self._connection.executemany(
+            "INSERT INTO reference (test_id, position, parameters, result) VALUES (?, ?, ?, ?)",
+            [
+                (test_id, position, json.dumps(ref.parameters), json.dumps(ref.result))
+                for position, ref in enumerate(test.reference or [])
+            ],
+        )
+
+    def _reference_count(self, test_id: int) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM reference WHERE test_id = ?", (test_id,)).fetchone()[0]
+
+    def _load_reference(self, test_id: int) -> list[dict]:
+        rows = self._connection.execute(
+            "SELECT parameters, result FROM reference WHERE test_id = ? ORDER BY position", (test_id,)
+        )
+        return [{"parameters": json.loads(parameters), "result": json.loads(result)} for parameters, result in rows]
+
+    def _row_to_test(self, row: tuple) -> Test:
+        """Rebuild a test; its reference rows are read when the reference is first accessed."""
+        test_id = row[0]
+        return Repository._entry_to_test(
+            self._row_to_entry(row), lambda: self._load_reference(test_id), self._reference_count(test_id)
+        )
+
+    def _row_to_entry(self, row: tuple) -> dict[str, Any]:
+        """The test row and its criteria in the JSON document layout, without the reference."""
+        test_id, name, description, simulation, reference_source, reference_matching, parameter_schema = row
+
+        criteria_rows = self._connection.execute(
+            "SELECT name, value FROM criteria WHERE test_id = ?", (test_id,)
+        ).fetchall()
+        criteria: dict[str, Any] = {}
+        for criterion_name, value in criteria_rows:
+            if TestCriteria.parse_percentile(criterion_name) is not None:
+                criteria.setdefault("percentiles", {})[criterion_name] = json.loads(value)
+            else:
+                criteria[criterion_name] = json.loads(value)
+
+        return {
+            "name": name,
+            "description": description,
+            "simulation": json.loads(simulation) if simulation else None,
+            "criteria": criteria or None,
+            "reference_source": json.loads(reference_source) if reference_source else None,
+            "reference_matching": json.loads(reference_matching) if reference_matching else None,
+            "parameter_schema": json.loads(parameter_schema) if parameter_schema else None,
+        }
@@ -0,0 +1,30 @@
+from application.ports.i_repository import IRepository
+from infrastructure.persistence.json_repository import Repository
+
+
+class StorageMigrator:
+    """One-shot copy of the tests and GUI configuration stored in tests.json into another storage backend."""
+
+    def __init__(self, target: IRepository, source: Repository | None = None):
+        self.source = source or Repository()
+        self.target = target
+
+    def migrate(self) -> tuple[list[str], list[str]]:
+        """
+        Copy every test missing from the target, in a single transaction.
+        Tests already present are left untouched, so the migration can be re-run safely.
+
+        :return: Names of the migrated tests and of the skipped ones.
+        """
+        migrated: list[str] = []
+        skipped: list[str] = []
+        with self.target.transaction():
+            for test in self.source.get_all_tests():
+                if test.name in migrated or self.target.get_test_by_name(test.name) is not None:
+                    skipped.append(test.name)
+                    continue
+                self.target.save_test(test)
+                migrated.append(test.name)
+            if self.source.gui_config_file.exists():
+                self.target.save_gui_config(self.source.load_gui_config())
+        return migrated, skipped
@@ -0,0 +1,104 @@
+import os
+import sys
+from abc import ABC, abstractmethod
+
+import psutil
+
+MB = 1024 * 1024
+
+
+class MemorySampler(ABC):
+    """Samples the resident memory of one process and keeps running min/max/mean in MB."""
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.count = 0
+        self.min_memory = 0.0
+        self.max_memory = 0.0
+        self._total = 0.0
+
+    @abstractmethod
+    def _read_rss(self) -> int | None:
+        """Return the current RSS in bytes, or None if the process is gone."""
+
+    def sample(self) -> bool:
+        """Take one sample. Return False once the process can no longer be sampled."""
+        rss = self._read_rss()
+        if rss is None:
+            return False
+        if rss == 0:
+            return True  # exec in progress or already exited, nothing resident to record
+        value = rss / MB
+        if self.count == 0:
+            self.min_memory = self.max_memory = value
+        else:
+            self.min_memory = min(self.min_memory, value)
+            self.max_memory = max(self.max_memory, value)
+        self._total += value
+        self.count += 1
+        return True
+
+    @property
+    def mean_memory(self) -> float:
+        return self._total / self.count if self.count else 0.0
+
+    def close(self) -> None:
+        """Release any resource held by the sampler."""
+
+
+class PsutilMemorySampler(MemorySampler):
+    """Portable backend going through psutil.Process.memory_info()."""
+
+    def __init__(self, pid: int):
+        super().__init__(pid)
+        try:
+            self._process: psutil.Process | None = psutil.Process(pid)
+        except psutil.Error:
+            self._process = None
+
+    def _read_rss(self) -> int | None:
+        if self._process is None:
+            return None
+        try:
+            return self._process.memory_info().rss
+        except psutil.Error:
+            return None
+
+
+class ProcStatmMemorySampler(MemorySampler):
+    """
+    Linux backend reading /proc/<pid>/statm through a descriptor kept open for the
+    whole run, so a sample costs a single pread() instead of an open/parse cycle.
+    """
+
+    PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+    def __init__(self, pid: int):
+        super().__init__(pid)
+        try:
+            self._fd: int | None = os.open(f"/proc/{pid}/statm", os.O_RDONLY)
+        except OSError:
+            self._fd = None
+
+    def _read_rss(self) -> int | None:
+        if self._fd is None:
+            return None
+        try:
+            fields = os.pread(self._fd, 128, 0).split()
+        except OSError:
+            return None
+        if len(fields) < 2:
+            return None
+        return int(fields[1]) * self.PAGE_SIZE
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def create_memory_sampler(pid: int) -> MemorySampler:
+    """Return the cheapest sampler backend available on this platform."""
+    if sys.platform.startswith("linux") and os.path.exists(f"/proc/{pid}/statm"):
+        return ProcStatmMemorySampler(pid)
+    return PsutilMemorySampler(pid)
@@ -0,0 +1,46 @@
+from typing import Iterator
+
+
+class SamplingSchedule:
+    """
+    Adaptive sampling intervals: dense at the start of a run, backing off geometrically
+    for long runs. After `budget` samples the run is sampled every `max_interval` until
+    it ends, so late memory peaks are still seen while the sampling cost stays bounded.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 0.001,
+        max_interval: float = 1.0,
+        growth: float = 1.25,
+        budget: int = 200,
+    ):
+        """
+        :param initial_interval: Seconds before the second sample (the first one is taken at spawn).
+        :param max_interval: Upper bound for the interval between two samples.
+        :param growth: Factor applied to the interval after every sample.
+        :param budget: Number of samples taken on the back-off ramp, before settling at max_interval.
+        """
+        if initial_interval <= 0 or max_interval < initial_interval:
+            raise ValueError("Sampling intervals must satisfy 0 < initial_interval <= max_interval")
+        if growth < 1:
+            raise ValueError("Sampling growth factor must be >= 1")
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.growth = growth
+        self.budget = max(1, budget)
+
+    def intervals(self) -> Iterator[float]:
+        """Yield the delay before each sample after the first one, for as long as the run lasts."""
+        interval = self.initial_interval
+        for _ in range(self.budget - 1):
+            yield interval
+            interval = min(self.max_interval, interval * self.growth)
+        while True:
+            yield self.max_interval
+
+    def __repr__(self) -> str:
+        return (
+            f"SamplingSchedule(initial_interval={self.initial_interval}, max_interval={self.max_interval}, "
+            f"growth={self.growth}, budget={self.budget})"
+        )
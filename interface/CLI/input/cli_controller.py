@@ -2,7 +2,8 @@ from interface.CLI.input.cli_help import CLIHelp
 from interface.CLI.input.cli_parser import CLIParser
 from interface.CLI.input.commands import *
 from application.app import App
-from infrastructure.persistence.json_repository import Repository
+from infrastructure.persistence.storage_migrator import StorageMigrator
+from infrastructure.persistence.repository_factory import RepositoryFactory
 from interface.CLI.output.cli_presenter import CLIPresenter
 from interface.GUI.gui_launcher import GUI
 
@@ -10,7 +11,7 @@ class CLIController:
 
     def __init__(self):
         self.presenter = CLIPresenter()
-        self.repository = Repository()
+        self.repository = RepositoryFactory.create()
         self.app = App(self.repository)
 
     def execute(self, command_name: str, options: List[str]):
@@ -23,32 +24,67 @@ class CLIController:
 
         if isinstance(cmd, LaunchGUICommand):
             gui = GUI()
-            gui.prepare(App(Repository()), self.repository.load_gui_config())
-            gui.launch()
+            with App(RepositoryFactory.create()) as gui_app:
+                gui.prepare(gui_app, self.repository.load_gui_config())
+                gui.launch()
 
         if isinstance(cmd, SetSimulationCommand):
-            self.app.set_simulation(cmd.test_name, cmd.simulation_name)
+            self.app.set_simulation(cmd.test_name, cmd.simulation_name, cmd.mode)
 
         if isinstance(cmd, RunTestCommand):
-            results = self.app.run_test(cmd.test_name, cmd.repetitions)
-            self.presenter.text_block(results)
+            results = None
+            step = max(1, cmd.repetitions // 100)
+            for results, _ in self.app.run_test_stream(cmd.test_name, cmd.repetitions, cmd.jobs, cmd.confidence):
+                if results.stats.total % step == 0 or results.stats.total == cmd.repetitions:
+                    self.presenter.progress(
+                        f"{results.stats.total}/{cmd.repetitions} runs"
+                        f" | compliance so far: {results.stats.compliance_rate:.2%}"
+                    )
+            self.presenter.progress("", done=True)
+            self.presenter.text_block(results if results is not None else self.app.get_test_by_name(cmd.test_name))
 
         if isinstance(cmd, NewTestCommand):
             self.app.new_test(cmd.test_name, cmd.description, cmd.simulation_script)
 
         if isinstance(cmd, ListTestsCommand):
-            test_list =  self.repository.get_all_tests()
-            names_list =  [test.name for test in test_list]
+            names_list =  self.app.list_test_names()
             self.presenter.text_block(names_list)
 
         if isinstance(cmd, SetCriterionCommand):
             self.app.set_criterion(cmd.test_name, cmd.criterion_name, cmd.criterion_value)
 
+        if isinstance(cmd, SetReferenceMatchingCommand):
+            self.app.set_reference_matching(
+                cmd.test_name, cmd.key_parameters, cmd.wildcard, cmd.parameter_tolerance, cmd.result_tolerance
+            )
+
+        if isinstance(cmd, SetParameterTypeCommand):
+            self.app.set_parameter_type(cmd.test_name, cmd.parameter_name, cmd.type_name)
+
         if isinstance(cmd, UpdateReferenceCommand):
                 self.app.update_reference(cmd.test_name, cmd.data_points)
 
+        if isinstance(cmd, MigrateStorageCommand):
+            with RepositoryFactory.create(cmd.backend) as target:
+                migrated, skipped = StorageMigrator(target).migrate()
+            self.presenter.text_block(
+                f"Migrated {len(migrated)} test(s) to '{cmd.backend}' storage: {', '.join(migrated) or '-'}\n"
+                f"Skipped {len(skipped)} test(s) already there: {', '.join(skipped) or '-'}\n"
+                f"Set FLEXTESTS_STORAGE={cmd.backend} to use it."
+            )
+
         self._update_repository()
 
+    def close(self) -> None:
+        self.app.close()
+
+    def __enter__(self) -> "CLIController":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _update_repository(self):
-        self.repository = Repository()
+        self.app.close()
+        self.repository = RepositoryFactory.create()
         self.app = App(self.repository)
@@ -29,25 +29,48 @@ class CLIHelp:
                 "syntax": "new-sim <simulation_name> <script_path> [description]"
             },
             "set-sim": {
-                "desc": "Assigns a simulation to a test.",
-                "syntax": "set-sim <test_name> <simulation_name>"
+                "desc": "Assigns a simulation script to a test. Mode is 'process' (default), 'warm' (.py only), 'server' (JSON-lines protocol) or 'batch' (many results per run).",
+                "syntax": "set-sim <test_name> <script_path> [mode]"
             },
             "run-sim": {
                 "desc": "Runs a simulation.",
                 "syntax": "run-sim <simulation_name>"
             },
             "run-test": {
-                "desc": "Runs a test with optional repetitions.",
-                "syntax": "run-test <test_name> [repetitions]"
+                "desc": "Runs a test with optional repetitions, up to N at a time with --jobs. "
+                        "With --confidence, stops once the compliance verdict is settled at that level.",
+                "syntax": "run-test <test_name> [repetitions] [--jobs N] [--confidence 0.95]"
             },
             "set-criterion": {
-                "desc": "Sets a criterion for a test.",
+                "desc": "Sets a criterion for a test. timeout_multiplier and memory_limit_multiplier "
+                        "cap each run at that multiple of the duration / max_memory criteria. "
+                        "'expression' takes a budget over stats and parameters, e.g. \"duration < 0.2 * float(x) and max_memory < 150\". "
+                        "Percentile criteria such as p95_duration or p99_max_memory bound the distribution over all runs.",
                 "syntax": "set-criterion <test_name> <criterion_name> <criterion_value>"
             },
             "set-ref": {
                 "desc": "Sets reference values for a test.",
                 "syntax": "set-ref <test_name> [reference_source] [breadth]"
             },
+            "set-param-type": {
+                "desc": "Declares the type (int, float, str or bool; 'none' to remove) of a parameter, "
+                        "or of the result as 'result'. Values are converted once as they enter the test; "
+                        "after removing a type, run update-ref to restore the reference values as fetched.",
+                "syntax": "set-param-type <test_name> <parameter_name> <type>"
+            },
+            "migrate-storage": {
+                "desc": "Copies the tests stored in tests.json into another storage backend, skipping tests "
+                        "already there: 'sqlite' (default, tests.db) or 'sharded' (one set of files per test "
+                        "in the tests directory). Set the environment variable FLEXTESTS_STORAGE to use it.",
+                "syntax": "migrate-storage [sqlite|sharded]"
+            },
+            "set-matching": {
+                "desc": "Matches results to references on the given comma-separated parameters only "
+                        "(all if omitted). With --wildcard, reference values equal to it (e.g. '*') match anything. "
+                        "--tolerance matches numeric parameters to the nearest reference point within that distance, "
+                        "--result-tolerance compares numeric results within that distance.",
+                "syntax": "set-matching <test_name> [key_parameters] [--wildcard *] [--tolerance T] [--result-tolerance T]"
+            },
         }
 
         for cmd, info in commands_info.items():
@@ -14,7 +14,10 @@ class CLIParser:
             "set-sim"               : SetSimulationCommand,
             "set-ref"               : SetReferenceCommand,
             "update-ref"            : UpdateReferenceCommand,
+            "set-matching"          : SetReferenceMatchingCommand,
+            "set-param-type"        : SetParameterTypeCommand,
             "set-criterion"         : SetCriterionCommand,
             "run-test"              : RunTestCommand,
+            "migrate-storage"       : MigrateStorageCommand,
 
         }[command_name](args)
\ No newline at end of file
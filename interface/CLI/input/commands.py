@@ -8,6 +8,24 @@ class Command:
     name: str
     args: List[str]
 
+    @staticmethod
+    def split_options(args: list[str]) -> tuple[list[str], dict[str, str]]:
+        """Split `--name value` options from positional arguments."""
+        positional: list[str] = []
+        options: dict[str, str] = {}
+        i = 0
+        while i < len(args):
+            if args[i].startswith("--"):
+                key = args[i][2:].replace("-", "_")
+                if i + 1 >= len(args):
+                    raise ValueError(f"Missing value for option {args[i]}")
+                options[key] = args[i + 1]
+                i += 2
+            else:
+                positional.append(args[i])
+                i += 1
+        return positional, options
+
 @dataclass
 class CLIHelpCommand(Command):
 
@@ -72,6 +90,7 @@ class SetSimulationCommand(Command):
         cls.args = args
         cls.test_name       = args[0]
         cls.simulation_name = args[1]
+        cls.mode            = args[2] if len(args) > 2 else "process"
 
 @dataclass
 class RunTestCommand(Command):
@@ -84,8 +103,11 @@ class RunTestCommand(Command):
     def __init__(cls, args: list[str]):
         cls.name = cls.command_name()
         cls.args = args
-        cls.test_name = args[0]
-        cls.repetitions = int(args[1]) if len(args)>1 else 1
+        positional, options = Command.split_options(args)
+        cls.test_name = positional[0]
+        cls.repetitions = int(positional[1]) if len(positional)>1 else 1
+        cls.jobs = int(options.get("jobs", 1))
+        cls.confidence = float(options["confidence"]) if "confidence" in options else None
 
 
 @dataclass
@@ -158,6 +180,40 @@ class SetReferenceCommand(Command):
         cls.test_name                 = args[0]
         cls.reference_source          = args[1]      if len(args) > 1 else None
 
+@dataclass
+class SetReferenceMatchingCommand(Command):
+
+    @classmethod
+    def command_name(cls) -> str:
+        return "set-matching"
+
+    @classmethod
+    def __init__(cls, args: list[str]):
+        cls.name = cls.command_name()
+        cls.args = args
+        positional, options = Command.split_options(args)
+        cls.test_name      = positional[0]
+        cls.key_parameters = positional[1].split(",") if len(positional) > 1 else None
+        wildcard           = options.get("wildcard")
+        cls.wildcard       = None if wildcard is None or wildcard.lower() == "none" else wildcard
+        cls.parameter_tolerance = float(options["tolerance"]) if "tolerance" in options else None
+        cls.result_tolerance    = float(options["result_tolerance"]) if "result_tolerance" in options else None
+
+@dataclass
+class SetParameterTypeCommand(Command):
+
+    @classmethod
+    def command_name(cls) -> str:
+        return "set-param-type"
+
+    @classmethod
+    def __init__(cls, args: list[str]):
+        cls.name = cls.command_name()
+        cls.args = args
+        cls.test_name      = args[0]
+        cls.parameter_name = args[1]
+        cls.type_name      = None if args[2].lower() == "none" else args[2]
+
 @dataclass
 class UpdateReferenceCommand(Command):
         @classmethod
@@ -170,3 +226,16 @@ class UpdateReferenceCommand(Command):
             cls.args = args
             cls.test_name                 = args[0]
             cls.data_points               = int(args[1]) if len(args) > 1 else None
+
+@dataclass
+class MigrateStorageCommand(Command):
+
+    @classmethod
+    def command_name(cls) -> str:
+        return "migrate-storage"
+
+    @classmethod
+    def __init__(cls, args: list[str]):
+        cls.name = cls.command_name()
+        cls.args = args
+        cls.backend = args[0].lower() if args else "sqlite"
@@ -2,4 +2,9 @@ class CLIPresenter:
 
     @staticmethod
     def text_block(text: object) -> None:
-        print(f"\n{text}")
\ No newline at end of file
+        print(f"\n{text}")
+
+    @staticmethod
+    def progress(text: str, done: bool = False) -> None:
+        """Overwrite the current terminal line with a progress message."""
+        print(f"\r{text}", end="\n" if done else "", flush=True)
@@ -5,6 +5,7 @@ from tkinter import ttk, filedialog
 import tkinter as tk
 from typing import List
 from application.app import App
+from domain.simulation_statistics import SimulationStats
 from domain.test import Test
 from infrastructure.environment.environment import Env
 from interface.GUI.components.button import Button
@@ -22,6 +23,9 @@ from interface.GUI.models.ResultsSummaryTable import ResultsSummaryTable
 
 
 class InputPane:
+    # plottable stats, as shown by the variable selector
+    STAT_VARIABLES = [name.replace("_", " ") for name in SimulationStats.STAT_NAMES]
+
     def __init__(self, panned_window, initial_width, style: GUIStyle, app: App, output_pane: OutputPane, window:"Window") -> None:
 
         screen = Env.get_window()
@@ -184,7 +188,7 @@ class InputPane:
             row=row,
             manager="grid"
         )
-        self.variable_selector.render(values=["duration", "max memory", "mean memory", "min memory"])
+        self.variable_selector.render(values=self.STAT_VARIABLES)
         self.variable_selector.combobox.bind("<<ComboboxSelected>>", self.update_selected_variable)
 
         row += 1
@@ -272,12 +276,22 @@ class InputPane:
             if not selected_test_name:
                 return
 
-            completed_test = self.app.run_test(selected_test_name, self.test_data_points_var.get())
+            repetitions = self.test_data_points_var.get()
+            step = max(1, repetitions // 50)
+
+            def show_progress(test: Test, result):
+                if test.stats.total % step == 0:
+                    self.window.footer.set_state(
+                        "processing",
+                        f"{test.stats.total}/{repetitions} | compliance so far: {test.stats.compliance_rate:.2%}"
+                    )
+
+            completed_test = self.app.run_test(selected_test_name, repetitions, on_result=show_progress)
 
             test_description:str = completed_test.description
 
             plot_data:List[ResultsPlotData] = []
-            for variable_name in ["duration", "max memory", "mean memory", "min memory"]:
+            for variable_name in self.STAT_VARIABLES:
                 plot_data.append(self.get_results_plot_data(variable_name, completed_test))
 
             results_summary_data:ResultsSummaryTable = self.get_results_summary(completed_test)
@@ -343,7 +357,7 @@ class InputPane:
         if variable_name is not None and variable_name != "":
             title = f"{variable_name}".upper()
             subtitle = self.plot_selector.combobox.get().upper()
-            data = [result.simulation.stats.get_value_by_name(variable_name) for result in completed_test.results]
+            data = completed_test.get_stats_variable_data(variable_name)
             return ResultsPlotData(title, subtitle, variable_name, data)
         else:
             return ResultsPlotData()
@@ -468,13 +482,13 @@ class InputPane:
         name_entry.focus()
 
     def update_controller_section(self, current_item_name=""):
-        test_names_list = [test.name for test in self.app.get_tests_list()]
+        test_names_list = self.app.list_test_names()
         self.test_selector.combobox.configure(values=test_names_list)
         self.test_selector.combobox.set(current_item_name)
         self.present_test_info()
 
     def load_test_config(self, event=None):
-        selected_test = self.get_selected_test()
+        selected_test = self.app.get_test_summary(self.get_selected_test_name())
         if selected_test:
             self.max_duration_var.set(selected_test.criteria.duration)
             self.max_memory_var.set(selected_test.criteria.max_memory)
@@ -482,23 +496,26 @@ class InputPane:
             self.compliance_var.set(selected_test.criteria.compliance_rate * 100)
             self.reference_source_var.set(selected_test.reference_source
                                            if (selected_test.reference_source is not None) else "")
-            self.reference_data_points_var.set(len(selected_test.reference))
+            self.reference_data_points_var.set(selected_test.reference_count)
 
     def save_test_config(self):
-        selected_test = self.get_selected_test()
+        selected_test = self.app.get_test_summary(self.get_selected_test_name())
         if not selected_test:
             return
 
-        if self.reference_source_var.get() != selected_test.reference_source:
-            self.app.set_reference_source(selected_test.name, self.reference_source_var.get())
-
-        if self.reference_data_points_var.get() != len(selected_test.reference):
-            self.app.update_reference(selected_test.name, self.reference_data_points_var.get())
-
-        self.app.set_criterion(selected_test.name, "duration", self.max_duration_var.get())
-        self.app.set_criterion(selected_test.name, "max_memory", self.max_memory_var.get())
-        self.app.set_criterion(selected_test.name, "mean_memory", self.mean_memory_var.get())
-        self.app.set_criterion(selected_test.name, "compliance_rate", self.compliance_var.get() / 100)
+        reference_source = self.reference_source_var.get()
+        data_points = self.reference_data_points_var.get()
+        self.app.update_test_config(
+            selected_test.name,
+            reference_source=reference_source if reference_source != selected_test.reference_source else None,
+            reference_data_points=data_points if data_points != selected_test.reference_count else None,
+            criteria={
+                "duration": self.max_duration_var.get(),
+                "max_memory": self.max_memory_var.get(),
+                "mean_memory": self.mean_memory_var.get(),
+                "compliance_rate": self.compliance_var.get() / 100,
+            },
+        )
         self.load_test_config()
 
     def update_all_sections(self):
@@ -252,6 +252,7 @@ class OutputPane:
         self._render_summary(
             getattr(self.output_pane_data, "results_summary_data", None),
             self.summary_frame,
+            variable_name=plot_options.selected_variable,
         )
 
     def _render_plot_with_matplotlib(
@@ -364,13 +365,15 @@ class OutputPane:
             # allow column to stretch a bit, initial width guess
             tree.column(h, width=max(60, min(300, int(len(h) * 10))), anchor="w", stretch=True)
 
-        # insert rows
+        # insert rows, keeping the raw (possibly typed) values for sorting
+        tree._sort_values = {}
         for r in rows:
             try:
-                values = [self._cell_to_string(self._get_row_value(r, h)) for h in headers]
+                raw = [self._get_row_value(r, h) for h in headers]
             except Exception:
-                values = [self._cell_to_string(self._get_row_value_fallback(r, h)) for h in headers]
-            tree.insert("", "end", values=values)
+                raw = [self._get_row_value_fallback(r, h) for h in headers]
+            item = tree.insert("", "end", values=[self._cell_to_string(v) for v in raw])
+            tree._sort_values[item] = raw
 
         # layout - place treeview with scrollbars using grid
         tree.grid(row=0, column=0, sticky="nsew")
@@ -424,7 +427,7 @@ class OutputPane:
             return f"{v:.4g}"
         return str(v)
     # ------------------- helpers: summary renderer -------------------
-    def _render_summary(self, summary_obj: ResultsSummaryTable, parent: ttk.Frame):
+    def _render_summary(self, summary_obj: ResultsSummaryTable, parent: ttk.Frame, variable_name: str | None = None):
         """
         Attempt to show a lightweight summary.
         If it looks like a table (headers/rows) render it as a small Treeview,
@@ -453,6 +456,15 @@ class OutputPane:
                 ("Efficient Instances", summary_obj.efficient_instances),
                 ("Compliance Rate", f"{summary_obj.compliance:.2%}"),
             ]
+            # online mean / std / range of the plotted variable
+            normalized = (variable_name or "").strip().lower().replace(" ", "_")
+            running = summary_obj.running.get(normalized)
+            if running is not None and running.count:
+                metrics += [
+                    ("Mean", f"{running.mean:.6g}"),
+                    ("Std Dev", f"{running.std:.6g}" if running.std is not None else "-"),
+                    ("Min / Max", f"{running.min:.6g} / {running.max:.6g}"),
+                ]
             left = ttk.Frame(parent)
             left.grid(row=0, column=0, sticky="w")
             for idx, (label, value) in enumerate(metrics):
@@ -505,6 +517,21 @@ class OutputPane:
         """
         tree._sort_column = None  # track current sorted column
         tree._sort_descending = False
+        tree._sort_keys = {}  # column -> rows in ascending order, computed on first click
+
+        def column_order(col_index: int, col_id: str) -> list:
+            items = tree.get_children("")
+            raw = getattr(tree, "_sort_values", {})
+            values = [raw[k][col_index] if k in raw else tree.set(k, col_id) for k in items]
+            # typed numbers sort as they are, numeric strings are parsed once per column
+            try:
+                keys = [
+                    v if isinstance(v, (int, float)) and not isinstance(v, bool) else float(v)
+                    for v in values
+                ]
+            except (TypeError, ValueError):
+                keys = [tree.set(k, col_id) for k in items]  # leave as strings if not numbers
+            return sorted(zip(keys, items))
 
         def sort_column(event):
             # Check if click is on a heading
@@ -517,14 +544,10 @@ class OutputPane:
             col_index = int(col.replace("#", "")) - 1  # "#1", "#2", ...
             col_id = tree["columns"][col_index]
 
-            # Get all items
-            data = [(tree.set(k, col_id), k) for k in tree.get_children("")]
-
-            # Try numeric conversion
-            try:
-                data = [(float(v), k) for v, k in data]
-            except ValueError:
-                pass  # leave as strings if not numbers
+            # Sort keys are computed once per column
+            data = tree._sort_keys.get(col_id)
+            if data is None:
+                data = tree._sort_keys[col_id] = column_order(col_index, col_id)
 
             # Determine order
             descending = False
@@ -533,11 +556,8 @@ class OutputPane:
             tree._sort_column = col_id
             tree._sort_descending = descending
 
-            # Sort data
-            data.sort(reverse=descending)
-
             # Reorder rows
-            for index, (_, k) in enumerate(data):
+            for index, (_, k) in enumerate(reversed(data) if descending else data):
                 tree.move(k, "", index)
 
         # Bind clicks on the **heading area only**
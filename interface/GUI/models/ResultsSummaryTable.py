@@ -1,3 +1,4 @@
+from domain.running_stats import RunningStats
 from domain.test_statistics import TestStats
 
 
@@ -6,4 +7,5 @@ class ResultsSummaryTable:
         self.sample_size:int     = test_stats.total
         self.effective_instances:int = test_stats.effective
         self.efficient_instances:int = test_stats.efficient
-        self.compliance:float        = test_stats.compliance_rate
\ No newline at end of file
+        self.compliance:float        = test_stats.compliance_rate
+        self.running:dict[str, RunningStats] = test_stats.running
\ No newline at end of file
@@ -9,12 +9,15 @@ class ResultRow:
     min_memory: float | None
     max_memory: float | None
     mean_memory: float | None
+    peak_memory: float | None
+    cpu_time: float | None
     result: str | None
     parameters: dict[str, Any]
 
     def __getitem__(self, key: str):
         # allows access like row["efficacy"] or row["alpha"]
-        if key in {"efficacy", "efficiency", "duration", "min_memory", "max_memory", "mean_memory", "result"}:
+        if key in {"efficacy", "efficiency", "duration", "min_memory", "max_memory", "mean_memory",
+                   "peak_memory", "cpu_time", "result"}:
             return getattr(self, key)
         return self.parameters.get(key, None)
 
@@ -35,30 +38,24 @@ class ResultsTable:
 
     @staticmethod
     def get_results_table(completed_test: "Test") -> "ResultsTable":
-        # Collect all possible parameter keys
-        all_param_keys: set[str] = set()
-        for result in completed_test.results:
-            if result.simulation and result.simulation.parameters:
-                all_param_keys.update(result.simulation.parameters.keys())
+        # Results are stored by column: read each column once, then assemble the rows
+        results = completed_test.results
+        all_param_keys = sorted(results.parameter_names())
 
         base_headers = ["efficacy", "efficiency"]
-        stats_headers = ["duration", "min_memory", "max_memory", "mean_memory", "result"]
-        headers = base_headers + stats_headers + sorted(all_param_keys)
+        stats_headers = ["duration", "min_memory", "max_memory", "mean_memory", "peak_memory", "cpu_time", "result"]
+        headers = base_headers + stats_headers + all_param_keys
 
-        rows: list[ResultRow] = []
-        for result in completed_test.results:
-            sim_result = result.simulation
-            stats = sim_result.stats if sim_result else None
+        columns = {name: results.column(name) for name in base_headers + stats_headers}
+        param_columns = {name: results.column(name) for name in all_param_keys}
 
+        rows: list[ResultRow] = []
+        for i in range(len(results)):
             row = ResultRow(
-                efficacy=result.efficacy,
-                efficiency=result.efficiency,
-                duration=stats.duration if stats else None,
-                min_memory=stats.min_memory if stats else None,
-                max_memory=stats.max_memory if stats else None,
-                mean_memory=stats.mean_memory if stats else None,
-                result=sim_result.result if sim_result else None,
-                parameters=sim_result.parameters if sim_result else {}
+                **{name: column[i] for name, column in columns.items()},
+                parameters={
+                    name: column[i] for name, column in param_columns.items() if column[i] is not None
+                },
             )
             rows.append(row)
 
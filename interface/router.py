@@ -13,4 +13,5 @@ class Router:
         command = preprocessed_args[0]
         args = preprocessed_args[1:]
 
-        CLIController().execute(command, args)
\ No newline at end of file
+        with CLIController() as controller:
+            controller.execute(command, args)
\ No newline at end of file
@@ -0,0 +1,41 @@
+import random
+
+from domain.compliance_stop_rule import ComplianceStopRule
+from domain.test_statistics import TestStats
+
+
+def run_until_decided(rule: ComplianceStopRule, rate: float, runs: int, rng: random.Random):
+    stats = TestStats()
+    for _ in range(runs):
+        stats.total += 1
+        stats.effective_and_efficient += rng.random() < rate
+        verdict = rule.decide(stats)
+        if verdict is not None:
+            return verdict
+    return None
+
+
+def test_only_decides_at_looks():
+    rule = ComplianceStopRule(0.5, 0.95, min_runs=10)
+    assert [n for n in range(1, 200) if rule.look_index(n) is not None] == [10, 20, 40, 80, 160]
+    stats = TestStats(both=19, total=19)
+    assert rule.decide(stats) is None
+    stats = TestStats(both=20, total=20)
+    assert rule.decide(stats) == "passed"
+
+
+def test_repeated_looks_keep_the_error_rate():
+    # compliant test close to the requirement: stopping early on "failed" is the error
+    rng = random.Random(7)
+    trials = 400
+    wrong = sum(
+        run_until_decided(ComplianceStopRule(0.8, 0.95), 0.83, 1000, rng) == "failed"
+        for _ in range(trials)
+    )
+    assert wrong / trials <= 0.025
+
+
+def test_stops_early_on_clear_verdicts():
+    rng = random.Random(3)
+    assert run_until_decided(ComplianceStopRule(0.8, 0.95), 0.99, 1000, rng) == "passed"
+    assert run_until_decided(ComplianceStopRule(0.8, 0.95), 0.4, 1000, rng) == "failed"
@@ -0,0 +1,80 @@
+import pytest
+
+import domain.criteria_expression as criteria_expression
+import domain.result_set as result_set
+from domain.criteria_expression import CriteriaExpression
+from domain.result_set import ResultSet
+from domain.simulation_result import SimulationResult
+from domain.simulation_statistics import SimulationStats
+from domain.test_criteria import TestCriteria
+from domain.test_result import TestResult
+
+EXPRESSIONS = [
+    "duration < 0.2 * float(x) and max_memory < 150",
+    "duration < 0.2 * (10 / float(x))",
+    "float(x) == 0 or 10 / float(x) > 1",
+    "float(x) != 0 and 10 // float(x) >= 2",
+    "not (duration < 0.5) or max_memory > 120",
+    "min(duration, 1) < 0.5 < max(max_memory, 0)",
+    "abs(float(y) - 1) < 0.5",
+    "str(x) == '3'",
+    "1 / 0 > 1 or duration < 1",
+]
+
+
+def make_results() -> ResultSet:
+    results = ResultSet()
+    rows = [
+        (0.1, 100.0, {"x": "3", "y": "1"}),
+        (0.6, 200.0, {"x": "0"}),
+        (0.3, 140.0, {"x": "10", "y": "2"}),
+        (0.9, 110.0, {}),
+        (0.2, 90.0, {"x": "0.5", "y": "0.8"}),
+    ]
+    for duration, memory, parameters in rows:
+        result = TestResult()
+        result.simulation = SimulationResult(
+            SimulationStats(duration=duration, max_memory=memory), "ok", parameters
+        )
+        result.efficacy = "passed"
+        results.append(result)
+    return results
+
+
+def scalar_outcomes(expression: CriteriaExpression, results: ResultSet) -> list[bool]:
+    return [
+        expression.evaluate(row.simulation.stats, row.simulation.parameters, row.simulation.result)
+        for row in results
+    ]
+
+
+@pytest.mark.parametrize("source", EXPRESSIONS)
+def test_vectorized_evaluation_matches_scalar(source):
+    pytest.importorskip("numpy")
+    expression = CriteriaExpression(source)
+    results = make_results()
+    assert list(expression.evaluate_columns(results)) == scalar_outcomes(expression, results)
+
+
+def test_arithmetic_errors_fail_the_run():
+    expression = CriteriaExpression("duration < 0.2 * (10 / float(x))")
+    assert expression.evaluate(SimulationStats(duration=0.1), {"x": "0"}) is False
+    assert expression.evaluate(SimulationStats(duration=0.1), {"x": "1"}) is True
+
+
+@pytest.mark.parametrize("source", EXPRESSIONS)
+def test_works_without_numpy(monkeypatch, source):
+    monkeypatch.setattr(criteria_expression, "np", None)
+    monkeypatch.setattr(result_set, "np", None)
+    expression = CriteriaExpression(source)
+    results = make_results()
+    expected = scalar_outcomes(expression, results)
+
+    criteria = TestCriteria()
+    criteria.expression = source
+    stats = results.rescore(criteria)
+
+    assert list(results.column("efficiency")) == ["passed" if ok else "failed" for ok in expected]
+    assert stats.efficient == sum(expected)
+    with pytest.raises(RuntimeError):
+        expression.evaluate_columns(results)
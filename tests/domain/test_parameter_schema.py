@@ -0,0 +1,47 @@
+from domain.parameter_schema import ParameterSchema
+from domain.simulation import Simulation
+from domain.simulation_result import SimulationResult
+from domain.simulation_statistics import SimulationStats
+from domain.test import Test
+from domain.test_reference import TestReference
+
+
+def make_test(tmp_path, output: str) -> Test:
+    script = tmp_path / "simulation.py"
+    script.write_text(f"print({output!r})\n")
+    test = Test("typed")
+    test.simulation = Simulation("typed", str(script))
+    test.reference = [TestReference("4", {"x": "2"})]
+    test.parameter_schema = ParameterSchema({"x": "int", "result": "int"})
+    return test
+
+
+def test_typed_copies_and_reports_each_value():
+    schema = ParameterSchema({"x": "int", "y": "float", "result": "bool"})
+    item = SimulationResult(SimulationStats(), "yes", {"x": "1", "y": "oops", "z": "2"})
+
+    typed, errors = schema.typed(item)
+
+    assert typed.parameters == {"x": 1, "y": "oops", "z": "2"}
+    assert typed.result is True
+    assert errors == ["Parameter 'y' expects float, got 'oops'"]
+    assert item.parameters == {"x": "1", "y": "oops", "z": "2"} and item.result == "yes"
+
+
+def test_reference_stays_as_stored(tmp_path):
+    test = make_test(tmp_path, '{"result": "4", "parameters": {"x": "2"}}')
+    test.execute(2)
+
+    assert test.stats.effective == 2
+    assert test.reference[0].parameters == {"x": "2"} and test.reference[0].result == "4"
+
+
+def test_invalid_output_fails_the_run_only(tmp_path):
+    test = make_test(tmp_path, '{"result": "4", "parameters": {"x": "two"}}')
+    results = list(test.iter_execute(2))
+
+    assert [result.efficiency for result in results] == ["invalid", "invalid"]
+    assert [result.efficacy for result in results] == ["failed", "failed"]
+    assert results[0].simulation.error == "Parameter 'x' expects int, got 'two'"
+    assert test.stats.effective == 0
+    assert "invalid output        : 2 runs" in test.report()
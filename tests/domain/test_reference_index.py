@@ -0,0 +1,37 @@
+from domain.reference_index import ReferenceIndex
+from domain.reference_matching import ReferenceMatching
+from domain.test_reference import TestReference
+
+
+def make_reference() -> list[TestReference]:
+    return [
+        TestReference("star", {"x": "*", "y": "1"}),
+        TestReference("exact", {"x": "2", "y": "1"}),
+        TestReference("other", {"x": "2", "y": "2"}),
+    ]
+
+
+def test_star_is_literal_by_default():
+    index = ReferenceIndex(make_reference())
+    assert index.find({"x": "2", "y": "1"}).result == "exact"
+    assert index.find({"x": "*", "y": "1"}).result == "star"
+    assert index.find({"x": "3", "y": "1"}) is None
+
+
+def test_wildcard_is_opt_in():
+    index = ReferenceIndex(make_reference(), ReferenceMatching(wildcard=ReferenceMatching.WILDCARD))
+    assert index.find({"x": "3", "y": "1"}).result == "star"
+    assert index.find({"x": "2", "y": "1"}).result == "star"  # the first matching entry wins
+    assert index.find({"x": "2", "y": "2"}).result == "other"
+    assert index.find({"x": "3", "y": "2"}) is None
+
+
+def test_key_parameters_ignore_the_rest():
+    index = ReferenceIndex(make_reference(), ReferenceMatching(key_parameters=["y"]))
+    assert index.find({"x": "9", "y": "2", "seed": "4"}).result == "other"
+    assert index.find({"y": "1"}).result == "star"
+
+
+def test_stored_matching_keeps_its_wildcard():
+    assert ReferenceMatching.from_dict({"wildcard": "*"}).wildcard == "*"
+    assert ReferenceMatching.from_dict({}).wildcard is None
@@ -0,0 +1,27 @@
+import pytest
+
+from domain.result_set import ResultSet
+from domain.simulation_result import SimulationResult
+from domain.simulation_statistics import SimulationStats
+from domain.test_result import TestResult
+
+np = pytest.importorskip("numpy")
+
+
+def make_result(duration: float) -> TestResult:
+    result = TestResult()
+    result.simulation = SimulationResult(SimulationStats(duration=duration), "ok", {})
+    result.efficacy = "passed"
+    return result
+
+
+def test_stat_vector_survives_appends():
+    results = ResultSet()
+    results.append(make_result(0.1))
+    durations = results.stat_vector("duration")
+
+    results.append(make_result(0.2))  # raised BufferError while a view was alive
+    durations[0] = 5.0
+
+    assert durations.tolist() == [5.0]
+    assert results.stat_vector("duration").tolist() == [0.1, 0.2]
@@ -0,0 +1,47 @@
+import sys
+import textwrap
+import time
+
+import psutil
+import pytest
+
+from domain.run_limits import RunLimits
+from infrastructure.io.async_simulation_runner import AsyncSimulationRunner
+
+SPAWNING = textwrap.dedent("""
+    import subprocess
+    import sys
+    import time
+
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(10)"])
+    with open({pid_file!r}, "w") as f:
+        f.write(str(child.pid))
+    time.sleep(10)
+""")
+
+
+def is_running(pid: int) -> bool:
+    try:
+        return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return False
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="process groups are POSIX only")
+def test_timeout_kills_grandchildren(tmp_path):
+    pid_file = tmp_path / "child.pid"
+    script = tmp_path / "spawning.py"
+    script.write_text(SPAWNING.format(pid_file=str(pid_file)))
+
+    start = time.perf_counter()
+    [result] = AsyncSimulationRunner(limits=RunLimits(timeout=1.0)).run(str(script), 1)
+    elapsed = time.perf_counter() - start
+
+    assert result.status == "timeout"
+    # the grandchild holds the output pipe: had it survived, the run would have waited for it
+    assert elapsed < 5
+    child = int(pid_file.read_text())
+    deadline = time.monotonic() + 2
+    while is_running(child) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not is_running(child)
@@ -0,0 +1,91 @@
+import json
+import os
+
+import pytest
+
+from application.app import App
+from domain.test import Test
+from domain.test_reference import TestReference
+from infrastructure.persistence.cached_repository import CachedRepository
+from infrastructure.persistence.json_repository import Repository
+
+
+def make_repository(tmp_path) -> tuple[Repository, CachedRepository]:
+    inner = Repository()
+    inner.test_file = tmp_path / "tests.json"
+    inner.gui_config_file = tmp_path / "gui_config.json"
+    test = Test("t1", "first")
+    test.reference = [TestReference("1", {"x": "1"}), TestReference("2", {"x": "2"})]
+    inner.save_test(test)
+    return inner, CachedRepository(inner)
+
+
+def test_reads_are_detached(tmp_path):
+    _, cached = make_repository(tmp_path)
+    test = cached.get_test_by_name("t1")
+    test.description = "changed"
+    test.reference[0].parameters["x"] = "changed"
+
+    again = cached.get_test_by_name("t1")
+    assert again.description == "first"
+    assert again.reference[0].parameters == {"x": "1"}
+
+
+def test_reference_stays_lazy(tmp_path):
+    _, cached = make_repository(tmp_path)
+    test = cached.get_test_by_name("t1")
+    assert not test.reference_loaded
+    assert test.reference_count == 2
+
+
+def test_detects_an_atomic_replace_with_same_mtime_and_size(tmp_path):
+    inner, cached = make_repository(tmp_path)
+    assert cached.get_test_by_name("t1").description == "first"
+    before = os.stat(inner.test_file)
+
+    # another process replaces the file with one of the same size and mtime
+    other = Repository()
+    other.test_file = tmp_path / "other.json"
+    replacement = Test("t1", "other")
+    replacement.reference = [TestReference("1", {"x": "1"}), TestReference("2", {"x": "2"})]
+    other.save_test(replacement)
+    os.utime(other.test_file, ns=(before.st_atime_ns, before.st_mtime_ns))
+    os.replace(other.test_file, inner.test_file)
+    assert os.stat(inner.test_file).st_size == before.st_size
+
+    assert cached.get_test_by_name("t1").description == "other"
+
+
+def test_writes_update_the_cache(tmp_path):
+    inner, cached = make_repository(tmp_path)
+    test = cached.get_test_by_name("t1")
+    test.description = "updated"
+    cached.update_test(test)
+
+    assert cached.get_test_by_name("t1").description == "updated"
+    assert inner.get_test_by_name("t1").description == "updated"
+    assert len(cached.get_test_by_name("t1").reference) == 2
+
+
+def test_summary_does_not_build_the_reference(tmp_path, monkeypatch):
+    _, cached = make_repository(tmp_path)
+    cached.list_test_names()  # fill the cache
+    monkeypatch.setattr(Repository, "_entry_to_test", staticmethod(lambda *args: pytest.fail("test built")))
+
+    summary = cached.get_test_summary("t1")
+    assert summary.reference_count == 2
+    assert summary.description == "first"
+
+
+def test_cold_cache_transaction_keeps_other_references(tmp_path):
+    inner, _ = make_repository(tmp_path)
+    other = Test("t2", "second")
+    other.reference = [TestReference("3", {"x": "3"})]
+    inner.save_test(other)
+
+    App(CachedRepository(inner)).set_criterion("t1", "duration", "3")
+
+    stored = {entry["name"]: entry for entry in json.loads(inner.test_file.read_text())}
+    assert stored["t2"]["reference"] == [{"parameters": {"x": "3"}, "result": "3"}]
+    assert len(stored["t1"]["reference"]) == 2
+    assert stored["t1"]["criteria"]["duration"] == 3.0
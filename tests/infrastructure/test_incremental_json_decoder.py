@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from infrastructure.io.incremental_json_decoder import IncrementalJsonDecoder
+from infrastructure.io.json_fetcher import JsonFetcher
+
+STREAM = '{"result": "a \\" }", "parameters": {"x": "1"}}\n3.5 [1, 2] true\n"tail"  -12e3'
+VALUES = [{"result": 'a " }', "parameters": {"x": "1"}}, 3.5, [1, 2], True, "tail", -12e3]
+
+
+def decode(chunks: list[str]) -> list:
+    decoder = IncrementalJsonDecoder()
+    values = []
+    for chunk in chunks:
+        values.extend(decoder.feed(chunk))
+    values.extend(decoder.close())
+    return values
+
+
+@pytest.mark.parametrize("split", range(len(STREAM) + 1))
+def test_any_split_point(split):
+    assert decode([STREAM[:split], STREAM[split:]]) == VALUES
+
+
+def test_one_character_at_a_time():
+    assert decode(list(STREAM)) == VALUES
+
+
+def test_numbers_wait_for_their_end():
+    decoder = IncrementalJsonDecoder()
+    assert list(decoder.feed("3")) == []
+    assert list(decoder.feed(".5 ")) == [3.5]
+    assert list(decoder.feed("7")) == []
+    assert list(decoder.close()) == [7]
+
+
+def test_truncated_value_fails_on_close():
+    decoder = IncrementalJsonDecoder()
+    assert list(decoder.feed('{"result": "a"')) == []
+    with pytest.raises(ValueError):
+        list(decoder.close())
+
+
+def test_fetcher_flattens_split_array():
+    text = json.dumps([{"result": "1"}, {"result": "2"}])
+    chunks = [text[i:i + 5] for i in range(0, len(text), 5)]
+    assert list(JsonFetcher().iter_json_stream(chunks)) == [{"result": "1"}, {"result": "2"}]
@@ -0,0 +1,44 @@
+import sys
+import textwrap
+
+import pytest
+
+from domain.simulation import Simulation
+from domain.simulation_statistics import SimulationStats
+
+SERVER = textwrap.dedent("""
+    import json
+    import sys
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        response = {
+            "output": {"result": str(request.get("seed")), "parameters": request.get("parameters", {})},
+            "stats": {"duration": 0.5, "cpu_time": 9.0, "gpu_time": 1.0},
+        }
+        print(json.dumps(response), flush=True)
+""")
+
+
+def test_stats_from_dict_ignores_unknown_names():
+    stats = SimulationStats.from_dict({"duration": 2.0, "user_time": 1.0, "cpu_time": 5.0, "extra": 1})
+    assert stats.duration == 2.0
+    assert stats.cpu_time == 1.0
+
+
+def test_server_receives_request_extras(tmp_path):
+    script = tmp_path / "server.py"
+    script.write_text(SERVER)
+    simulation = Simulation("server", str(script), mode="server")
+
+    results = simulation.run_many(3, request_extras=lambda i: {"seed": 100 + i, "parameters": {"x": str(i)}})
+
+    assert [result.result for result in results] == ["100", "101", "102"]
+    assert [result.parameters for result in results] == [{"x": "0"}, {"x": "1"}, {"x": "2"}]
+    assert all(result.stats.duration == 0.5 for result in results)
+
+
+def test_request_extras_need_server_mode(tmp_path):
+    simulation = Simulation("process", sys.executable, mode="process")
+    with pytest.raises(ValueError):
+        simulation.run_many(1, request_extras=lambda i: {"seed": i})
@@ -0,0 +1,77 @@
+import pytest
+
+from domain.test import Test
+from domain.test_reference import TestReference
+from infrastructure.persistence.json_repository import Repository
+from infrastructure.persistence.sharded_json_repository import ShardedJsonRepository
+
+
+def make_repository(tmp_path) -> Repository:
+    repository = Repository()
+    repository.test_file = tmp_path / "tests.json"
+    repository.gui_config_file = tmp_path / "gui_config.json"
+    return repository
+
+
+def test_reference_source_is_kept_whole(tmp_path):
+    repository = make_repository(tmp_path)
+    with_source = Test("with")
+    with_source.reference_source = "https://example.com/reference.json"
+    without_source = Test("without")
+    without_source.reference_source = ""
+    repository.save_test(with_source)
+    repository.save_test(without_source)
+
+    by_name = {test.name: test for test in repository.get_all_tests()}
+    assert by_name["with"].reference_source == "https://example.com/reference.json"
+    assert repository.get_test_by_name("with").reference_source == "https://example.com/reference.json"
+    assert by_name["without"].reference_source is None
+    assert repository.get_test_by_name("without").reference_source is None
+
+
+def test_rolled_back_transaction_leaves_file_untouched(tmp_path):
+    repository = make_repository(tmp_path)
+    repository.save_test(Test("kept", "before"))
+    before = repository.test_file.read_bytes()
+    stat = repository.test_file.stat()
+
+    with pytest.raises(RuntimeError):
+        with repository.transaction():
+            test = repository.get_test_by_name("kept")
+            test.description = "after"
+            repository.update_test(test)
+            repository.save_test(Test("added"))
+            raise RuntimeError("abort")
+
+    assert repository.test_file.read_bytes() == before
+    assert repository.test_file.stat().st_mtime_ns == stat.st_mtime_ns
+    assert repository.list_test_names() == ["kept"]
+    assert repository.get_test_by_name("kept").description == "before"
+
+
+def test_rolled_back_transaction_leaves_shards_untouched(tmp_path):
+    repository = ShardedJsonRepository(tmp_path / "tests")
+    repository.save_test(Test("kept", "before"))
+    before = {path.name: path.read_bytes() for path in repository.shard_dir.iterdir()}
+
+    with pytest.raises(RuntimeError):
+        with repository.transaction():
+            repository.remove_test(repository.get_test_by_name("kept"))
+            repository.save_test(Test("added"))
+            raise RuntimeError("abort")
+
+    assert {path.name: path.read_bytes() for path in repository.shard_dir.iterdir()} == before
+
+
+def test_entries_read_in_a_transaction_are_detached(tmp_path):
+    repository = make_repository(tmp_path)
+    test = Test("kept")
+    test.reference = [TestReference("1", {"x": "1"})]
+    repository.save_test(test)
+
+    with repository.transaction():
+        for entry in repository.read_entries():
+            entry.pop("reference")
+        assert len(repository.read_entries()[0]["reference"]) == 1
+
+    assert len(repository.get_test_by_name("kept").reference) == 1
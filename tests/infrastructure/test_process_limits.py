@@ -0,0 +1,50 @@
+import signal
+import sys
+
+import pytest
+
+from domain.run_limits import RunLimits
+from infrastructure.io.async_simulation_runner import AsyncSimulationRunner
+from infrastructure.io import process_limits
+from infrastructure.io.process_limits import classify_failure
+
+posix_only = pytest.mark.skipif(sys.platform == "win32", reason="POSIX signals")
+LIMITS = RunLimits(timeout=10, memory_mb=500)
+
+
+def test_allocation_markers_are_oom():
+    assert classify_failure(1, "Traceback ...\nMemoryError", LIMITS) == "oom"
+
+
+@posix_only
+def test_fatal_signal_is_oom_only_near_the_cap():
+    assert classify_failure(-signal.SIGKILL, "", LIMITS, peak_mb=480) == "oom"
+    assert classify_failure(-signal.SIGSEGV, "", LIMITS, peak_mb=450) == "oom"
+    assert classify_failure(-signal.SIGSEGV, "", LIMITS, peak_mb=30) is None
+    assert classify_failure(-signal.SIGKILL, "", LIMITS) is None
+
+
+@posix_only
+def test_abort_is_a_script_failure():
+    assert classify_failure(-signal.SIGABRT, "", LIMITS, peak_mb=490) is None
+
+
+@posix_only
+def test_crash_under_memory_limit_raises(tmp_path):
+    script = tmp_path / "crashing.py"
+    script.write_text("import os\nos.abort()\n")
+    runner = AsyncSimulationRunner(limits=RunLimits(memory_mb=2048))
+    with pytest.raises(RuntimeError, match="exit code"):
+        runner.run(str(script), 1)
+
+
+@posix_only
+def test_cpu_backstop_scales_with_usable_cpus(monkeypatch):
+    calls = {}
+    monkeypatch.setattr(process_limits, "usable_cpus", lambda: 8)
+    monkeypatch.setattr(process_limits.resource, "setrlimit", lambda which, value: calls.__setitem__(which, value))
+
+    process_limits.spawn_kwargs(RunLimits(timeout=2.5))["preexec_fn"]()
+
+    # eight busy threads may spend 8 CPU seconds per wall-clock second before the deadline
+    assert calls[process_limits.resource.RLIMIT_CPU] == (21, 22)
@@ -0,0 +1,23 @@
+from itertools import islice
+
+from domain.simulation import Simulation
+from infrastructure.sampling.sampling_schedule import SamplingSchedule
+
+
+def test_ramps_up_to_max_interval():
+    schedule = SamplingSchedule(initial_interval=0.1, max_interval=1.0, growth=2.0, budget=10)
+    assert list(islice(schedule.intervals(), 6)) == [0.1, 0.2, 0.4, 0.8, 1.0, 1.0]
+
+
+def test_keeps_sampling_after_budget():
+    schedule = SamplingSchedule(initial_interval=0.1, max_interval=0.5, growth=2.0, budget=3)
+    intervals = list(islice(schedule.intervals(), 50))
+    assert len(intervals) == 50
+    assert intervals[2:] == [0.5] * 48
+
+
+def test_simulation_keeps_schedule():
+    schedule = SamplingSchedule(budget=20)
+    simulation = Simulation("sim", "script.py", sampling=schedule)
+    assert simulation.sampling is schedule
+    assert Simulation("sim", "script.py").sampling is None
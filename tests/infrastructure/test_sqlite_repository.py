@@ -0,0 +1,47 @@
+import json
+import sqlite3
+
+import pytest
+
+from application.app import App
+from domain.test import Test
+from infrastructure.persistence.sqlite_repository import SqliteRepository
+
+
+def test_closes_connection_on_exit(tmp_path):
+    with SqliteRepository(tmp_path / "tests.db") as repository:
+        repository.save_test(Test("t1"))
+    with pytest.raises(sqlite3.ProgrammingError):
+        repository.list_test_names()
+
+
+def test_app_helpers_roll_back_together(tmp_path):
+    db_file = tmp_path / "tests.db"
+    with App(SqliteRepository(db_file)) as app:
+        app.new_test("t1")
+        app.set_criterion("t1", "duration", "2")
+        with pytest.raises(AttributeError):
+            app.update_test_config("t1", criteria={"duration": "5", "unknown": "1"})
+
+    with SqliteRepository(db_file) as repository:
+        assert repository.get_test_by_name("t1").criteria.duration == 2.0
+
+
+def test_reference_is_fetched_outside_the_transaction(tmp_path, monkeypatch):
+    source = tmp_path / "reference.json"
+    source.write_text(json.dumps([{"result": str(i), "parameters": {"x": str(i)}} for i in range(5)]))
+    repository = SqliteRepository(tmp_path / "tests.db")
+    fetch = App._fetch_reference
+
+    def fetch_unlocked(*args):
+        assert repository._depth == 0, "fetched while holding the write lock"
+        return fetch(*args)
+
+    monkeypatch.setattr(App, "_fetch_reference", staticmethod(fetch_unlocked))
+    with App(repository) as app:
+        app.new_test("t1")
+        app.update_test_config("t1", reference_source=str(source), reference_data_points=3, criteria={"duration": "2"})
+        test = app.get_test_by_name("t1")
+        assert test.reference_source == str(source)
+        assert [ref.result for ref in test.reference] == ["0", "1", "2"]
+        assert test.criteria.duration == 2.0
@@ -0,0 +1,45 @@
+import sys
+
+import pytest
+
+from domain.simulation import Simulation
+from infrastructure.io import warm_python_worker
+
+ALLOCATING = """
+import json
+
+block = bytearray(150 * 1024 * 1024)
+for i in range(0, len(block), 4096):
+    block[i] = 1
+del block
+print(json.dumps({"result": "ok", "parameters": {}}))
+"""
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_every_run_reports_its_own_peak(tmp_path):
+    script = tmp_path / "allocating.py"
+    script.write_text(ALLOCATING)
+    simulation = Simulation("warm", str(script), mode="warm")
+
+    results = simulation.run_many(3)
+
+    # the worker is reused: later runs don't raise its lifetime high-water mark any more
+    for result in results:
+        assert result.status == "ok"
+        assert 140 <= result.stats.peak_memory < 200
+        assert 140 <= result.stats.max_memory < 200
+        assert result.stats.min_memory < 20
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_sampler_measures_without_kernel_peak(tmp_path, monkeypatch):
+    script = tmp_path / "allocating.py"
+    script.write_text(ALLOCATING.replace("del block", "import time; time.sleep(0.2); del block"))
+    monkeypatch.setattr(warm_python_worker, "reset_peak_rss", lambda: False)
+
+    response = warm_python_worker.run_once(str(script))
+
+    assert response["output"] == {"result": "ok", "parameters": {}}
+    assert 140 <= response["stats"]["max_memory"] < 200
+    assert response["stats"]["mean_memory"] > 0